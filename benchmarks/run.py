@@ -0,0 +1,339 @@
+"""
+Offline benchmark suite for the HGVS parser.
+
+Measures, over the checked-in corpus (one file per construct type in
+`benchmarks/corpus`):
+
+- cold start: import, grammar compilation, and first model in a new process;
+- warm latency: single description `to_model()` calls, per bucket;
+- throughput: descriptions per second when converting a whole bucket;
+- memory: bytes and allocated blocks retained per model, without and with
+  interning of the model strings, and with shared leaves;
+- extract: descriptions per second when extracting only the reference and
+  the coordinate system (see `projection`), versus full models;
+- scaling: latency versus the description length and the number of variants;
+- stages: time spent in each pipeline stage (see `instrumentation`).
+
+A seeded, synthetic "generated" bucket (see `generate`) can be added with -g.
+
+Results are written as JSON, e.g.:
+
+    python benchmarks/run.py -o results.json
+    python benchmarks/run.py --compare old.json -o new.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from importlib.metadata import version
+
+from mutalyzer_hgvs_parser import instrumentation
+from mutalyzer_hgvs_parser.cache import Interner
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.generate import Generator
+from mutalyzer_hgvs_parser.projection import extract
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+COLD_START = """
+import json, time
+start = time.perf_counter()
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.hgvs_parser import get_parser
+imported = time.perf_counter()
+get_parser()
+compiled = time.perf_counter()
+to_model({!r})
+done = time.perf_counter()
+print(json.dumps({{
+    "import": imported - start,
+    "compile": compiled - imported,
+    "first_model": done - compiled,
+    "total": done - start,
+}}))
+"""
+
+
+def read_corpus(path=CORPUS_PATH, buckets=None):
+    """
+    :returns: The descriptions per bucket (corpus file name).
+    :rtype: dict
+    """
+    corpus = {}
+    for file_name in sorted(os.listdir(path)):
+        bucket, extension = os.path.splitext(file_name)
+        if extension != ".txt" or (buckets and bucket not in buckets):
+            continue
+        with open(os.path.join(path, file_name)) as corpus_file:
+            corpus[bucket] = [line.strip() for line in corpus_file if line.strip()]
+    return corpus
+
+
+def generated_corpus(count, seed=0):
+    """
+    Synthetic descriptions, only the ones that can be converted to models.
+    """
+    descriptions = []
+    for description in Generator(seed=seed, check=True).generate_many(count):
+        try:
+            to_model(description)
+        except Exception:
+            continue
+        descriptions.append(description)
+    return descriptions
+
+
+def _summary(timings):
+    timings = sorted(timings)
+    return {
+        "count": len(timings),
+        "mean": statistics.fmean(timings),
+        "min": timings[0],
+        "p50": timings[int(0.5 * (len(timings) - 1))],
+        "p90": timings[int(0.9 * (len(timings) - 1))],
+        "p99": timings[int(0.99 * (len(timings) - 1))],
+        "max": timings[-1],
+    }
+
+
+def _timings(descriptions, repeat):
+    timings = []
+    for description in descriptions:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            to_model(description)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def cold_start(repeat):
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", COLD_START.format("NM_004006.1:c.[145C>T;147C>G]")],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        runs.append(json.loads(output))
+    return {key: _summary([run[key] for run in runs]) for key in runs[0]}
+
+
+def warm_latency(corpus, repeat):
+    return {
+        bucket: _summary(_timings(descriptions, repeat))
+        for bucket, descriptions in corpus.items()
+    }
+
+
+def throughput(corpus, repeat):
+    output = {}
+    for bucket, descriptions in corpus.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for description in descriptions:
+                to_model(description)
+        elapsed = time.perf_counter() - start
+        output[bucket] = {
+            "descriptions": len(descriptions) * repeat,
+            "seconds": elapsed,
+            "per_second": len(descriptions) * repeat / elapsed,
+        }
+    return output
+
+
+def projection(corpus, repeat, fields=("reference", "coordinate_system")):
+    output = {}
+    for bucket, descriptions in corpus.items():
+        seconds = {}
+        for name, convert in [
+            ("model", to_model),
+            ("extract", lambda description: extract(description, fields)),
+        ]:
+            start = time.perf_counter()
+            for _ in range(repeat):
+                for description in descriptions:
+                    convert(description)
+            seconds[name] = time.perf_counter() - start
+        output[bucket] = {
+            "descriptions": len(descriptions) * repeat,
+            "per_second_model": len(descriptions) * repeat / seconds["model"],
+            "per_second_extract": len(descriptions) * repeat / seconds["extract"],
+            "speedup": seconds["model"] / seconds["extract"],
+        }
+    return output
+
+
+def _allocated(build):
+    """
+    Bytes and blocks allocated, and still alive, by `build()`. The garbage
+    (e.g., of the parser) is collected before the snapshots, such that only
+    the memory retained by the output is counted.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = build()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    differences = after.compare_to(before, "filename")
+    del kept
+    return (
+        sum(d.size_diff for d in differences),
+        sum(d.count_diff for d in differences),
+    )
+
+
+def memory(corpus, repeat=3):
+    """
+    Memory retained per model, without and with (a batch scoped) interning
+    of the model strings, and with interning and shared leaves, for batches
+    with each description `repeat` times, i.e., with recurring references
+    and sequences.
+    """
+    output = {}
+    for bucket, descriptions in corpus.items():
+        for description in descriptions:
+            to_model(description)
+            to_model(description, shared_leaves=True)
+        descriptions = descriptions * repeat
+        size, count = _allocated(lambda: [to_model(d) for d in descriptions])
+        interned_size, interned_count = _allocated(
+            lambda interner=Interner(): (
+                interner,
+                [to_model(d, interner=interner) for d in descriptions],
+            )
+        )
+        shared_size, shared_count = _allocated(
+            lambda interner=Interner(): (
+                interner,
+                [
+                    to_model(d, interner=interner, shared_leaves=True)
+                    for d in descriptions
+                ],
+            )
+        )
+        output[bucket] = {
+            "models": len(descriptions),
+            "bytes_per_model": size / len(descriptions),
+            "blocks_per_model": count / len(descriptions),
+            "bytes_per_model_interned": interned_size / len(descriptions),
+            "blocks_per_model_interned": interned_count / len(descriptions),
+            "bytes_per_model_shared": shared_size / len(descriptions),
+            "blocks_per_model_shared": shared_count / len(descriptions),
+        }
+    return output
+
+
+def scaling(repeat):
+    variants = {}
+    for count in [1, 2, 4, 8, 16, 32]:
+        description = "NM_004006.2:c.[{}]".format(
+            ";".join("{}del".format(10 * (i + 1)) for i in range(count))
+        )
+        variants[count] = _summary(_timings([description], repeat))
+    length = {}
+    for count in [1, 10, 100, 1000]:
+        description = "NM_004006.2:c.10_11ins{}".format("ACGT" * count)
+        length[len(description)] = _summary(_timings([description], repeat))
+    return {"variants": variants, "length": length}
+
+
+def stages(corpus):
+    with instrumentation.recording() as recorder:
+        for descriptions in corpus.values():
+            for description in descriptions:
+                to_model(description)
+    return recorder.summary()
+
+
+def metadata():
+    return {
+        "package": version("mutalyzer_hgvs_parser"),
+        "lark": version("lark"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def run(corpus, repeat, cold_repeat):
+    # Compile the grammar once, before any warm measurement.
+    to_model(corpus[list(corpus)[0]][0])
+    return {
+        "metadata": metadata(),
+        "corpus": {bucket: len(corpus[bucket]) for bucket in corpus},
+        "cold_start": cold_start(cold_repeat),
+        "latency": warm_latency(corpus, repeat),
+        "throughput": throughput(corpus, repeat),
+        "memory": memory(corpus),
+        "extract": projection(corpus, repeat),
+        "scaling": scaling(repeat),
+        "stages": stages(corpus),
+    }
+
+
+def compare(base, results):
+    """
+    Print the throughput and latency ratios between two results.
+    """
+    print("{:<12}{:>14}{:>14}".format("bucket", "throughput", "latency p50"))
+    for bucket in results["throughput"]:
+        if bucket not in base["throughput"]:
+            continue
+        print(
+            "{:<12}{:>13.2f}x{:>13.2f}x".format(
+                bucket,
+                results["throughput"][bucket]["per_second"]
+                / base["throughput"][bucket]["per_second"],
+                base["latency"][bucket]["p50"] / results["latency"][bucket]["p50"],
+            )
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HGVS parser benchmarks.")
+    parser.add_argument("-o", help="output JSON file path (default: stdout)")
+    parser.add_argument("-b", nargs="+", help="only the provided corpus buckets")
+    parser.add_argument("-n", type=int, default=5, help="repetitions (default: 5)")
+    parser.add_argument(
+        "--cold", type=int, default=3, help="cold start repetitions (default: 3)"
+    )
+    parser.add_argument(
+        "-g", type=int, default=0, help="number of generated descriptions to add"
+    )
+    parser.add_argument("--compare", help="previous results JSON file to compare with")
+    args = parser.parse_args()
+
+    corpus = read_corpus(buckets=args.b)
+    if args.b:
+        unknown = sorted(set(args.b) - set(corpus))
+        if unknown:
+            parser.error("unknown corpus bucket(s): {}".format(", ".join(unknown)))
+    if args.g:
+        corpus["generated"] = generated_corpus(args.g)
+
+    results = run(corpus, args.n, args.cold)
+
+    if args.o:
+        with open(args.o, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare) as base_file:
+            compare(json.load(base_file), results)
+
+
+if __name__ == "__main__":
+    main()
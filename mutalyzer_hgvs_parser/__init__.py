@@ -1,7 +1,8 @@
 from importlib.metadata import metadata
 
 from .convert import to_model
-from .hgvs_parser import parse
+from .hgvs_parser import is_valid, parse, validate_many
+from .projection import extract
 
 
 def _get_metadata(name):
@@ -0,0 +1,266 @@
+"""
+Module for converting batches of descriptions, e.g., from a file.
+"""
+
+import functools
+
+from .cache import Interner, LRUCache
+from .columns import VariantColumns, location_fields, variants
+from .convert import LazyModel, to_model
+from .projection import prefix_fields
+
+
+class Filter:
+    """
+    Declarative descriptions filter for the batch conversion. The criteria
+    are checked as early as possible: the reference and the coordinate
+    system on the description prefix (see `projection`), and the rest on a
+    lazy model, before the variants are converted, one at a time. A
+    description is selected when it matches the reference and coordinate
+    system criteria, and at least one of its variants matches the type,
+    position, and predicted criteria.
+    """
+
+    def __init__(
+        self,
+        coordinate_systems=None,
+        types=None,
+        reference_prefix=None,
+        positions=None,
+        predicted=None,
+    ):
+        """
+        :arg iterable coordinate_systems: Coordinate systems, e.g., ["c"].
+        :arg iterable types: Variant types, e.g., ["deletion"].
+        :arg str reference_prefix: Reference ID prefix, e.g., "NM_".
+        :arg tuple positions: Minimum and maximum position (inclusive) of
+            the variant locations, as in the models, i.e., the offsets and
+            the outside CDS prefixes are not considered.
+        :arg bool predicted: Only predicted (True) or certain (False)
+            variants.
+        """
+        self.coordinate_systems = (
+            None if coordinate_systems is None else set(coordinate_systems)
+        )
+        self.types = None if types is None else set(types)
+        self.reference_prefix = reference_prefix
+        self.positions = positions
+        self.predicted = predicted
+        # Rejected descriptions, per stage.
+        self.rejected = {"prefix": 0, "description": 0, "variants": 0}
+
+    def _match_description(self, reference_id, coordinate_system):
+        if self.reference_prefix is not None and not (
+            reference_id or ""
+        ).startswith(self.reference_prefix):
+            return False
+        if (
+            self.coordinate_systems is not None
+            and coordinate_system not in self.coordinate_systems
+        ):
+            return False
+        return True
+
+    def _match_variant(self, variant, predicted):
+        if self.types is not None and variant.get("type") not in self.types:
+            return False
+        if self.predicted is not None and predicted != self.predicted:
+            return False
+        if self.positions is not None:
+            start, _, end, _, _ = location_fields(variant.get("location"))
+            if start is None or end is None:
+                return False
+            if start < self.positions[0] or end > self.positions[1]:
+                return False
+        return True
+
+    def match_prefix(self, description):
+        """
+        :returns: False if the description prefix is rejected, True if
+            it matches, or if it cannot be checked on the prefix.
+        :rtype: bool
+        """
+        if self.reference_prefix is None and self.coordinate_systems is None:
+            return True
+        fields = prefix_fields(description, ["reference", "coordinate_system"])
+        if fields is None or self._match_description(
+            fields["reference"]["id"], fields.get("coordinate_system")
+        ):
+            return True
+        self.rejected["prefix"] += 1
+        return False
+
+    def match(self, model):
+        """
+        :arg model: Description model, preferably a `convert.LazyModel`.
+        :returns: True if the description is selected.
+        :rtype: bool
+        """
+        if not self._match_description(
+            model.get("reference", {}).get("id"), model.get("coordinate_system")
+        ):
+            self.rejected["description"] += 1
+            return False
+        if self.types is None and self.positions is None and self.predicted is None:
+            return True
+        for variant, predicted in variants(model):
+            if self._match_variant(variant, predicted):
+                return True
+        self.rejected["variants"] += 1
+        return False
+
+
+# Default number of (most recent) unique descriptions to deduplicate.
+DEDUPLICATION_WINDOW = 4096
+
+_MISSING = object()
+
+
+class Deduplicator:
+    """
+    Deduplicates the descriptions of a batch, such that each unique
+    description within a window of the most recent unique descriptions is
+    converted only once, and its result is fanned out to all the positions
+    that have it, in order.
+
+    The descriptions are deduplicated on their exact strings, since white
+    spaces inside a description may separate tokens, e.g., "R1:c.10 0del"
+    is not "R1:c.100del". With `ignore_white_spaces`, as for the parser,
+    only the leading and trailing white spaces are ignored, except for the
+    results that refer to the description itself (see `map()`), e.g.,
+    errors positions.
+    """
+
+    def __init__(self, window=DEDUPLICATION_WINDOW, ignore_white_spaces=True):
+        """
+        :arg int window: Number of the most recent unique descriptions.
+        :arg bool ignore_white_spaces: Ignore the leading and trailing white
+            spaces.
+        """
+        self.ignore_white_spaces = ignore_white_spaces
+        # Number of deduplicated descriptions.
+        self.deduplicated = 0
+        self._results = LRUCache(window)
+
+    def key(self, description):
+        if self.ignore_white_spaces:
+            return description.strip()
+        return description
+
+    def map(self, function, descriptions, exact=None):
+        """
+        :arg callable function: Conversion of a description.
+        :arg iterable descriptions: HGVS descriptions.
+        :arg callable exact: Predicate for the results that are only fanned
+            out to identical descriptions.
+        :returns: For each description, in order, the description and its
+            result (the same object for all its positions).
+        :rtype: generator
+        """
+        for description in descriptions:
+            key = self.key(description)
+            result = self._results.get(key, _MISSING)
+            if result is _MISSING and exact is not None:
+                result = self._results.get((description,), _MISSING)
+            if result is _MISSING:
+                result = function(description)
+                if exact is not None and exact(result):
+                    self._results.put((description,), result)
+                else:
+                    self._results.put(key, result)
+            else:
+                self.deduplicated += 1
+            yield description, result
+
+
+def _convert(description, start_rule, interner, filters):
+    """
+    :returns: The model and the error, or None if the description is
+        rejected.
+    :rtype: tuple
+    """
+    if filters is not None and not filters.match_prefix(description):
+        return None
+    try:
+        if filters is None:
+            model = to_model(description, start_rule, interner)
+        else:
+            model = to_model(description, start_rule, interner, lazy=True)
+            if not filters.match(model):
+                return None
+            if isinstance(model, LazyModel):
+                model = model.to_dict()
+    except Exception as e:
+        return None, e
+    return model, None
+
+
+def _is_error(result):
+    return result is not None and result[1] is not None
+
+
+def _converted(descriptions, start_rule, interner, filters, deduplicator):
+    convert = functools.partial(
+        _convert,
+        start_rule=start_rule,
+        interner=Interner() if interner is None else interner,
+        filters=filters,
+    )
+    if deduplicator is None:
+        return ((description, convert(description)) for description in descriptions)
+    return deduplicator.map(convert, descriptions, _is_error)
+
+
+def convert_many(
+    descriptions, start_rule=None, interner=None, filters=None, deduplicator=None
+):
+    """
+    Convert descriptions to models. Errors do not stop the conversion.
+
+    :arg iterable descriptions: HGVS descriptions.
+    :arg str start_rule: Alternative start rule.
+    :arg cache.Interner interner: Interning table for the model strings,
+        by default a new one for the batch.
+    :arg Filter filters: Only the selected descriptions are yielded (and
+        the ones for which an error is raised before they are rejected).
+        With `deduplicator`, the rejected counts are of unique descriptions.
+    :arg Deduplicator deduplicator: Convert the duplicated descriptions
+        once, in which case their models are the same objects.
+    :returns: For each description, in order, the description, its model
+        (None if it failed) and the error (None if it succeeded).
+    :rtype: generator
+    """
+    for description, result in _converted(
+        descriptions, start_rule, interner, filters, deduplicator
+    ):
+        if result is not None:
+            yield (description,) + result
+
+
+def to_columns(descriptions, filters=None, deduplicator=None):
+    """
+    Convert descriptions into a columnar table, with one row per variant.
+
+    :arg iterable descriptions: HGVS descriptions.
+    :arg Filter filters: Only add the selected descriptions.
+    :arg Deduplicator deduplicator: Convert the duplicated descriptions
+        once.
+    :returns: The table, with the `index` column referring to the
+        descriptions order, and the errors (including the values that do
+        not fit in their columns) in its `errors` attribute.
+    :rtype: columns.VariantColumns
+    """
+    table = VariantColumns()
+    results = _converted(descriptions, None, None, filters, deduplicator)
+    for index, (description, result) in enumerate(results):
+        if result is None:
+            continue
+        model, error = result
+        if error is None:
+            try:
+                table.add(index, model)
+            except OverflowError as e:
+                table.add_error(index, description, e)
+        else:
+            table.add_error(index, description, error)
+    return table
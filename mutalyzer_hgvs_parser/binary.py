@@ -0,0 +1,279 @@
+"""
+Module for a compact, versioned, binary encoding of the (`convert`) models,
+e.g., to move them between processes or to store them in a persistent cache.
+
+An encoded model starts with the `MAGIC` bytes and the `VERSION`, followed
+by the (type code prefixed) root value:
+
+- integers are zigzag varints and floats are 8 byte IEEE 754 doubles;
+- strings are varint length prefixed UTF-8. Each new string in a model is
+  numbered, such that repeated strings, e.g., reference IDs, are written
+  only once and referenced afterwards by their number;
+- the frequent string values (`VALUES`) have their own codes;
+- lists and dictionaries are varint count prefixed. The dictionary keys are
+  (varint) codes for the model keys (`KEYS`), or (code 0) strings otherwise.
+
+The `KEYS` and `VALUES` tables can only be extended (at their end) within
+the same version.
+"""
+
+import struct
+
+from .exceptions import DecodeError
+
+MAGIC = b"HM"
+
+VERSION = 1
+
+NONE = 0
+FALSE = 1
+TRUE = 2
+INT = 3
+FLOAT = 4
+STRING = 5
+STRING_REFERENCE = 6
+LIST = 7
+DICT = 8
+VALUE = 9
+
+KEYS = [
+    "type",
+    "source",
+    "location",
+    "position",
+    "sequence",
+    "inserted",
+    "deleted",
+    "repeat_number",
+    "uncertain",
+    "start",
+    "end",
+    "coordinate_system",
+    "value",
+    "reference",
+    "variants",
+    "id",
+    "offset",
+    "outside_cds",
+    "length",
+    "inverted",
+    "selector",
+    "predicted",
+    "amino_acid",
+    "downstream",
+    "upstream",
+]
+
+VALUES = [
+    "point",
+    "range",
+    "reference",
+    "description",
+    "description_dna",
+    "description_protein",
+    "substitution",
+    "deletion",
+    "deletion_insertion",
+    "insertion",
+    "duplication",
+    "inversion",
+    "conversion",
+    "repeat",
+    "equal",
+    "extension",
+    "frame_shift",
+    "upstream",
+    "downstream",
+    "c",
+    "g",
+    "m",
+    "n",
+    "o",
+    "p",
+    "r",
+    "A",
+    "C",
+    "G",
+    "T",
+]
+
+_KEY_CODES = {key: code for code, key in enumerate(KEYS, 1)}
+
+_VALUE_CODES = {value: code for code, value in enumerate(VALUES)}
+
+_DOUBLE = struct.Struct("<d")
+
+
+def _write_varint(output, value):
+    while value > 0x7F:
+        output.append((value & 0x7F) | 0x80)
+        value >>= 7
+    output.append(value)
+
+
+def _write_string(output, value, strings):
+    if value in strings:
+        output.append(STRING_REFERENCE)
+        _write_varint(output, strings[value])
+    else:
+        strings[value] = len(strings)
+        encoded = value.encode()
+        output.append(STRING)
+        _write_varint(output, len(encoded))
+        output += encoded
+
+
+def _write(output, value, strings):
+    if isinstance(value, str):
+        code = _VALUE_CODES.get(value)
+        if code is None:
+            _write_string(output, value, strings)
+        else:
+            output.append(VALUE)
+            _write_varint(output, code)
+    elif isinstance(value, dict):
+        output.append(DICT)
+        _write_varint(output, len(value))
+        for key, item in value.items():
+            code = _KEY_CODES.get(key)
+            if code is None:
+                if not isinstance(key, str):
+                    raise TypeError("Unsupported key type: {}".format(type(key)))
+                output.append(0)
+                _write_string(output, key, strings)
+            else:
+                _write_varint(output, code)
+            _write(output, item, strings)
+    elif isinstance(value, list):
+        output.append(LIST)
+        _write_varint(output, len(value))
+        for item in value:
+            _write(output, item, strings)
+    elif value is True:
+        output.append(TRUE)
+    elif value is False:
+        output.append(FALSE)
+    elif value is None:
+        output.append(NONE)
+    elif isinstance(value, int):
+        output.append(INT)
+        _write_varint(output, value << 1 if value >= 0 else (-value << 1) - 1)
+    elif isinstance(value, float):
+        output.append(FLOAT)
+        output += _DOUBLE.pack(value)
+    else:
+        raise TypeError("Unsupported type: {}".format(type(value)))
+
+
+def dumps(model):
+    """
+    Encode a model.
+
+    :arg model: Model (dict, list, str, ...).
+    :returns: Encoded model.
+    :rtype: bytes
+    """
+    output = bytearray(MAGIC)
+    output.append(VERSION)
+    _write(output, model, {})
+    return bytes(output)
+
+
+def _read_varint(data, position):
+    byte = data[position]
+    if byte < 0x80:
+        return byte, position + 1
+    value = 0
+    shift = 0
+    while byte >= 0x80:
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        position += 1
+        byte = data[position]
+    return value | (byte << shift), position + 1
+
+
+def _read_string(data, position, code, strings):
+    if code == STRING_REFERENCE:
+        index, position = _read_varint(data, position)
+        return strings[index], position
+    if code != STRING:
+        raise DecodeError("String expected, found type code {}.".format(code))
+    length, position = _read_varint(data, position)
+    end = position + length
+    if end > len(data):
+        raise IndexError(end)
+    value = data[position:end].decode()
+    strings.append(value)
+    return value, end
+
+
+def _read(data, position, strings):
+    """
+    :returns: The value at `position` and the position after it.
+    """
+    code = data[position]
+    position += 1
+    if code == DICT:
+        count, position = _read_varint(data, position)
+        output = {}
+        for _ in range(count):
+            key_code = data[position]
+            if 0 < key_code < 0x80:
+                key = KEYS[key_code - 1]
+                position += 1
+            elif key_code:
+                key_code, position = _read_varint(data, position)
+                key = KEYS[key_code - 1]
+            else:
+                key, position = _read_string(
+                    data, position + 2, data[position + 1], strings
+                )
+            output[key], position = _read(data, position, strings)
+        return output, position
+    if code == VALUE:
+        index, position = _read_varint(data, position)
+        return VALUES[index], position
+    if code == LIST:
+        count, position = _read_varint(data, position)
+        output = []
+        for _ in range(count):
+            value, position = _read(data, position, strings)
+            output.append(value)
+        return output, position
+    if code == INT:
+        value, position = _read_varint(data, position)
+        return (value >> 1 if not value & 1 else -((value + 1) >> 1)), position
+    if code == STRING or code == STRING_REFERENCE:
+        return _read_string(data, position, code, strings)
+    if code == TRUE:
+        return True, position
+    if code == FALSE:
+        return False, position
+    if code == NONE:
+        return None, position
+    if code == FLOAT:
+        return _DOUBLE.unpack_from(data, position)[0], position + _DOUBLE.size
+    raise DecodeError("Unknown type code {}.".format(code))
+
+
+def loads(data):
+    """
+    Decode a model.
+
+    :arg bytes data: Encoded model.
+    :returns: Model.
+    :raises DecodeError: If the data is not an encoded model, or if it was
+        encoded with an unsupported version.
+    """
+    if data[: len(MAGIC)] != MAGIC:
+        raise DecodeError("Not an encoded model.")
+    if len(data) <= len(MAGIC) or data[len(MAGIC)] != VERSION:
+        raise DecodeError("Unsupported encoding version.")
+    try:
+        model, position = _read(data, len(MAGIC) + 1, [])
+    except (IndexError, UnicodeDecodeError, struct.error) as e:
+        raise DecodeError("Truncated or corrupted data.") from e
+    if position != len(data):
+        raise DecodeError("Trailing data.")
+    return model
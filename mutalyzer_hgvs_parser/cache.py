@@ -0,0 +1,108 @@
+"""
+Module with the (bounded) caches used for the conversion outputs and
+errors, and the interning table for the model strings.
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Least recently used cache, with hit/miss counters.
+    """
+
+    def __init__(self, maxsize=65536):
+        """
+        :arg int maxsize: Maximum number of entries (0 disables the cache).
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key, default=None):
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def items(self):
+        """
+        :returns: The entries, from the least to the most recently used.
+        :rtype: list
+        """
+        return list(self._entries.items())
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class Interner:
+    """
+    Bounded interning table, such that equal strings, e.g., the same
+    reference ID in many models, share one object. Once full, new strings
+    are no longer added. Note that strings cannot be weakly referenced, so
+    the table keeps them alive until it is released, e.g., after a batch.
+    """
+
+    def __init__(self, maxsize=65536, max_length=64):
+        """
+        :arg int maxsize: Maximum number of strings in the table.
+        :arg int max_length: Longer strings are not interned (e.g., long
+            inserted sequences are unlikely to be repeated).
+        """
+        self.maxsize = maxsize
+        self.max_length = max_length
+        self._table = {}
+
+    def __call__(self, value):
+        interned = self._table.get(value)
+        if interned is not None:
+            return interned
+        if len(value) <= self.max_length and len(self._table) < self.maxsize:
+            self._table[value] = value
+        return value
+
+    def __len__(self):
+        return len(self._table)
+
+
+class ErrorCache(LRUCache):
+    """
+    Negative cache, i.e., least recently used cache for the (serialized)
+    errors of invalid inputs, bounded separately from the results cache.
+    """
+
+    def __init__(self, maxsize=16384):
+        """
+        :arg int maxsize: Maximum number of entries (0 disables the cache).
+        """
+        super().__init__(maxsize)
@@ -0,0 +1,191 @@
+"""
+Module for converting large description files with periodic checkpoints,
+such that an interrupted conversion, e.g., on a preempted node, can be
+resumed, with the output of every input line written exactly once.
+
+The input file is converted range by range (see `parallel`). After the
+output of a range is written, and synced, to the output file, a checkpoint
+is saved with the input and output byte offsets, and the summary counts. On
+resume, the output is truncated to the checkpoint output offset, i.e., the
+output of the ranges after the checkpoint is discarded, and the conversion
+continues from the checkpoint input offset. A conversion is only resumed
+with the same conversion function and options, e.g., output format.
+"""
+
+import functools
+import json
+import multiprocessing
+import os
+from io import BytesIO
+
+from . import parallel
+
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_path(output_path):
+    """
+    :returns: The default checkpoint file path of an output file.
+    :rtype: str
+    """
+    return "{}.checkpoint".format(output_path)
+
+
+def read_checkpoint(file_path):
+    """
+    :arg str file_path: Checkpoint file path.
+    :returns: The checkpoint, or None if there is none.
+    :rtype: dict
+    """
+    if not os.path.exists(file_path):
+        return None
+    with open(file_path) as checkpoint_file:
+        return json.load(checkpoint_file)
+
+
+def write_checkpoint(file_path, checkpoint):
+    """
+    Save a checkpoint. The file is replaced atomically.
+
+    :arg str file_path: Checkpoint file path.
+    :arg dict checkpoint: Checkpoint.
+    """
+    temporary_path = "{}.tmp".format(file_path)
+    with open(temporary_path, "w") as checkpoint_file:
+        json.dump(checkpoint, checkpoint_file)
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+    os.replace(temporary_path, file_path)
+
+
+def _converter_options(convert):
+    """
+    :returns: The conversion function name and options (JSON compatible).
+    :rtype: dict
+    """
+    options = {}
+    while isinstance(convert, functools.partial):
+        options = dict(convert.keywords, **options)
+        convert = convert.func
+    return json.loads(
+        json.dumps(
+            {
+                "function": "{}.{}".format(convert.__module__, convert.__qualname__),
+                "options": options,
+            },
+            sort_keys=True,
+            default=repr,
+        )
+    )
+
+
+def _new_checkpoint(file_path, convert):
+    return {
+        "checkpoint_version": CHECKPOINT_VERSION,
+        "input": os.path.abspath(file_path),
+        "input_size": os.path.getsize(file_path),
+        "converter": _converter_options(convert),
+        "input_offset": 0,
+        "output_offset": 0,
+        "counts": {},
+    }
+
+
+def _check(checkpoint, file_path, output_path, convert):
+    if checkpoint.get("checkpoint_version") != CHECKPOINT_VERSION:
+        raise ValueError("Unsupported checkpoint version.")
+    if checkpoint["input"] != os.path.abspath(file_path) or checkpoint[
+        "input_size"
+    ] != os.path.getsize(file_path):
+        raise ValueError("The checkpoint was created for another input file.")
+    if checkpoint.get("converter") != _converter_options(convert):
+        raise ValueError(
+            "The checkpoint was created with other conversion options: {}.".format(
+                checkpoint["converter"]
+            )
+        )
+    if (
+        not os.path.exists(output_path)
+        or os.path.getsize(output_path) < checkpoint["output_offset"]
+    ):
+        raise ValueError("The output file is shorter than at the checkpoint.")
+
+
+def _convert_range(arguments):
+    output = BytesIO()
+    counts = parallel._convert_range(*arguments, output)
+    return output.getvalue(), counts or {}
+
+
+def _converted_ranges(tasks, processes):
+    if processes > 1:
+        with multiprocessing.Pool(processes) as pool:
+            yield from pool.imap(_convert_range, tasks)
+    else:
+        yield from map(_convert_range, tasks)
+
+
+def convert_file(
+    file_path,
+    output_path,
+    processes=1,
+    start_rule=None,
+    chunk_size=parallel.CHUNK_SIZE,
+    convert=None,
+    resume=False,
+    checkpoint_file=None,
+):
+    """
+    Convert a descriptions file to an output file, with a checkpoint after
+    every range.
+
+    :arg str file_path: Path to the descriptions file.
+    :arg str output_path: Path to the output file.
+    :arg int processes: Number of worker processes.
+    :arg str start_rule: Alternative start rule.
+    :arg int chunk_size: Approximate range size, in bytes, i.e., the
+        checkpoints interval.
+    :arg callable convert: Ranges conversion (default:
+        `parallel.json_lines()`).
+    :arg bool resume: Continue from the checkpoint, if there is one, which
+        must have been created with the same `convert` function (and
+        options).
+    :arg str checkpoint_file: Checkpoint file path (default:
+        `checkpoint_path(output_path)`).
+    :returns: The summary counts, e.g., of the converted descriptions and
+        errors, including those before resuming.
+    :rtype: dict
+    """
+    convert = parallel._converter(convert, start_rule)
+    if checkpoint_file is None:
+        checkpoint_file = checkpoint_path(output_path)
+    checkpoint = read_checkpoint(checkpoint_file) if resume else None
+    if checkpoint is None:
+        checkpoint = _new_checkpoint(file_path, convert)
+        mode = "wb"
+    else:
+        _check(checkpoint, file_path, output_path, convert)
+        mode = "r+b"
+
+    with open(output_path, mode) as output:
+        output.truncate(checkpoint["output_offset"])
+        output.seek(checkpoint["output_offset"])
+        tasks = [
+            (file_path, start, end, convert)
+            for start, end in parallel.chunk_ranges(
+                file_path, chunk_size, checkpoint["input_offset"]
+            )
+        ]
+        for task, (rendered, counts) in zip(
+            tasks, _converted_ranges(tasks, processes)
+        ):
+            output.write(rendered)
+            output.flush()
+            os.fsync(output.fileno())
+            checkpoint["input_offset"] = task[2]
+            checkpoint["output_offset"] = output.tell()
+            for key, value in counts.items():
+                checkpoint["counts"][key] = checkpoint["counts"].get(key, 0) + value
+            write_checkpoint(checkpoint_file, checkpoint)
+    write_checkpoint(checkpoint_file, checkpoint)
+    return checkpoint["counts"]
@@ -3,13 +3,23 @@ CLI entry point.
 """
 
 import argparse
+import functools
 import json
+import sys
 
 from lark.tree import pydot__tree_to_png
 
 from . import usage, version
+from .checkpoint import checkpoint_path
+from .checkpoint import convert_file as convert_checkpointed_file
 from .convert import parse_tree_to_model
-from .hgvs_parser import parse, HgvsParser
+from .exceptions import NestedDescriptions, UnexpectedCharacter, UnexpectedEnd
+from .hgvs_parser import get_parser, parse, HgvsParser
+from .ingest import convert_file as convert_fields_file
+from .ingest import lines_converter
+from .output import JsonLinesWriter, TsvWriter, dumps
+from .parallel import convert_file, json_lines, tsv_lines
+from .profiling import profile
 
 
 def _parse(description, grammar_path, start_rule):
@@ -21,13 +31,23 @@ def _parse(description, grammar_path, start_rule):
     return parse_tree
 
 
-def _to_model(description, start_rule):
+def _validate(description, grammar_path, start_rule):
+    """
+    CLI wrapper for syntax checking only (no parse tree is built).
+    """
+    get_parser(grammar_path, start_rule).validate(description)
+    print("Valid syntax:\n {}".format(description))
+
+
+def _to_model(description, start_rule, compact=False):
     """
     CLI wrapper for parsing, converting, and printing the model.
     """
     parse_tree = parse(description, start_rule=start_rule)
     model = parse_tree_to_model(parse_tree)
-    if isinstance(model, dict) or isinstance(model, list):
+    if compact:
+        print(dumps(model).decode())
+    elif isinstance(model, dict) or isinstance(model, list):
         print(json.dumps(model, indent=2))
     else:
         print(model)
@@ -49,7 +69,13 @@ def _arg_parser():
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
-    parser.add_argument("description", help="the HGVS variant description to be parsed")
+    parser.add_argument(
+        "description", nargs="?", help="the HGVS variant description to be parsed"
+    )
+
+    parser.add_argument(
+        "-f", help="file with one description per line to be parsed (batch mode)"
+    )
 
     alt = parser.add_mutually_exclusive_group()
 
@@ -67,35 +93,292 @@ def _arg_parser():
         "-p", action="store_true", help="raw parse tree (no ambiguity solving)"
     )
 
+    alt.add_argument(
+        "-s",
+        action="store_true",
+        help="syntax check only (no parse tree is built, no ambiguity solving)",
+    )
+
     parser.add_argument(
         "-i", help="save the parse tree as a PNG image (pydot required!)"
     )
 
+    output_format = parser.add_mutually_exclusive_group()
+
+    output_format.add_argument(
+        "--compact",
+        action="store_true",
+        help="compact JSON output, one model (or error) per line (with -c)",
+    )
+
+    output_format.add_argument(
+        "--tsv",
+        action="store_true",
+        help="tab separated output, one row per variant (or error) (with -c)",
+    )
+
+    parser.add_argument(
+        "--column",
+        type=int,
+        help="index (0 based) of the descriptions column in batch mode (with -c), "
+        "the other columns are passed through",
+    )
+
+    parser.add_argument(
+        "--info",
+        metavar="KEY",
+        help="key of the descriptions in the VCF INFO column in batch mode (with -c)",
+    )
+
+    parser.add_argument(
+        "--delimiter",
+        default="\t",
+        help="columns delimiter (with --column or --info, default: tab)",
+    )
+
+    parser.add_argument(
+        "--header",
+        action="store_true",
+        help="the first line (after the ## lines) is a header "
+        "(with --column or --info)",
+    )
+
+    parser.add_argument(
+        "-j",
+        type=int,
+        default=1,
+        help="number of processes in batch mode (with -c and --compact, --tsv, "
+        "--column, or --info)",
+    )
+
+    parser.add_argument(
+        "--dedup",
+        metavar="WINDOW",
+        type=int,
+        help="convert the duplicated descriptions once, within a window of "
+        "WINDOW unique descriptions, in batch mode (with -c and --compact or --tsv)",
+    )
+
+    parser.add_argument(
+        "-o",
+        metavar="PATH",
+        help="output file in batch mode (with -c and --compact, --tsv, --column, "
+        "or --info), with checkpoints saved to PATH.checkpoint",
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue from the last checkpoint of the output file (with -o)",
+    )
+
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="save the cProfile statistics to PATH and collapsed stacks "
+        "(for flame graphs) to PATH.collapsed",
+    )
+
     parser.add_argument("-v", action="version", version=version(parser.prog))
 
     return parser
 
 
-def _cli(args):
-    if args.c:
-        parse_tree = _to_model(args.description, args.r)
+def _run(description, args):
+    if args.c and args.tsv:
+        parse_tree = None
+        TsvWriter(sys.stdout).write_description(description, args.r)
+    elif args.c:
+        parse_tree = _to_model(description, args.r, args.compact)
     elif args.p:
-        parse_tree = _parse_raw(args.description, args.g, args.r)
+        parse_tree = _parse_raw(description, args.g, args.r)
         print(parse_tree)
+    elif args.s:
+        parse_tree = None
+        _validate(description, args.g, args.r)
     else:
-        parse_tree = _parse(args.description, args.g, args.r)
+        parse_tree = _parse(description, args.g, args.r)
 
     if args.i and parse_tree:
         pydot__tree_to_png(parse_tree, args.i)
         print("Parse tree image saved to:\n {}".format(args.i))
 
 
+def _run_file(file_path, args):
+    """
+    Batch mode: the errors are reported and the processing continues.
+    """
+    if args.o:
+        return _run_file_checkpointed(file_path, args)
+    if args.c and (args.column is not None or args.info):
+        return _run_file_fields(file_path, args)
+    if args.c and args.compact:
+        return _run_file_compact(file_path, args)
+    if args.c and args.tsv:
+        return _run_file_tsv(file_path, args)
+    with open(file_path) as descriptions:
+        for line in descriptions:
+            description = line.strip()
+            if not description:
+                continue
+            try:
+                _run(description, args)
+            except (UnexpectedCharacter, UnexpectedEnd, NestedDescriptions) as e:
+                print("Error parsing:\n {}\n{}".format(description, e))
+            except Exception as e:
+                print("Error parsing:\n {}\n {}".format(description, e))
+
+
+def _run_file_compact(file_path, args):
+    """
+    Batch mode with compact JSON lines output, written directly to the
+    (binary) standard output.
+    """
+    if args.j > 1 or args.dedup:
+        return _run_file_lines(file_path, args)
+    sys.stdout.flush()
+    writer = JsonLinesWriter(sys.stdout.buffer)
+    with open(file_path) as descriptions:
+        for line in descriptions:
+            description = line.strip()
+            if description:
+                writer.write_description(description, args.r)
+    sys.stdout.buffer.flush()
+
+
+def _run_file_lines(file_path, args):
+    """
+    Batch mode with the file converted at once, e.g., deduplicated, or by
+    multiple processes.
+    """
+    sys.stdout.flush()
+    if args.j > 1:
+        for rendered in convert_file(
+            file_path, args.j, convert=_lines_converter(args)
+        ):
+            sys.stdout.buffer.write(rendered)
+    else:
+        with open(file_path, "rb") as lines:
+            _lines_converter(args)(lines, sys.stdout.buffer, True)
+    sys.stdout.buffer.flush()
+
+
+def _fields_options(args):
+    return {
+        "column": args.column,
+        "info_key": args.info,
+        "delimiter": args.delimiter,
+        "output_format": "tsv" if args.tsv else "json",
+        "header": args.header,
+        "start_rule": args.r,
+    }
+
+
+def _run_file_fields(file_path, args):
+    """
+    Batch mode with the descriptions in a column, or in the INFO column,
+    converted in place (or to variant columns with --tsv).
+    """
+    sys.stdout.flush()
+    convert_fields_file(
+        file_path, sys.stdout.buffer, processes=args.j, **_fields_options(args)
+    )
+    sys.stdout.buffer.flush()
+
+
+def _run_file_checkpointed(file_path, args):
+    """
+    Batch mode with the output written to a file, with checkpoints, such
+    that an interrupted run can be resumed.
+    """
+    try:
+        counts = convert_checkpointed_file(
+            file_path,
+            args.o,
+            processes=args.j,
+            convert=_lines_converter(args),
+            resume=args.resume,
+        )
+    except ValueError as e:
+        sys.exit("Cannot resume:\n {}".format(e))
+    print(
+        "Output saved to:\n {}\n ({})\nCheckpoint:\n {}".format(
+            args.o,
+            ", ".join("{} {}".format(value, key) for key, value in counts.items()),
+            checkpoint_path(args.o),
+        )
+    )
+
+
+def _lines_converter(args):
+    """
+    The `convert(lines, output, first)` function for `parallel` and
+    `checkpoint`.
+    """
+    if args.column is not None or args.info:
+        return lines_converter(**_fields_options(args))
+    return functools.partial(
+        tsv_lines if args.tsv else json_lines,
+        start_rule=args.r,
+        dedup_window=args.dedup,
+    )
+
+
+def _run_file_tsv(file_path, args):
+    """
+    Batch mode with tab separated output, streamed line by line.
+    """
+    if args.j > 1 or args.dedup:
+        return _run_file_lines(file_path, args)
+    writer = TsvWriter(sys.stdout)
+    with open(file_path) as descriptions:
+        for line in descriptions:
+            description = line.strip()
+            if description:
+                writer.write_description(description, args.r)
+
+
+def _cli(args):
+    if args.profile:
+        with profile(args.profile):
+            _cli_run(args)
+        print("Profile saved to:\n {}\n {}.collapsed".format(args.profile, args.profile))
+    else:
+        _cli_run(args)
+
+
+def _cli_run(args):
+    if args.f:
+        _run_file(args.f, args)
+    else:
+        _run(args.description, args)
+
+
 def main():
 
     parser = _arg_parser()
 
     args = parser.parse_args()
 
+    if (args.description is None) == (args.f is None):
+        parser.error("provide either a description or a file (-f)")
+    if args.o and not (
+        args.f
+        and args.c
+        and (args.compact or args.tsv or args.column is not None or args.info)
+    ):
+        parser.error("-o requires -f, -c, and --compact, --tsv, --column, or --info")
+    if args.resume and not args.o:
+        parser.error("--resume requires -o")
+    if args.dedup and not (
+        args.f
+        and args.c
+        and (args.compact or args.tsv)
+        and args.column is None
+        and not args.info
+    ):
+        parser.error("--dedup requires -f, -c, and --compact or --tsv")
+
     _cli(args)
 
 
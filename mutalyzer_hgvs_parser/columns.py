@@ -0,0 +1,279 @@
+"""
+Module for the columnar batch output: one row per variant, with the
+positions, offsets, and flags in typed arrays, and the references,
+coordinate systems, and variant types dictionary encoded.
+
+The columns are `array.array` objects, exposed as (copied) NumPy arrays
+when NumPy is installed.
+"""
+
+import csv
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Missing position (e.g., for "?" or for "pter"), or missing description
+# index.
+MISSING = -1
+
+# Location bound flags, for the start (shifted with `START`) and the end
+# (shifted with `END`).
+UNCERTAIN = 1
+OFFSET_UNCERTAIN = 2
+UPSTREAM = 4
+DOWNSTREAM = 8
+PTER = 16
+QTER = 32
+
+START = 0
+END = 6
+
+PREDICTED = 1 << 12
+
+TYPECODES = {
+    "index": "q",
+    "reference": "I",
+    "coordinate_system": "I",
+    "type": "I",
+    "start": "q",
+    "start_offset": "q",
+    "end": "q",
+    "end_offset": "q",
+    "flags": "H",
+}
+
+DICTIONARY_COLUMNS = ["reference", "coordinate_system", "type"]
+
+_LOCATION_COLUMNS = ["start", "start_offset", "end", "end_offset", "flags"]
+
+
+def point_fields(point):
+    """
+    :arg dict point: Point location model.
+    :returns: The position (None if missing), the offset (0 if missing),
+        and the flags (not shifted).
+    :rtype: tuple
+    """
+    flags = 0
+    position = point.get("position")
+    if position == "pter":
+        position = None
+        flags |= PTER
+    elif position == "qter":
+        position = None
+        flags |= QTER
+    if point.get("uncertain"):
+        flags |= UNCERTAIN
+    outside_cds = point.get("outside_cds")
+    if outside_cds == "upstream":
+        flags |= UPSTREAM
+    elif outside_cds == "downstream":
+        flags |= DOWNSTREAM
+    offset = point.get("offset")
+    if offset is None:
+        return position, 0, flags
+    if offset.get("uncertain"):
+        flags |= OFFSET_UNCERTAIN
+    return position, offset.get("value", 0), flags
+
+
+def _bound_fields(bound):
+    if bound.get("type") == "point":
+        return point_fields(bound)
+    # Uncertain range bound, e.g., "(10_20)_30".
+    return None, 0, UNCERTAIN
+
+
+def location_fields(location):
+    """
+    :arg dict location: Location model (point or range), or None.
+    :returns: The start and end positions and offsets, and the flags.
+    :rtype: tuple
+    """
+    if location is None:
+        return None, 0, None, 0, 0
+    if location.get("type") == "range":
+        start, start_offset, start_flags = _bound_fields(location["start"])
+        end, end_offset, end_flags = _bound_fields(location["end"])
+        if location.get("uncertain"):
+            start_flags |= UNCERTAIN
+            end_flags |= UNCERTAIN
+    else:
+        start, start_offset, start_flags = end, end_offset, end_flags = point_fields(
+            location
+        )
+    return (
+        start,
+        start_offset,
+        end,
+        end_offset,
+        (start_flags << START) | (end_flags << END),
+    )
+
+
+def variants(model):
+    """
+    :arg dict model: Description model.
+    :returns: For each variant, the variant model and if it is predicted.
+    :rtype: generator
+    """
+    predicted = bool(model.get("predicted"))
+    for variant in model.get("variants", []):
+        yield variant, predicted or bool(variant.get("predicted"))
+
+
+def row_variants(model):
+    """
+    Like `variants()`, but with an empty variant for a description without
+    variants (e.g., "R1:c.="), such that every description has a row.
+
+    :arg dict model: Description model.
+    :returns: For each row, the variant model and if it is predicted.
+    :rtype: list
+    """
+    return list(variants(model)) or [({}, bool(model.get("predicted")))]
+
+
+class _Dictionary:
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class VariantColumns:
+    """
+    Columnar table, with one row per variant (and one row, without a
+    variant type or location, for a description without variants).
+    """
+
+    def __init__(self):
+        self._arrays = {name: array(code) for name, code in TYPECODES.items()}
+        self._dictionaries = {name: _Dictionary() for name in DICTIONARY_COLUMNS}
+        self.errors = []
+
+    def add(self, index, model):
+        """
+        Add the variants of a description model.
+
+        :arg int index: Description index (e.g., line number) in the batch.
+        :arg dict model: Description model.
+        :raises OverflowError: If a value does not fit in its column, in
+            which case nothing is added.
+        """
+        rows = []
+        model_variants = row_variants(model)
+        for variant, predicted in model_variants:
+            start, start_offset, end, end_offset, flags = location_fields(
+                variant.get("location")
+            )
+            rows.append(
+                (
+                    MISSING if start is None else start,
+                    start_offset,
+                    MISSING if end is None else end,
+                    end_offset,
+                    flags | PREDICTED if predicted else flags,
+                )
+            )
+        # The whole description is range checked before anything is added,
+        # such that all the columns keep the same length.
+        values = {
+            name: array(TYPECODES[name], column)
+            for name, column in zip(_LOCATION_COLUMNS, zip(*rows))
+        }
+        values["index"] = array(TYPECODES["index"], [index] * len(rows))
+
+        dictionaries = self._dictionaries
+        reference = dictionaries["reference"].code(model["reference"]["id"])
+        coordinate_system = dictionaries["coordinate_system"].code(
+            model.get("coordinate_system", "")
+        )
+        values["reference"] = [reference] * len(rows)
+        values["coordinate_system"] = [coordinate_system] * len(rows)
+        values["type"] = [
+            dictionaries["type"].code(variant.get("type", ""))
+            for variant, _ in model_variants
+        ]
+        for name, column in values.items():
+            self._arrays[name].extend(column)
+
+    def add_error(self, index, description, error):
+        self.errors.append((index, description, error))
+
+    def __len__(self):
+        return len(self._arrays["index"])
+
+    def columns(self):
+        """
+        :returns: Copies of the columns, as NumPy arrays if NumPy is
+            installed, or as `array.array` objects otherwise, such that rows
+            can still be added. The dictionary encoded columns contain codes,
+            see `dictionaries()`.
+        :rtype: dict
+        """
+        if numpy is None:
+            return {name: values[:] for name, values in self._arrays.items()}
+        return {
+            name: numpy.frombuffer(values, dtype=values.typecode).copy()
+            for name, values in self._arrays.items()
+        }
+
+    def dictionaries(self):
+        """
+        :returns: The values for the dictionary encoded columns, indexed
+            by their codes.
+        :rtype: dict
+        """
+        return {
+            name: list(dictionary.values)
+            for name, dictionary in self._dictionaries.items()
+        }
+
+    def rows(self):
+        """
+        :returns: The rows, with the dictionary encoded columns decoded.
+        :rtype: generator
+        """
+        names = list(TYPECODES)
+        columns = [self._arrays[name] for name in names]
+        decoders = [
+            self._dictionaries[name].values if name in self._dictionaries else None
+            for name in names
+        ]
+        for row in zip(*columns):
+            yield tuple(
+                value if decoder is None else decoder[value]
+                for value, decoder in zip(row, decoders)
+            )
+
+    def to_csv(self, output):
+        """
+        :arg output: Text file like object.
+        """
+        writer = csv.writer(output)
+        writer.writerow(list(TYPECODES))
+        writer.writerows(self.rows())
+
+    def to_npz(self, file_path):
+        """
+        Save the columns, and the dictionaries (as `<name>_values`) with
+        `numpy.savez`.
+
+        :arg str file_path: Output file path.
+        """
+        if numpy is None:
+            raise ImportError("NumPy is required for the NPZ output.")
+        arrays = self.columns()
+        for name, values in self.dictionaries().items():
+            arrays[name + "_values"] = numpy.array(values, dtype=str)
+        numpy.savez(file_path, **arrays)
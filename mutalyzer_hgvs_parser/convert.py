@@ -3,15 +3,20 @@ Module for converting HGVS descriptions and lark parse trees
 to their equivalent dictionary models.
 """
 
-from lark import Token, Transformer
+from collections.abc import Mapping, Sequence
+
+from lark import Token, Transformer, Tree
 from lark.exceptions import VisitError
 
+from . import instrumentation
 from .exceptions import NestedDescriptions
 from .hgvs_parser import parse
 from .util import get_only_value, to_dict
 
 
-def to_model(description, start_rule=None):
+def to_model(
+    description, start_rule=None, interner=None, shared_leaves=False, lazy=False
+):
     """
     Convert an  HGVS description, or parts of it, e.g., a location,
     a variants list, etc., if an appropriate alternative `start_rule`
@@ -19,30 +24,241 @@ def to_model(description, start_rule=None):
 
     :arg str description: HGVS description.
     :arg str start_rule: Alternative start rule.
+    :arg cache.Interner interner: Interning table for the model strings
+        (IDs, coordinate systems, sequences, and amino acids).
+    :arg bool shared_leaves: Use shared, read-only, instances for the
+        common leaves, e.g., `{"sequence": "T", "source": "description"}`.
+    :arg bool lazy: Return a `LazyModel` for descriptions (other start rules
+        are converted as usual).
     :returns: Description dictionary model.
     :rtype: dict
     """
+    recorder = instrumentation.recorder
+    if recorder is not None:
+        # One record for the parsing and the conversion stages.
+        with recorder.record():
+            return _to_model(description, start_rule, interner, shared_leaves, lazy)
+    return _to_model(description, start_rule, interner, shared_leaves, lazy)
+
+
+def _to_model(description, start_rule, interner, shared_leaves, lazy):
     parse_tree = parse(description, start_rule=start_rule)
-    return parse_tree_to_model(parse_tree)
+    if lazy:
+        return parse_tree_to_lazy_model(parse_tree, interner, shared_leaves)
+    return parse_tree_to_model(parse_tree, interner, shared_leaves)
 
 
-def parse_tree_to_model(parse_tree):
+def parse_tree_to_model(parse_tree, interner=None, shared_leaves=False):
     """
     Convert a parse tree to a nested dictionary model.
 
     :arg lark.Tree parse_tree: HGVS description.
+    :arg cache.Interner interner: Interning table for the model strings.
+    :arg bool shared_leaves: Use shared, read-only, instances for the
+        common leaves.
     :returns: Description dictionary model.
     :rtype: dict
     """
+    recorder = instrumentation.recorder
+    converter = Converter(interner, shared_leaves)
     try:
-        model = Converter().transform(parse_tree)
+        if recorder is None:
+            model = converter.transform(parse_tree)
+        else:
+            with recorder.record() as record:
+                model = recorder.time(
+                    record, "convert", converter.transform, parse_tree
+                )
     except VisitError as e:
         raise e.orig_exc
 
     return model[list(model)[0]]
 
 
+def parse_tree_to_lazy_model(parse_tree, interner=None, shared_leaves=False):
+    """
+    Convert a description parse tree to a `LazyModel`. Other parse trees
+    are converted with `parse_tree_to_model()`.
+
+    :arg lark.Tree parse_tree: HGVS description.
+    :arg cache.Interner interner: Interning table for the model strings.
+    :arg bool shared_leaves: Use shared, read-only, instances for the
+        common leaves.
+    :returns: Description model.
+    :rtype: LazyModel
+    """
+    if parse_tree.data != "description":
+        return parse_tree_to_model(parse_tree, interner, shared_leaves)
+    return LazyModel(parse_tree.children[0], Converter(interner, shared_leaves))
+
+
+def _convert(converter, node):
+    """
+    Convert a parse tree node (a subtree or a token).
+    """
+    try:
+        if isinstance(node, Tree):
+            return converter.transform(node)
+        return getattr(converter, node.type)(node)
+    except VisitError as e:
+        raise e.orig_exc
+
+
+_PENDING = object()
+
+
+class LazyVariants(Sequence):
+    """
+    Read-only list of variant models, each converted on its first access.
+    """
+
+    def __init__(self, nodes, converter):
+        self._nodes = nodes
+        self._converter = converter
+        self._values = [_PENDING] * len(nodes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._nodes)))]
+        value = self._values[index]
+        if value is _PENDING:
+            value = self._values[index] = _convert(
+                self._converter, self._nodes[index]
+            )["variant"]
+        return value
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class LazyModel(Mapping):
+    """
+    Read-only mapping view of a description model, over its parse tree.
+    The reference and each of the variants are converted on their first
+    access, and memoized, such that reading, e.g., only the reference ID,
+    skips the conversion of the variants. Conversion errors are raised on
+    access. Use `to_dict()` for the (plain) dictionary model.
+    """
+
+    def __init__(self, tree, converter):
+        """
+        :arg lark.Tree tree: The `description_dna` or `description_protein`
+            node of a description parse tree.
+        :arg Converter converter: Model converter.
+        """
+        self._converter = converter
+        self._values = {"type": tree.data}
+        self._nodes = {}
+        predicted = False
+        for child in tree.children:
+            if isinstance(child, Tree) and child.data == "reference":
+                self._values["reference"] = _PENDING
+                self._nodes["reference"] = child
+            elif isinstance(child, Tree) and child.data in [
+                "variants",
+                "variants_predicted",
+            ]:
+                self._values["variants"] = _PENDING
+                self._nodes["variants"] = child
+                predicted = child.data == "variants_predicted"
+            else:
+                self._values.update(_convert(converter, child))
+        if predicted:
+            self._values["predicted"] = True
+
+    def __getitem__(self, key):
+        value = self._values[key]
+        if value is _PENDING:
+            node = self._nodes.pop(key)
+            if key == "variants":
+                value = LazyVariants(node.children, self._converter)
+            else:
+                value = _convert(self._converter, node)[key]
+            self._values[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def to_dict(self):
+        """
+        :returns: The (fully converted) description dictionary model.
+        :rtype: dict
+        """
+        output = {}
+        for key in self:
+            value = self[key]
+            output[key] = list(value) if isinstance(value, LazyVariants) else value
+        return output
+
+
+def _identity(value):
+    return value
+
+
+class ReadOnlyDict(dict):
+    """
+    Dictionary that cannot be modified, used for the shared model leaves.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Shared model leaves are read-only.")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return ReadOnlyDict, (dict(self),)
+
+
+# Maximum number of shared leaves. Once reached, new leaves are not shared.
+MAX_SHARED_LEAVES = 4096
+
+_SHARED_LEAVES = {}
+
+
+def _shared_leaf(leaf):
+    """
+    The shared instance for a leaf, i.e., a dictionary with scalar values.
+    Other dictionaries are returned as they are.
+    """
+    key = tuple(leaf.items())
+    try:
+        shared = _SHARED_LEAVES.get(key)
+    except TypeError:
+        return leaf
+    if shared is None:
+        if len(_SHARED_LEAVES) >= MAX_SHARED_LEAVES:
+            return leaf
+        shared = _SHARED_LEAVES[key] = ReadOnlyDict(leaf)
+    return shared
+
+
 class Converter(Transformer):
+    """
+    Note that the children are never modified, such that they can be
+    shared (see `shared_leaves`).
+    """
+
+    def __init__(self, interner=None, shared_leaves=False):
+        super().__init__()
+        self._intern = _identity if interner is None else interner
+        self._leaf = _shared_leaf if shared_leaves else _identity
+
     def description(self, children):
         return {"description": get_only_value(children)}
 
@@ -67,10 +283,10 @@ class Converter(Transformer):
         return {"reference": output}
 
     def ID(self, name):
-        return {"id": name.value}
+        return {"id": self._intern(name.value)}
 
     def COORDINATE_SYSTEM(self, name):
-        return {"coordinate_system": name.value}
+        return {"coordinate_system": self._intern(name.value)}
 
     def variants(self, children):
         return {"variants": [child["variant"] for child in children]}
@@ -139,8 +355,9 @@ class Converter(Transformer):
     def substitution(self, children):
         output = {"type": "substitution", "source": "reference"}
         if len(children) == 2:
-            children[0]["source"] = "description"
-            output["deleted"] = [children[0]]
+            deleted = dict(children[0])
+            deleted["source"] = "description"
+            output["deleted"] = [self._leaf(deleted)]
             output["inserted"] = children[1]["inserted"]
         else:
             output.update(to_dict(children))
@@ -168,7 +385,7 @@ class Converter(Transformer):
                 output["position"] = int(child.value)
             elif isinstance(child, Token) and child.type == "CHROMOSOME_POINT":
                 output["position"] = child.value
-        return {"point": output}
+        return {"point": self._leaf(output)}
 
     def uncertain_point(self, children):
         return {
@@ -206,7 +423,7 @@ class Converter(Transformer):
                 output["upstream"] = True
         else:
             output["value"] = int(name.value)
-        return {"offset": output}
+        return {"offset": self._leaf(output)}
 
     def OUTSIDE_CDS(self, name):
         output = {}
@@ -234,7 +451,9 @@ class Converter(Transformer):
                 new_children.append(get_only_value([child]))
             else:
                 new_children.append(child)
-        return _insert(new_children)
+        output = _insert(new_children)
+        output["insert"] = [self._leaf(item) for item in output["insert"]]
+        return output
 
     def repeat_number(self, children):
         return {"repeat_number": self.length(children)["length"]}
@@ -255,26 +474,34 @@ class Converter(Transformer):
         if isinstance(length, Token) and length.type == "NUMBER":
             return {"length": {"type": "point", "value": int(length.value)}}
         if isinstance(length, dict):
+            length = dict(length)
             if length.get("type") == "range":
                 length["uncertain"] = True
-                if length["start"].get("uncertain") is None:
-                    length["start"]["value"] = length["start"]["position"]
-                    length["start"].pop("position")
-                if length["end"].get("uncertain") is None:
-                    length["end"]["value"] = length["end"]["position"]
-                    length["end"].pop("position")
+                length["start"] = _length_bound(length["start"])
+                length["end"] = _length_bound(length["end"])
             elif length.get("uncertain"):
                 length["type"] = "point"
             return {"length": length}
 
     def SEQUENCE(self, name):
-        return {"sequence": name.value}
+        return {"sequence": self._intern(name.value)}
 
     def P_SEQUENCE(self, name):
-        return {"sequence": name.value}
+        return {"sequence": self._intern(name.value)}
 
     def AA(self, name):
-        return {"amino_acid": name.value}
+        return {"amino_acid": self._intern(name.value)}
+
+
+def _length_bound(point):
+    """
+    A certain length range bound has a value instead of a position.
+    """
+    if point.get("uncertain") is not None:
+        return point
+    output = {key: value for key, value in point.items() if key != "position"}
+    output["value"] = point["position"]
+    return output
 
 
 def _predicted(model):
@@ -0,0 +1,226 @@
+"""
+Module for differential testing of parsing engines.
+
+An engine is a callable converting a description into a model, e.g., the
+reference `parse()` + `convert.parse_tree_to_model()` pipeline with a parser
+without any of the fast paths (the precompiled grammar, the coordinate
+system dispatch), or the public `to_model()`. The outcome of an engine is
+either the model or the error it raised. The same recorded and generated
+descriptions are run through two engines, and for each mismatch a minimal
+description for which the engines still disagree is searched (delta
+debugging), within a time budget, e.g.:
+
+    python -m mutalyzer_hgvs_parser.differential -n 5000 -t 60 -f corpus.txt
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from .convert import parse_tree_to_model, to_model
+from .generate import Generator
+from .hgvs_parser import HgvsParser, transform
+
+
+def _parser_engine(**kwargs):
+    def engine():
+        parser = HgvsParser(**kwargs)
+        return lambda description: parse_tree_to_model(
+            transform(parser.parse(description))
+        )
+
+    return engine
+
+
+def _lazy_to_model(description):
+    model = to_model(description, lazy=True)
+    return model.to_dict() if hasattr(model, "to_dict") else model
+
+
+# Engine factories, by name.
+ENGINES = {
+    "reference": _parser_engine(dispatch=False, use_precompiled=False),
+    "dispatch": _parser_engine(use_precompiled=False),
+    "precompiled": _parser_engine(dispatch=False),
+    "parser": _parser_engine(),
+    "to_model": lambda: to_model,
+    "lazy": lambda: _lazy_to_model,
+}
+
+
+def get_engine(name):
+    """
+    :arg str name: Engine name (see `ENGINES`).
+    :returns: The engine, i.e., a description to model callable.
+    :rtype: callable
+    """
+    if name not in ENGINES:
+        raise ValueError(
+            "Unknown engine '{}', expected one of: {}.".format(name, ", ".join(ENGINES))
+        )
+    return ENGINES[name]()
+
+
+def outcome(engine, description):
+    """
+    :returns: `["model", model]` or `["error", error type, error message]`.
+    :rtype: list
+    """
+    try:
+        return ["model", engine(description)]
+    except Exception as e:
+        return ["error", type(e).__name__, str(e)]
+
+
+def minimize(description, mismatch, deadline=None):
+    """
+    Delta debugging (complements only) over the description characters.
+
+    :arg str description: Description for which `mismatch` holds.
+    :arg callable mismatch: Description to bool predicate.
+    :arg float deadline: Stop reducing after this `time.monotonic()` value.
+    :returns: A (locally) minimal description for which `mismatch` holds.
+    :rtype: str
+    """
+    characters = list(description)
+    granularity = 2
+    while len(characters) >= 2:
+        if deadline is not None and time.monotonic() > deadline:
+            break
+        chunk = -(-len(characters) // granularity)
+        for start in range(0, len(characters), chunk):
+            complement = characters[:start] + characters[start + chunk :]
+            if complement and mismatch("".join(complement)):
+                characters = complement
+                granularity = max(granularity - 1, 2)
+                break
+        else:
+            if granularity >= len(characters):
+                break
+            granularity = min(2 * granularity, len(characters))
+    return "".join(characters)
+
+
+def compare(
+    engines,
+    descriptions,
+    time_budget=None,
+    minimize_mismatches=True,
+    max_mismatches=10,
+):
+    """
+    Run the descriptions through two engines and report the mismatches.
+
+    :arg list engines: The two engine names (see `ENGINES`).
+    :arg iterable descriptions: Descriptions to compare the engines on.
+    :arg float time_budget: Maximum time, in seconds, including minimization.
+    :arg bool minimize_mismatches: Search minimal reproducers.
+    :arg int max_mismatches: Stop after this number of mismatches.
+    :returns: Report, with the number of checked descriptions, the
+        mismatches (description, minimized reproducer, outcomes), and
+        whether the time budget was exhausted.
+    :rtype: dict
+    """
+    first, second = [get_engine(name) for name in engines]
+
+    def mismatch(description):
+        return outcome(first, description) != outcome(second, description)
+
+    start = time.monotonic()
+    deadline = start + time_budget if time_budget is not None else None
+    report = {"engines": list(engines), "checked": 0, "mismatches": []}
+    timed_out = False
+    for description in descriptions:
+        if deadline is not None and time.monotonic() > deadline:
+            timed_out = True
+            break
+        report["checked"] += 1
+        outcomes = [outcome(first, description), outcome(second, description)]
+        if outcomes[0] == outcomes[1]:
+            continue
+        report["mismatches"].append(
+            {
+                "description": description,
+                "minimized": minimize(description, mismatch, deadline)
+                if minimize_mismatches
+                else None,
+                "outcomes": dict(zip(engines, outcomes)),
+            }
+        )
+        if len(report["mismatches"]) >= max_mismatches:
+            break
+    report["timed_out"] = timed_out
+    report["elapsed"] = time.monotonic() - start
+    return report
+
+
+def corpus(file_paths=(), count=1000, seed=0, errors=0.1):
+    """
+    The recorded descriptions (one per line in the files), followed by
+    generated ones.
+
+    :arg list file_paths: Recorded descriptions files.
+    :arg int count: Number of generated descriptions.
+    :arg int seed: Generator seed.
+    :arg float errors: Fraction of generated descriptions with syntax errors.
+    :returns: Descriptions.
+    :rtype: generator
+    """
+    for file_path in file_paths:
+        with open(file_path) as corpus_file:
+            for line in corpus_file:
+                if line.strip():
+                    yield line.strip()
+    if count:
+        yield from Generator(seed=seed, errors=errors).generate_many(count)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Differential testing of the parsing engines."
+    )
+    parser.add_argument(
+        "-e",
+        nargs=2,
+        default=["reference", "to_model"],
+        metavar="ENGINE",
+        help="the two engines to compare (default: reference to_model), "
+        "from: {}".format(", ".join(ENGINES)),
+    )
+    parser.add_argument("-f", nargs="*", default=[], help="recorded corpus files")
+    parser.add_argument(
+        "-n", type=int, default=1000, help="number of generated descriptions"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument(
+        "--errors", type=float, default=0.1, help="fraction with syntax errors"
+    )
+    parser.add_argument("-t", type=float, help="time budget (seconds)")
+    parser.add_argument(
+        "-m", type=int, default=10, help="stop after this number of mismatches"
+    )
+    parser.add_argument(
+        "--no-minimize", action="store_true", help="do not minimize the mismatches"
+    )
+    parser.add_argument("-o", help="output JSON report path (default: stdout)")
+    args = parser.parse_args()
+
+    report = compare(
+        args.e,
+        corpus(args.f, args.n, args.seed, args.errors),
+        time_budget=args.t,
+        minimize_mismatches=not args.no_minimize,
+        max_mismatches=args.m,
+    )
+    if args.o:
+        with open(args.o, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    if report["mismatches"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -121,3 +121,7 @@ TERMINALS = {
 
 class NestedDescriptions(Exception):
     pass
+
+
+class DecodeError(ValueError):
+    pass
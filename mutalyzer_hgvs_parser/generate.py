@@ -0,0 +1,482 @@
+"""
+Module for generating synthetic HGVS descriptions by walking the grammar.
+
+The rules of the compiled (lark) grammar are expanded at random, weighted,
+and seeded. The generated descriptions belong to the grammar language, unless
+syntax errors are explicitly injected. Note that a few of them may still be
+rejected by the parser, because of its lexer (only the longest match is
+considered for a terminal), unless `check` is used.
+"""
+
+import argparse
+import random
+import string
+
+from .hgvs_parser import get_parser, is_valid
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+# Roughly a production mix: mostly simple DNA substitutions and deletions,
+# few predicted, repeat, or nested variants.
+WEIGHTS = {
+    "description_dna": 0.1,
+    "description_protein": 0.1,
+    "variants_predicted": 0.05,
+    "variant_predicted": 0.05,
+    "p_variants_predicted": 0.05,
+    "p_variant_predicted": 0.05,
+    "uncertain_point": 0.1,
+    "repeat": 0.3,
+    "p_repeat": 0.3,
+    "repeat_mixed": 0.3,
+    "p_repeat_mixed": 0.3,
+    "repeat_number": 0.1,
+    "length": 0.3,
+    "p_length": 0.3,
+    "exact_range": 0.3,
+    "substitution": 5,
+    "p_substitution": 5,
+    "deletion": 2,
+    "p_deletion": 2,
+    "conversion": 0.1,
+    "equal": 0.3,
+    "p_equal": 0.3,
+    "inversion": 0.3,
+    "extension": 0.3,
+    "LSQB": 0.15,
+    "INVERTED": 0.1,
+    "CHROMOSOME_POINT": 0.1,
+    "COORDINATE_SYSTEM": 20,
+    "P_COORDINATE_SYSTEM": 20,
+    "EQUAL": 0.1,
+    "PREDICTED_EQUAL": 0.1,
+    "UNKNOWN": 0.1,
+    "OFFSET": 0.3,
+    "OUTSIDE_CDS": 0.3,
+}
+
+# Weights of specific rule alternatives, overriding the symbol weights,
+# optionally only within a parent rule ("parent>rule").
+EXPANSIONS = {
+    "description": {"description_dna": 4, "description_protein": 1},
+    "reference": {
+        "ID": 1,
+        "ID reference": 0.3,
+        "LPAR ID RPAR": 0,
+        "LPAR ID reference RPAR": 0,
+    },
+    "reference>reference": {
+        "ID": 0,
+        "ID reference": 0,
+        "LPAR ID RPAR": 1,
+        "LPAR ID reference RPAR": 0.1,
+    },
+    "variant_certain": {"location": 0.05},
+    "p_variant_certain": {"p_location": 0.05},
+    "substitution": {"SEQUENCE MORETHAN inserted": 1, "MORETHAN inserted": 0.05},
+    "deletion": {"DEL": 1, "DEL inserted": 0.2},
+    "duplication": {"DUP": 1, "DUP inserted": 0.2},
+    "inversion": {"INVERTED": 1, "INVERTED inserted": 0.1},
+    "deletion_insertion": {"DEL INS inserted": 1, "DEL inserted INS inserted": 0.2},
+    "insert": {"SEQUENCE": 5, "location": 0.5},
+}
+
+# Constructs that are responsible for most of the grammar ambiguities.
+AMBIGUOUS = [
+    "variants_predicted",
+    "variant_predicted",
+    "p_variants_predicted",
+    "p_variant_predicted",
+    "repeat",
+    "p_repeat",
+    "repeat_mixed",
+    "p_repeat_mixed",
+    "repeat_number",
+    "length",
+    "p_length",
+]
+
+DESCRIPTIONS = ["description_dna", "description_protein"]
+
+REFERENCE_PREFIXES = ["NM_", "NC_", "NG_", "NR_", "NP_", "XM_", "LRG_"]
+
+COORDINATE_SYSTEMS = "ccccgggnnrmo"
+
+NUCLEOTIDES = "ACGT"
+
+AMINO_ACIDS = [
+    "Ala", "Arg", "Asn", "Asp", "Cys", "Gln", "Glu", "Gly", "His", "Ile",
+    "Leu", "Lys", "Met", "Phe", "Pro", "Ser", "Thr", "Trp", "Tyr", "Val",
+]
+
+# Characters used when injecting syntax errors.
+NOISE = string.ascii_letters + string.digits + "()[]_:;.>=?*+-!@ "
+
+# Maximum number of attempts to generate a description within the maximum
+# length, and accepted by the parser (with `check`).
+MAX_ATTEMPTS = 1000
+
+
+class Generator:
+    """
+    Weighted, seeded, random HGVS descriptions generator.
+    """
+
+    def __init__(
+        self,
+        seed=None,
+        start_rule="description",
+        weights=None,
+        ambiguity=1.0,
+        max_depth=25,
+        max_nesting=1,
+        max_repeats=3,
+        repeat=0.3,
+        max_sequence=10,
+        max_length=None,
+        errors=0.0,
+        check=False,
+    ):
+        """
+        :arg int seed: Random seed.
+        :arg str start_rule: Grammar rule to start from, e.g.,
+            `description_dna` or `description_protein`.
+        :arg dict weights: Grammar symbol (rule or terminal) weights,
+            updating the default `WEIGHTS`.
+        :arg float ambiguity: Factor applied to the weights of the
+            ambiguity prone constructs (see `AMBIGUOUS`).
+        :arg int max_depth: Maximum grammar derivation depth.
+        :arg int max_nesting: Maximum number of nested descriptions.
+        :arg int max_repeats: Maximum number of repeated items, e.g., variants.
+        :arg float repeat: Weight of adding one more repeated item.
+        :arg int max_sequence: Maximum length of the generated sequences.
+        :arg int max_length: Maximum description length.
+        :arg float errors: Fraction of descriptions with injected syntax errors.
+        :arg bool check: Regenerate the descriptions rejected by the parser,
+            and retry the syntax errors injections accepted by it.
+        """
+        self._random = random.Random(seed)
+        self._start_rule = start_rule
+        self._max_depth = max_depth
+        self._max_nesting = max_nesting
+        self._max_repeats = max_repeats
+        self._repeat = repeat
+        self._max_sequence = max_sequence
+        self._max_length = max_length
+        self._errors = errors
+        self._check = check
+        # The DNA and protein descriptions are checked with the (dispatched)
+        # description parser.
+        if start_rule in ("description_dna", "description_protein"):
+            self._check_rule = "description"
+        else:
+            self._check_rule = start_rule
+
+        self._weights = dict(WEIGHTS)
+        if weights:
+            self._weights.update(weights)
+        for symbol in AMBIGUOUS:
+            self._weights[symbol] = self._weights.get(symbol, 1) * ambiguity
+
+        self._load_grammar()
+
+    def _load_grammar(self):
+        lark_parser = get_parser()._parser
+        self._terminals = {t.name: t.pattern for t in lark_parser.terminals}
+        self._rules = {}
+        for rule in lark_parser.rules:
+            self._rules.setdefault(rule.origin.name, []).append(
+                [symbol.name for symbol in rule.expansion]
+            )
+        self._min_depth = _min_depths(self._rules)
+
+    def _cost(self, symbol):
+        return self._min_depth.get(symbol, 0)
+
+    def _alternatives(self, parent, name, depth, nesting, repeats):
+        expansion_weights = EXPANSIONS.get(
+            "{}>{}".format(parent, name), EXPANSIONS.get(name, {})
+        )
+        alternatives = []
+        weights = []
+        for expansion in self._rules[name]:
+            if name in expansion and repeats >= self._max_repeats:
+                continue
+            if nesting > self._max_nesting and set(DESCRIPTIONS) & set(expansion):
+                continue
+            if depth + max(map(self._cost, expansion), default=0) > self._max_depth:
+                continue
+            weight = expansion_weights.get(" ".join(expansion))
+            if weight is None:
+                weight = self._repeat if name in expansion else 1
+                for symbol in expansion:
+                    weight *= self._weights.get(symbol, 1)
+            if weight > 0:
+                alternatives.append(expansion)
+                weights.append(weight)
+        if not alternatives:
+            # Get out as quickly as possible.
+            alternatives = [
+                min(
+                    self._rules[name],
+                    key=lambda e: max(map(self._cost, e), default=0),
+                )
+            ]
+            weights = [1]
+        return alternatives, weights
+
+    def _expand(self, parent, name, depth, nesting, repeats, output):
+        if name in self._terminals:
+            output.append(self._terminal(name))
+            return
+        if name in DESCRIPTIONS:
+            nesting += 1
+        if not name.startswith("__"):
+            depth += 1
+        alternatives, weights = self._alternatives(
+            parent, name, depth, nesting, repeats
+        )
+        if not name.startswith("__"):
+            parent = name
+        for symbol in self._random.choices(alternatives, weights)[0]:
+            self._expand(
+                parent,
+                symbol,
+                depth,
+                nesting,
+                repeats + 1 if symbol == name else 0,
+                output,
+            )
+
+    def _terminal(self, name):
+        pattern = self._terminals[name]
+        if pattern.type == "str":
+            return pattern.value
+        if name == "ID":
+            return self._reference_id()
+        if name == "NUMBER":
+            return str(int(10 ** self._random.uniform(0, 6)))
+        if name == "COORDINATE_SYSTEM":
+            return self._random.choice(COORDINATE_SYSTEMS)
+        if name == "SEQUENCE":
+            return "".join(
+                self._random.choices(NUCLEOTIDES, k=self._sequence_length())
+            )
+        if name == "P_SEQUENCE":
+            return "".join(
+                self._random.choices(AMINO_ACIDS, k=self._sequence_length())
+            )
+        if name == "AA":
+            return self._random.choice(AMINO_ACIDS)
+        return _sample_regex(sre_parse.parse(pattern.value), self._random)
+
+    def _sequence_length(self):
+        length = 1
+        while length < self._max_sequence and self._random.random() < 0.5:
+            length += 1
+        return length
+
+    def _reference_id(self):
+        prefix = self._random.choice(REFERENCE_PREFIXES)
+        if prefix == "LRG_":
+            return "LRG_{}{}".format(
+                self._random.randint(1, 999),
+                self._random.choice(["", "t1", "t2", "p1"]),
+            )
+        return "{}{:06d}.{}".format(
+            prefix, self._random.randint(1, 999999), self._random.randint(1, 12)
+        )
+
+    def _description(self):
+        output = []
+        self._expand(None, self._start_rule, 0, 0, 0, output)
+        return "".join(output)
+
+    def _is_valid(self, description):
+        return is_valid(description, start_rule=self._check_rule)
+
+    def generate(self):
+        """
+        Generate one description.
+
+        :returns: Generated description.
+        :rtype: str
+        :raises ValueError: If no description within the maximum length (and
+            accepted by the parser) is generated in `MAX_ATTEMPTS` attempts.
+        """
+        for _ in range(MAX_ATTEMPTS):
+            description = self._description()
+            if not (self._max_length and len(description) > self._max_length) and (
+                not self._check or self._is_valid(description)
+            ):
+                break
+        else:
+            raise ValueError(
+                "No description generated in {} attempts, the maximum length "
+                "({}) may be too small.".format(MAX_ATTEMPTS, self._max_length)
+            )
+        if self._errors and self._random.random() < self._errors:
+            mutated = self.mutate(description)
+            for _ in range(10):
+                if not (self._check and self._is_valid(mutated)):
+                    break
+                mutated = self.mutate(description)
+            description = mutated
+        return description
+
+    def generate_many(self, count):
+        """
+        :arg int count: Number of descriptions to generate.
+        :returns: Generated descriptions.
+        :rtype: generator
+        """
+        for _ in range(count):
+            yield self.generate()
+
+    def mutate(self, description):
+        """
+        Inject a syntax error, i.e., delete, insert, substitute, or swap
+        a character, or truncate the description. Note that the result
+        may still be (rarely) syntactically valid.
+
+        :arg str description: Description to mutate.
+        :returns: Mutated description.
+        :rtype: str
+        """
+        position = self._random.randrange(len(description))
+        operation = self._random.choice(
+            ["delete", "insert", "substitute", "swap", "truncate"]
+        )
+        if operation == "delete":
+            return description[:position] + description[position + 1 :]
+        if operation == "insert":
+            return (
+                description[:position]
+                + self._random.choice(NOISE)
+                + description[position:]
+            )
+        if operation == "substitute":
+            return (
+                description[:position]
+                + self._random.choice(NOISE)
+                + description[position + 1 :]
+            )
+        if operation == "swap" and position + 1 < len(description):
+            return (
+                description[:position]
+                + description[position + 1]
+                + description[position]
+                + description[position + 2 :]
+            )
+        return description[:position]
+
+
+def _min_depths(rules):
+    """
+    Minimum derivation depth for each rule (terminals have depth 0).
+    """
+    depths = {}
+    changed = True
+    while changed:
+        changed = False
+        for name, expansions in rules.items():
+            for expansion in expansions:
+                if all(s in depths or s not in rules for s in expansion):
+                    depth = max((depths.get(s, 0) for s in expansion), default=0)
+                    depth += 0 if name.startswith("__") else 1
+                    if depth < depths.get(name, float("inf")):
+                        depths[name] = depth
+                        changed = True
+    return depths
+
+
+def _sample_regex(parsed, rnd):
+    """
+    Sample a string matching a parsed (`sre_parse`) regular expression.
+    Only the constructs used by the grammar terminals are supported.
+    """
+    output = []
+    for op, av in parsed:
+        name = str(op)
+        if name == "LITERAL":
+            output.append(chr(av))
+        elif name == "IN":
+            choices = []
+            for in_op, in_av in av:
+                if str(in_op) == "LITERAL":
+                    choices.append(chr(in_av))
+                elif str(in_op) == "RANGE":
+                    choices.extend(chr(c) for c in range(in_av[0], in_av[1] + 1))
+                else:
+                    raise ValueError("Unsupported regex construct: {}".format(in_op))
+            output.append(rnd.choice(choices))
+        elif name == "BRANCH":
+            output.append(_sample_regex(rnd.choice(av[1]), rnd))
+        elif name == "SUBPATTERN":
+            output.append(_sample_regex(av[-1], rnd))
+        elif name in ("MAX_REPEAT", "MIN_REPEAT"):
+            minimum, maximum, item = av
+            count = rnd.randint(minimum, min(maximum, minimum + 3))
+            output.extend(_sample_regex(item, rnd) for _ in range(count))
+        else:
+            raise ValueError("Unsupported regex construct: {}".format(op))
+    return "".join(output)
+
+
+def main():
+    """
+    Command line entry point, e.g.:
+
+        python -m mutalyzer_hgvs_parser.generate -n 1000 --seed 42 -o corpus.txt
+    """
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic HGVS descriptions from the grammar."
+    )
+    parser.add_argument("-n", type=int, default=10, help="number of descriptions")
+    parser.add_argument("-o", help="output file path (default: stdout)")
+    parser.add_argument("--seed", type=int, help="random seed")
+    parser.add_argument(
+        "-r", default="description", help="start rule (e.g., description_protein)"
+    )
+    parser.add_argument(
+        "--errors", type=float, default=0.0, help="fraction with syntax errors"
+    )
+    parser.add_argument(
+        "--ambiguity",
+        type=float,
+        default=1.0,
+        help="factor for the ambiguity prone constructs weights",
+    )
+    parser.add_argument("--max-nesting", type=int, default=1)
+    parser.add_argument("--max-repeats", type=int, default=3)
+    parser.add_argument("--max-length", type=int)
+    parser.add_argument(
+        "--check", action="store_true", help="only descriptions accepted by the parser"
+    )
+    args = parser.parse_args()
+
+    generator = Generator(
+        seed=args.seed,
+        start_rule=args.r,
+        ambiguity=args.ambiguity,
+        max_nesting=args.max_nesting,
+        max_repeats=args.max_repeats,
+        max_length=args.max_length,
+        errors=args.errors,
+        check=args.check,
+    )
+    descriptions = generator.generate_many(args.n)
+    if args.o:
+        with open(args.o, "w") as output_file:
+            for description in descriptions:
+                output_file.write(description + "\n")
+    else:
+        for description in descriptions:
+            print(description)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Precompiled grammar tables, generated by:
+
+    python scripts/build_grammar_tables.py
+
+Do not edit.
+"""
+
+GRAMMAR_HASH = 'e14a768eb451fdad783f8f93fb31f8aa761c73811daba4406ad84bfbc94bf19b'
+
+IGNORE = ['WS']
+
+TERMINALS = [
+    ('WS', 're', '(?:[ \t\x0c\r\n])+', (), None, 0),
+    ('COORDINATE_SYSTEM', 're', '(?:[a-o]|[q-z])', (), None, 0),
+    ('OUTSIDE_CDS', 're', '(?:\\*|\\-)', (), None, 0),
+    ('OFFSET', 're', '(?:(?:\\+|\\-))?(?:(?:[0-9])+|\\?)', (), None, 0),
+    ('CHROMOSOME_POINT', 're', '(?:pter|qter)', (), None, 0),
+    ('INVERTED', 'str', 'inv', (), '"inv"', 0),
+    ('SEQUENCE', 're', '(?:(?:a|c|g|t|u|r|y|k|m|s|w|b|d|h|v|n|A|C|G|T|U|R|Y|K|M|S|W|B|D|H|V|N))+', (), None, 0),
+    ('P_COORDINATE_SYSTEM', 'str', 'p', (), '"p"', 0),
+    ('P_SEQUENCE', 're', '(?:(?:Ala|Arg|Asn|Asp|Cys|Gln|Glu|Gly|His|Ile|Leu|Lys|Met|Phe|Pro|Ser|Thr|Trp|Tyr|Val|Sec|Ter|Xaa|A|R|N|D|C|Q|E|G|H|I|L|K|M|F|P|S|T|W|Y|V|U|\\*|X))+', (), None, 0),
+    ('AA', 're', '(?:Ala|Arg|Asn|Asp|Cys|Gln|Glu|Gly|His|Ile|Leu|Lys|Met|Phe|Pro|Ser|Thr|Trp|Tyr|Val|Sec|Ter|Xaa|A|R|N|D|C|Q|E|G|H|I|L|K|M|F|P|S|T|W|Y|V|U|\\*|X)', (), None, 0),
+    ('ID', 're', '(?:(?:[A-Z]|[a-z])|[0-9])(?:(?:(?:[A-Z]|[a-z])|[0-9]|\\.|_|\\-))*', (), None, 0),
+    ('NUMBER', 're', '(?:[0-9])+', (), None, 0),
+    ('UNKNOWN', 'str', '?', (), '"?"', 0),
+    ('PREDICTED_EQUAL', 'str', '(=)', (), '"(=)"', 0),
+    ('LPAR_LSQB', 'str', '([', (), '"(["', 0),
+    ('LSQB_LPAR', 'str', '[(', (), '"[("', 0),
+    ('RSQB_RPAR', 'str', '])', (), '"])"', 0),
+    ('RPAR_RSQB', 'str', ')]', (), '")]"', 0),
+    ('DOT', 'str', '.', (), '"."', 0),
+    ('COLON', 'str', ':', (), '":"', 0),
+    ('SEMICOLON', 'str', ';', (), '";"', 0),
+    ('EQUAL', 'str', '=', (), '"="', 0),
+    ('LSQB', 'str', '[', (), '"["', 0),
+    ('RSQB', 'str', ']', (), '"]"', 0),
+    ('LPAR', 'str', '(', (), '"("', 0),
+    ('RPAR', 'str', ')', (), '")"', 0),
+    ('UNDERSCORE', 'str', '_', (), '"_"', 0),
+    ('CON', 'str', 'con', (), '"con"', 0),
+    ('DEL', 'str', 'del', (), '"del"', 0),
+    ('INS', 'str', 'ins', (), '"ins"', 0),
+    ('DUP', 'str', 'dup', (), '"dup"', 0),
+    ('MORETHAN', 'str', '>', (), '">"', 0),
+    ('EXT', 'str', 'ext', (), '"ext"', 0),
+    ('MINUS', 'str', '-', (), '"-"', 0),
+    ('STAR', 'str', '*', (), '"*"', 0),
+    ('TER', 'str', 'Ter', (), '"Ter"', 0),
+    ('FS', 'str', 'fs', (), '"fs"', 0),
+]
+
+RULES = [
+    ('description', ('description_dna',), (), 0, None, (False, False, None, ())),
+    ('description', ('description_protein',), (), 1, None, (False, False, None, ())),
+    ('description_dna', ('reference', 'COLON', 'COORDINATE_SYSTEM', 'DOT', 'variants'), (1, 3), 0, None, (False, False, None, ())),
+    ('description_dna', ('reference', 'COLON', 'variants'), (1,), 1, None, (False, False, None, ())),
+    ('variants', ('variants_certain',), (), 0, None, (False, False, None, ())),
+    ('variants', ('variants_predicted',), (), 1, None, (False, False, None, ())),
+    ('variants_certain', ('LSQB', 'variant', '__variants_certain_star_0', 'RSQB'), (0, 3), 0, None, (False, False, None, ())),
+    ('variants_certain', ('LSQB', 'variant', 'RSQB'), (0, 2), 1, None, (False, False, None, ())),
+    ('variants_certain', ('LSQB', 'EQUAL', 'RSQB'), (0, 1, 2), 2, None, (False, False, None, ())),
+    ('variants_certain', ('variant',), (), 3, None, (False, False, None, ())),
+    ('variants_certain', ('EQUAL',), (0,), 4, None, (False, False, None, ())),
+    ('variants_predicted', ('LPAR_LSQB', 'variant', '__variants_certain_star_0', 'RSQB_RPAR'), (0, 3), 0, None, (False, False, None, ())),
+    ('variants_predicted', ('LPAR_LSQB', 'variant', 'RSQB_RPAR'), (0, 2), 1, None, (False, False, None, ())),
+    ('variants_predicted', ('LSQB_LPAR', 'variant', '__variants_certain_star_0', 'RPAR_RSQB'), (0, 3), 2, None, (False, False, None, ())),
+    ('variants_predicted', ('LSQB_LPAR', 'variant', 'RPAR_RSQB'), (0, 2), 3, None, (False, False, None, ())),
+    ('variants_predicted', ('LPAR', 'variant', 'RPAR'), (0, 2), 4, None, (False, False, None, ())),
+    ('variants_predicted', ('PREDICTED_EQUAL',), (0,), 5, None, (False, False, None, ())),
+    ('variant', ('variant_certain',), (), 0, None, (False, False, None, ())),
+    ('variant', ('variant_predicted',), (), 1, None, (False, False, None, ())),
+    ('variant_predicted', ('LPAR', 'variant_certain', 'RPAR'), (0, 2), 0, None, (False, False, None, ())),
+    ('variant_certain', ('location', 'conversion'), (), 0, None, (False, False, None, ())),
+    ('variant_certain', ('location', 'deletion'), (), 1, None, (False, False, None, ())),
+    ('variant_certain', ('location', 'deletion_insertion'), (), 2, None, (False, False, None, ())),
+    ('variant_certain', ('location', 'duplication'), (), 3, None, (False, False, None, ())),
+    ('variant_certain', ('location', 'equal'), (), 4, None, (False, False, None, ())),
+    ('variant_certain', ('location', 'insertion'), (), 5, None, (False, False, None, ())),
+    ('variant_certain', ('location', 'inversion'), (), 6, None, (False, False, None, ())),
+    ('variant_certain', ('location', 'substitution'), (), 7, None, (False, False, None, ())),
+    ('variant_certain', ('location', 'repeat'), (), 8, None, (False, False, None, ())),
+    ('variant_certain', ('location',), (), 9, None, (False, False, None, ())),
+    ('location', ('point',), (), 0, None, (False, False, None, ())),
+    ('location', ('uncertain_point',), (), 1, None, (False, False, None, ())),
+    ('location', ('range',), (), 2, None, (False, False, None, ())),
+    ('point', ('OUTSIDE_CDS', 'NUMBER', 'OFFSET'), (), 0, None, (False, False, None, ())),
+    ('point', ('OUTSIDE_CDS', 'NUMBER'), (), 1, None, (False, False, None, ())),
+    ('point', ('OUTSIDE_CDS', 'UNKNOWN', 'OFFSET'), (), 2, None, (False, False, None, ())),
+    ('point', ('OUTSIDE_CDS', 'UNKNOWN'), (), 3, None, (False, False, None, ())),
+    ('point', ('NUMBER', 'OFFSET'), (), 4, None, (False, False, None, ())),
+    ('point', ('NUMBER',), (), 5, None, (False, False, None, ())),
+    ('point', ('UNKNOWN', 'OFFSET'), (), 6, None, (False, False, None, ())),
+    ('point', ('UNKNOWN',), (), 7, None, (False, False, None, ())),
+    ('point', ('CHROMOSOME_POINT',), (), 8, None, (False, False, None, ())),
+    ('uncertain_point', ('LPAR', 'point', 'UNDERSCORE', 'point', 'RPAR'), (0, 2, 4), 0, None, (False, False, None, ())),
+    ('range', ('point', 'UNDERSCORE', 'point'), (1,), 0, None, (False, False, None, ())),
+    ('range', ('point', 'UNDERSCORE', 'uncertain_point'), (1,), 1, None, (False, False, None, ())),
+    ('range', ('uncertain_point', 'UNDERSCORE', 'point'), (1,), 2, None, (False, False, None, ())),
+    ('range', ('uncertain_point', 'UNDERSCORE', 'uncertain_point'), (1,), 3, None, (False, False, None, ())),
+    ('exact_range', ('NUMBER', 'UNDERSCORE', 'NUMBER'), (1,), 0, None, (False, False, None, ())),
+    ('exact_range', ('NUMBER', 'UNDERSCORE', 'UNKNOWN'), (1,), 1, None, (False, False, None, ())),
+    ('exact_range', ('UNKNOWN', 'UNDERSCORE', 'NUMBER'), (1,), 2, None, (False, False, None, ())),
+    ('exact_range', ('UNKNOWN', 'UNDERSCORE', 'UNKNOWN'), (1,), 3, None, (False, False, None, ())),
+    ('conversion', ('CON', 'inserted'), (0,), 0, None, (False, False, None, ())),
+    ('deletion', ('DEL', 'inserted'), (0,), 0, None, (False, False, None, ())),
+    ('deletion', ('DEL',), (0,), 1, None, (False, False, None, ())),
+    ('deletion_insertion', ('DEL', 'inserted', 'INS', 'inserted'), (0, 2), 0, None, (False, False, None, ())),
+    ('deletion_insertion', ('DEL', 'INS', 'inserted'), (0, 1), 1, None, (False, False, None, ())),
+    ('duplication', ('DUP', 'inserted'), (0,), 0, None, (False, False, None, ())),
+    ('duplication', ('DUP',), (0,), 1, None, (False, False, None, ())),
+    ('equal', ('EQUAL',), (0,), 0, None, (False, False, None, ())),
+    ('insertion', ('INS', 'inserted'), (0,), 0, None, (False, False, None, ())),
+    ('inversion', ('INVERTED', 'inserted'), (0,), 0, None, (False, False, None, ())),
+    ('inversion', ('INVERTED',), (0,), 1, None, (False, False, None, ())),
+    ('repeat', ('inserted',), (), 0, None, (False, False, None, ())),
+    ('substitution', ('SEQUENCE', 'MORETHAN', 'inserted'), (1,), 0, None, (False, False, None, ())),
+    ('substitution', ('MORETHAN', 'inserted'), (0,), 1, None, (False, False, None, ())),
+    ('inserted', ('LSQB', 'insert', '__inserted_star_1', 'RSQB'), (0, 3), 0, None, (False, False, None, ())),
+    ('inserted', ('LSQB', 'insert', 'RSQB'), (0, 2), 1, None, (False, False, None, ())),
+    ('inserted', ('insert',), (), 2, None, (False, False, None, ())),
+    ('insert', ('SEQUENCE', 'INVERTED', 'LSQB', 'repeat_number', 'RSQB'), (2, 4), 0, None, (False, False, None, ())),
+    ('insert', ('SEQUENCE', 'INVERTED'), (), 1, None, (False, False, None, ())),
+    ('insert', ('SEQUENCE', 'LSQB', 'repeat_number', 'RSQB'), (1, 3), 2, None, (False, False, None, ())),
+    ('insert', ('SEQUENCE',), (), 3, None, (False, False, None, ())),
+    ('insert', ('SEQUENCE', 'LSQB', 'repeat_number', 'RSQB', 'INVERTED'), (1, 3), 4, None, (False, False, None, ())),
+    ('insert', ('description_dna', 'INVERTED', 'LSQB', 'repeat_number', 'RSQB'), (2, 4), 5, None, (False, False, None, ())),
+    ('insert', ('description_dna', 'INVERTED'), (), 6, None, (False, False, None, ())),
+    ('insert', ('description_dna', 'LSQB', 'repeat_number', 'RSQB'), (1, 3), 7, None, (False, False, None, ())),
+    ('insert', ('description_dna',), (), 8, None, (False, False, None, ())),
+    ('insert', ('description_dna', 'LSQB', 'repeat_number', 'RSQB', 'INVERTED'), (1, 3), 9, None, (False, False, None, ())),
+    ('insert', ('location', 'INVERTED', 'LSQB', 'repeat_number', 'RSQB'), (2, 4), 10, None, (False, False, None, ())),
+    ('insert', ('location', 'INVERTED'), (), 11, None, (False, False, None, ())),
+    ('insert', ('location', 'LSQB', 'repeat_number', 'RSQB'), (1, 3), 12, None, (False, False, None, ())),
+    ('insert', ('location',), (), 13, None, (False, False, None, ())),
+    ('insert', ('location', 'LSQB', 'repeat_number', 'RSQB', 'INVERTED'), (1, 3), 14, None, (False, False, None, ())),
+    ('insert', ('length', 'INVERTED', 'LSQB', 'repeat_number', 'RSQB'), (2, 4), 15, None, (False, False, None, ())),
+    ('insert', ('length', 'INVERTED'), (), 16, None, (False, False, None, ())),
+    ('insert', ('length', 'LSQB', 'repeat_number', 'RSQB'), (1, 3), 17, None, (False, False, None, ())),
+    ('insert', ('length',), (), 18, None, (False, False, None, ())),
+    ('insert', ('length', 'LSQB', 'repeat_number', 'RSQB', 'INVERTED'), (1, 3), 19, None, (False, False, None, ())),
+    ('insert', ('__insert_plus_2',), (), 20, None, (False, False, None, ())),
+    ('repeat_number', ('NUMBER',), (), 0, None, (False, False, None, ())),
+    ('repeat_number', ('UNKNOWN',), (), 1, None, (False, False, None, ())),
+    ('repeat_number', ('exact_range',), (), 2, None, (False, False, None, ())),
+    ('repeat_mixed', ('SEQUENCE', 'LSQB', 'repeat_number', 'RSQB', 'INVERTED'), (1, 3), 0, None, (False, False, None, ())),
+    ('repeat_mixed', ('SEQUENCE', 'LSQB', 'repeat_number', 'RSQB'), (1, 3), 1, None, (False, False, None, ())),
+    ('repeat_mixed', ('location', 'LSQB', 'repeat_number', 'RSQB', 'INVERTED'), (1, 3), 2, None, (False, False, None, ())),
+    ('repeat_mixed', ('location', 'LSQB', 'repeat_number', 'RSQB'), (1, 3), 3, None, (False, False, None, ())),
+    ('length', ('NUMBER',), (), 0, None, (False, False, None, ())),
+    ('length', ('UNKNOWN',), (), 1, None, (False, False, None, ())),
+    ('length', ('LPAR', 'NUMBER', 'RPAR'), (0, 2), 2, None, (False, False, None, ())),
+    ('length', ('LPAR', 'UNKNOWN', 'RPAR'), (0, 2), 3, None, (False, False, None, ())),
+    ('length', ('LPAR', 'exact_range', 'RPAR'), (0, 2), 4, None, (False, False, None, ())),
+    ('description_protein', ('reference', 'COLON', 'P_COORDINATE_SYSTEM', 'DOT', 'p_variants'), (1, 3), 0, None, (False, False, None, ())),
+    ('description_protein', ('reference', 'COLON', 'p_variants'), (1,), 1, None, (False, False, None, ())),
+    ('p_variants', ('p_variants_certain',), (), 0, None, (False, False, None, ())),
+    ('p_variants', ('p_variants_predicted',), (), 1, None, (False, False, None, ())),
+    ('p_variants_certain', ('LSQB', 'p_variant', '__p_variants_certain_star_3', 'RSQB'), (0, 3), 0, None, (False, False, None, ())),
+    ('p_variants_certain', ('LSQB', 'p_variant', 'RSQB'), (0, 2), 1, None, (False, False, None, ())),
+    ('p_variants_certain', ('p_variant',), (), 2, None, (False, False, None, ())),
+    ('p_variants_certain', ('EQUAL',), (0,), 3, None, (False, False, None, ())),
+    ('p_variants_predicted', ('LPAR_LSQB', 'p_variant', '__p_variants_certain_star_3', 'RSQB_RPAR'), (0, 3), 0, None, (False, False, None, ())),
+    ('p_variants_predicted', ('LPAR_LSQB', 'p_variant', 'RSQB_RPAR'), (0, 2), 1, None, (False, False, None, ())),
+    ('p_variants_predicted', ('LSQB_LPAR', 'p_variant', '__p_variants_certain_star_3', 'RPAR_RSQB'), (0, 3), 2, None, (False, False, None, ())),
+    ('p_variants_predicted', ('LSQB_LPAR', 'p_variant', 'RPAR_RSQB'), (0, 2), 3, None, (False, False, None, ())),
+    ('p_variants_predicted', ('LPAR', 'p_variant', 'RPAR'), (0, 2), 4, None, (False, False, None, ())),
+    ('p_variants_predicted', ('PREDICTED_EQUAL',), (0,), 5, None, (False, False, None, ())),
+    ('p_variant', ('p_variant_certain',), (), 0, None, (False, False, None, ())),
+    ('p_variant', ('p_variant_predicted',), (), 1, None, (False, False, None, ())),
+    ('p_variant_predicted', ('LPAR', 'p_variant_certain', 'RPAR'), (0, 2), 0, None, (False, False, None, ())),
+    ('p_variant_certain', ('p_location', 'p_deletion'), (), 0, None, (False, False, None, ())),
+    ('p_variant_certain', ('p_location', 'p_deletion_insertion'), (), 1, None, (False, False, None, ())),
+    ('p_variant_certain', ('p_location', 'p_duplication'), (), 2, None, (False, False, None, ())),
+    ('p_variant_certain', ('p_location', 'p_equal'), (), 3, None, (False, False, None, ())),
+    ('p_variant_certain', ('p_location', 'extension'), (), 4, None, (False, False, None, ())),
+    ('p_variant_certain', ('p_location', 'frame_shift'), (), 5, None, (False, False, None, ())),
+    ('p_variant_certain', ('p_location', 'p_insertion'), (), 6, None, (False, False, None, ())),
+    ('p_variant_certain', ('p_location', 'p_repeat'), (), 7, None, (False, False, None, ())),
+    ('p_variant_certain', ('p_location', 'p_substitution'), (), 8, None, (False, False, None, ())),
+    ('p_variant_certain', ('p_location',), (), 9, None, (False, False, None, ())),
+    ('p_location', ('p_point',), (), 0, None, (False, False, None, ())),
+    ('p_location', ('p_range',), (), 1, None, (False, False, None, ())),
+    ('p_point', ('AA', 'NUMBER'), (), 0, None, (False, False, None, ())),
+    ('p_point', ('NUMBER',), (), 1, None, (False, False, None, ())),
+    ('p_point', ('UNKNOWN',), (), 2, None, (False, False, None, ())),
+    ('p_range', ('p_point', 'UNDERSCORE', 'p_point'), (1,), 0, None, (False, False, None, ())),
+    ('p_deletion', ('DEL', 'p_inserted'), (0,), 0, None, (False, False, None, ())),
+    ('p_deletion', ('DEL',), (0,), 1, None, (False, False, None, ())),
+    ('p_deletion_insertion', ('DEL', 'p_inserted', 'INS', 'p_inserted'), (0, 2), 0, None, (False, False, None, ())),
+    ('p_deletion_insertion', ('DEL', 'INS', 'p_inserted'), (0, 1), 1, None, (False, False, None, ())),
+    ('p_duplication', ('DUP', 'p_inserted'), (0,), 0, None, (False, False, None, ())),
+    ('p_duplication', ('DUP',), (0,), 1, None, (False, False, None, ())),
+    ('p_equal', ('EQUAL', 'p_inserted'), (0,), 0, None, (False, False, None, ())),
+    ('p_equal', ('EQUAL',), (0,), 1, None, (False, False, None, ())),
+    ('extension', ('extension_n',), (), 0, None, (False, False, None, ())),
+    ('extension', ('extension_c',), (), 1, None, (False, False, None, ())),
+    ('extension_n', ('EXT', 'MINUS', 'NUMBER'), (0, 1), 0, None, (False, False, None, ())),
+    ('extension_c', ('P_SEQUENCE', 'EXT', 'P_SEQUENCE'), (1,), 0, None, (False, False, None, ())),
+    ('extension_c', ('P_SEQUENCE', 'EXT', 'p_point'), (1,), 1, None, (False, False, None, ())),
+    ('frame_shift', ('FS',), (0,), 0, None, (False, False, None, ())),
+    ('frame_shift', ('AA', 'FS', 'STAR', 'p_location'), (1, 2), 1, None, (False, False, None, ())),
+    ('frame_shift', ('AA', 'FS', 'TER', 'p_location'), (1, 2), 2, None, (False, False, None, ())),
+    ('p_insertion', ('INS', 'p_inserted'), (0,), 0, None, (False, False, None, ())),
+    ('p_repeat', ('p_inserted',), (), 0, None, (False, False, None, ())),
+    ('p_substitution', ('p_inserted',), (), 0, None, (False, False, None, ())),
+    ('p_substitution', (), (), 1, None, (False, False, None, ())),
+    ('p_inserted', ('LSQB', 'p_insert', '__p_inserted_star_4', 'RSQB'), (0, 3), 0, None, (False, False, None, ())),
+    ('p_inserted', ('LSQB', 'p_insert', 'RSQB'), (0, 2), 1, None, (False, False, None, ())),
+    ('p_inserted', ('p_insert',), (), 2, None, (False, False, None, ())),
+    ('p_insert', ('P_SEQUENCE', 'LSQB', 'p_repeat_number', 'RSQB'), (1, 3), 0, None, (False, False, None, ())),
+    ('p_insert', ('P_SEQUENCE',), (), 1, None, (False, False, None, ())),
+    ('p_insert', ('description_protein', 'LSQB', 'p_repeat_number', 'RSQB'), (1, 3), 2, None, (False, False, None, ())),
+    ('p_insert', ('description_protein',), (), 3, None, (False, False, None, ())),
+    ('p_insert', ('p_location', 'LSQB', 'p_repeat_number', 'RSQB'), (1, 3), 4, None, (False, False, None, ())),
+    ('p_insert', ('p_location',), (), 5, None, (False, False, None, ())),
+    ('p_insert', ('p_length', 'LSQB', 'p_repeat_number', 'RSQB'), (1, 3), 6, None, (False, False, None, ())),
+    ('p_insert', ('p_length',), (), 7, None, (False, False, None, ())),
+    ('p_insert', ('__p_insert_plus_5',), (), 8, None, (False, False, None, ())),
+    ('p_repeat_number', ('NUMBER',), (), 0, None, (False, False, None, ())),
+    ('p_repeat_number', ('UNKNOWN',), (), 1, None, (False, False, None, ())),
+    ('p_repeat_mixed', ('P_SEQUENCE', 'LSQB', 'p_repeat_number', 'RSQB'), (1, 3), 0, None, (False, False, None, ())),
+    ('p_repeat_mixed', ('p_location', 'LSQB', 'p_repeat_number', 'RSQB'), (1, 3), 1, None, (False, False, None, ())),
+    ('p_length', ('NUMBER',), (), 0, None, (False, False, None, ())),
+    ('p_length', ('UNKNOWN',), (), 1, None, (False, False, None, ())),
+    ('p_length', ('LPAR', 'NUMBER', 'RPAR'), (0, 2), 2, None, (False, False, None, ())),
+    ('p_length', ('LPAR', 'UNKNOWN', 'RPAR'), (0, 2), 3, None, (False, False, None, ())),
+    ('reference', ('ID', 'reference'), (), 0, None, (False, False, None, ())),
+    ('reference', ('ID',), (), 1, None, (False, False, None, ())),
+    ('reference', ('LPAR', 'ID', 'reference', 'RPAR'), (0, 3), 2, None, (False, False, None, ())),
+    ('reference', ('LPAR', 'ID', 'RPAR'), (0, 2), 3, None, (False, False, None, ())),
+    ('__variants_certain_star_0', ('SEMICOLON', 'variant'), (0,), 0, None, (False, False, None, ())),
+    ('__variants_certain_star_0', ('__variants_certain_star_0', 'SEMICOLON', 'variant'), (1,), 1, None, (False, False, None, ())),
+    ('__inserted_star_1', ('SEMICOLON', 'insert'), (0,), 0, None, (False, False, None, ())),
+    ('__inserted_star_1', ('__inserted_star_1', 'SEMICOLON', 'insert'), (1,), 1, None, (False, False, None, ())),
+    ('__insert_plus_2', ('repeat_mixed',), (), 0, None, (False, False, None, ())),
+    ('__insert_plus_2', ('__insert_plus_2', 'repeat_mixed'), (), 1, None, (False, False, None, ())),
+    ('__p_variants_certain_star_3', ('SEMICOLON', 'p_variant'), (0,), 0, None, (False, False, None, ())),
+    ('__p_variants_certain_star_3', ('__p_variants_certain_star_3', 'SEMICOLON', 'p_variant'), (1,), 1, None, (False, False, None, ())),
+    ('__p_inserted_star_4', ('SEMICOLON', 'p_insert'), (0,), 0, None, (False, False, None, ())),
+    ('__p_inserted_star_4', ('__p_inserted_star_4', 'SEMICOLON', 'p_insert'), (1,), 1, None, (False, False, None, ())),
+    ('__p_insert_plus_5', ('p_repeat_mixed',), (), 0, None, (False, False, None, ())),
+    ('__p_insert_plus_5', ('__p_insert_plus_5', 'p_repeat_mixed'), (), 1, None, (False, False, None, ())),
+]
@@ -2,11 +2,14 @@
 Module for parsing HGVS variant descriptions.
 """
 
+import gc
 import os
+import re
 
 from lark import Lark, Token, Transformer, Tree
 from lark.exceptions import UnexpectedCharacters, UnexpectedEOF
 
+from . import instrumentation, precompiled
 from .exceptions import UnexpectedCharacter, UnexpectedEnd
 from .util import data_equals, get_child
 
@@ -254,6 +257,8 @@ AMBIGUITIES = [
         "type": "description_dna | description_protein - description_dna",
         # R1:100insA
         # - we opt for "description_dna"
+        # - only for descriptions without a coordinate system, the others
+        #   are dispatched to the DNA / protein only grammars by HgvsParser.
         # TODO: Leave it undefined and do the check based on
         #     the reference type?
         "conditions": lambda children: (
@@ -474,9 +479,12 @@ AMBIGUITIES = [
 
 
 class AmbigTransformer(Transformer):
+    solved = 0
+
     def _ambig(self, children):
         for ambig in AMBIGUITIES:
             if ambig["conditions"](children):
+                self.solved += 1
                 # from lark.tree import pydot__tree_to_png
                 # pydot__tree_to_png(Tree("ambig", children), "ambig_2.png")
                 return children[ambig["selected"]]
@@ -622,42 +630,138 @@ def _replace_annon_terminals(grammar):
     return updated_grammar
 
 
+# Grammar files for the default grammar and for the coordinate system
+# specific (dispatched) start rules.
+GRAMMAR_FILES = {
+    "description": ["top.g", "dna.g", "protein.g", "reference.g", "common.g"],
+    "description_dna": ["dna.g", "reference.g", "common.g"],
+    "description_protein": ["protein.g", "reference.g", "common.g"],
+}
+
+# The coordinate system after the (first) reference, e.g., "NM_004006.1:c.",
+# with and without white spaces ignored.
+COORDINATE_SYSTEM_PRESCAN = re.compile(r"[^:]*:\s*([a-z])\s*\.")
+COORDINATE_SYSTEM_PRESCAN_NO_WHITE_SPACES = re.compile(r"[^:\s]*:([a-z])\.")
+
+
+def _default_grammar(start_rule="description"):
+    grammar = "".join(
+        _read_grammar_file(file_name) for file_name in GRAMMAR_FILES[start_rule]
+    )
+    return _replace_annon_terminals(grammar)
+
+
 class HgvsParser:
     """
     HGVS parser object.
     """
 
-    def __init__(self, grammar_path=None, start_rule=None, ignore_white_spaces=True):
+    def __init__(
+        self,
+        grammar_path=None,
+        start_rule=None,
+        ignore_white_spaces=True,
+        dispatch=True,
+        use_precompiled=True,
+    ):
         """
         :arg str grammar_path: Path to a different EBNF grammar file.
         :arg str start_rule: Alternative start rule for the grammar.
         :arg bool ignore_white_spaces: Ignore or not white spaces in the description.
+        :arg bool dispatch: Parse the descriptions with a DNA or protein only
+            grammar, based on their coordinate system, when possible.
+        :arg bool use_precompiled: Use the precompiled default grammar tables,
+            when up to date, instead of compiling the grammar files.
         """
+        self._options = (
+            grammar_path,
+            start_rule,
+            ignore_white_spaces,
+            dispatch,
+            use_precompiled,
+        )
         self._grammar_path = grammar_path
         self._start_rule = start_rule
         self._ignore_whitespaces = ignore_white_spaces
+        self._prescan = (
+            COORDINATE_SYSTEM_PRESCAN
+            if ignore_white_spaces
+            else COORDINATE_SYSTEM_PRESCAN_NO_WHITE_SPACES
+        )
+        self._use_precompiled = use_precompiled
+        self._dispatch = (
+            dispatch and grammar_path is None and start_rule in (None, "description")
+        )
         self._create_parser()
 
     def _create_parser(self):
         if self._grammar_path:
             with open(self._grammar_path) as grammar_file:
-                grammar = grammar_file.read()
+                grammar = self._add_ignore(grammar_file.read())
         else:
-            grammar = _read_grammar_file("top.g")
-            grammar += _read_grammar_file("dna.g")
-            grammar += _read_grammar_file("protein.g")
-            grammar += _read_grammar_file("reference.g")
-            grammar += _read_grammar_file("common.g")
-            grammar = _replace_annon_terminals(grammar)
+            grammar = self._default_grammar()
 
         start_rule = self._start_rule if self._start_rule else "description"
 
+        self._grammar = grammar
+        self._start = start_rule
+        self._parser = self._lark(self._grammar, start_rule, "explicit")
+        self._recognizer = None
+        self._sub_parsers = {}
+
+    def _default_grammar(self, start_rule="description"):
+        if self._use_precompiled:
+            # The precompiled tables cover all the start rules.
+            grammar = precompiled.load(self._ignore_whitespaces)
+            if grammar is not None:
+                return grammar
+        return self._add_ignore(_default_grammar(start_rule))
+
+    def _add_ignore(self, grammar):
         if self._ignore_whitespaces:
             grammar += "\n%import common.WS\n%ignore WS"
+        return grammar
+
+    def _lark(self, grammar, start_rule, ambiguity):
+        recorder = instrumentation.recorder
+        if recorder is None:
+            return Lark(grammar, parser="earley", start=start_rule, ambiguity=ambiguity)
+        with recorder.record() as record:
+            return recorder.time(
+                record,
+                "compile",
+                Lark,
+                grammar,
+                parser="earley",
+                start=start_rule,
+                ambiguity=ambiguity,
+            )
 
-        self._parser = Lark(
-            grammar, parser="earley", start=start_rule, ambiguity="explicit"
-        )
+    def _create_recognizer(self):
+        # With the "forest" ambiguity option lark stops after the Earley
+        # chart (and its shared packed parse forest) is built and returns the
+        # forest root, i.e., no tree is created, and no ambiguity is solved.
+        self._recognizer = self._lark(self._grammar, self._start, "forest")
+
+    def _sub_parser(self, start_rule, ambiguity):
+        key = (start_rule, ambiguity)
+        if key not in self._sub_parsers:
+            grammar = self._default_grammar(start_rule)
+            self._sub_parsers[key] = self._lark(grammar, start_rule, ambiguity)
+        return self._sub_parsers[key]
+
+    def _dispatch_rule(self, description):
+        """
+        Cheap pre-scan to select the DNA or the protein only grammar. The
+        coordinate system excludes the other grammar, such that the syntax
+        errors are also the same as with the complete grammar.
+        """
+        if self._dispatch:
+            match = self._prescan.match(description)
+            if match:
+                if match.group(1) == "p":
+                    return "description_protein"
+                return "description_dna"
 
     def parse(self, description):
         """
@@ -667,14 +771,67 @@ class HgvsParser:
         :returns: A parse tree.
         :rtype: lark.Tree
         """
+        start_rule = self._dispatch_rule(description)
+        if start_rule:
+            parser = self._sub_parser(start_rule, "explicit")
+        else:
+            parser = self._parser
         try:
-            parse_tree = self._parser.parse(description)
+            parse_tree = parser.parse(description)
         except UnexpectedCharacters as e:
             raise UnexpectedCharacter(e, description)
         except UnexpectedEOF as e:
             raise UnexpectedEnd(e, description)
+        if start_rule:
+            return Tree("description", [parse_tree])
         return parse_tree
 
+    def validate(self, description):
+        """
+        Check the syntax of the provided description, without building
+        a parse tree.
+
+        :arg str description: An HGVS description.
+        :raises UnexpectedCharacter: If an unexpected character is found.
+        :raises UnexpectedEnd: If the description ends unexpectedly.
+        """
+        start_rule = self._dispatch_rule(description)
+        if start_rule:
+            recognizer = self._sub_parser(start_rule, "forest")
+        else:
+            if self._recognizer is None:
+                self._create_recognizer()
+            recognizer = self._recognizer
+        try:
+            recognizer.parse(description)
+        except UnexpectedCharacters as e:
+            raise UnexpectedCharacter(e, description)
+        except UnexpectedEOF as e:
+            raise UnexpectedEnd(e, description)
+
+    def __reduce__(self):
+        """
+        Only the options and the grammar hash are pickled. The parser is
+        taken from the registry, or created, when unpickled.
+        """
+        return _unpickle_parser, self._options + (_grammar_hash(self._grammar_path),)
+
+    def prewarm(self, validate=True):
+        """
+        Create the parts that are otherwise created on their first use: the
+        coordinate system dispatch sub-parsers and, with `validate`, the
+        syntax check recognizers.
+
+        :arg bool validate: Also create the syntax check recognizers.
+        """
+        if self._dispatch:
+            for start_rule in ["description_dna", "description_protein"]:
+                self._sub_parser(start_rule, "explicit")
+                if validate:
+                    self._sub_parser(start_rule, "forest")
+        if validate and self._recognizer is None:
+            self._create_recognizer()
+
     def status(self):
         """
         Print parser's status information.
@@ -694,6 +851,94 @@ class HgvsParser:
             )
 
 
+_PARSERS = {}
+
+_GRAMMAR_HASHES = {}
+
+
+def _grammar_hash(grammar_path=None):
+    """
+    Hash of the default grammar, or of the grammar file, computed once.
+    """
+    if grammar_path not in _GRAMMAR_HASHES:
+        if grammar_path is None:
+            grammar = _default_grammar()
+        else:
+            with open(grammar_path) as grammar_file:
+                grammar = grammar_file.read()
+        _GRAMMAR_HASHES[grammar_path] = precompiled.grammar_hash(grammar)
+    return _GRAMMAR_HASHES[grammar_path]
+
+
+def _unpickle_parser(
+    grammar_path,
+    start_rule,
+    ignore_white_spaces,
+    dispatch,
+    use_precompiled,
+    pickled_hash,
+):
+    """
+    Get the parser from the registry (see `get_parser()`), or create it for
+    non default options.
+
+    :raises ValueError: If the grammar differs from the pickled one.
+    """
+    if _grammar_hash(grammar_path) != pickled_hash:
+        raise ValueError(
+            "The grammar (or the lark version) differs from the pickled parser one."
+        )
+    if dispatch and use_precompiled:
+        return get_parser(grammar_path, start_rule, ignore_white_spaces)
+    return HgvsParser(
+        grammar_path, start_rule, ignore_white_spaces, dispatch, use_precompiled
+    )
+
+
+def get_parser(grammar_path=None, start_rule=None, ignore_white_spaces=True):
+    """
+    Get the parser for the provided arguments. Parsers are created only
+    once and reused afterwards.
+
+    :arg str grammar_path: Path towards a different grammar file.
+    :arg str start_rule: Alternative start rule for the grammar.
+    :arg bool ignore_white_spaces: Ignore or not white spaces in the description.
+    :returns: Parser object.
+    :rtype: HgvsParser
+    """
+    key = (grammar_path, start_rule, ignore_white_spaces)
+    if key not in _PARSERS:
+        _PARSERS[key] = HgvsParser(grammar_path, start_rule, ignore_white_spaces)
+    return _PARSERS[key]
+
+
+def prewarm(start_rules=(None,), validate=True, freeze=True):
+    """
+    Create the parsers for the start rules, completely, e.g., in the parent
+    of prefork worker processes, such that the workers share them (copy on
+    write) instead of creating their own.
+
+    With `freeze`, the objects tracked by the garbage collector are then
+    moved to its permanent generation (`gc.freeze()`), such that collections
+    in the workers do not touch (and copy) their memory pages.
+
+    :arg iterable start_rules: Start rules (None for the descriptions).
+    :arg bool validate: Also create the syntax check recognizers.
+    :arg bool freeze: Freeze the garbage collector objects.
+    :returns: The parsers.
+    :rtype: list
+    """
+    parsers = []
+    for start_rule in start_rules:
+        parser = get_parser(start_rule=start_rule)
+        parser.prewarm(validate)
+        parsers.append(parser)
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return parsers
+
+
 def parse(description, grammar_path=None, start_rule=None):
     """
     Parse the provided HGVS `description`, or the description part,
@@ -706,10 +951,80 @@ def parse(description, grammar_path=None, start_rule=None):
     :returns: Parse tree.
     :rtype: lark.Tree
     """
-    parser = HgvsParser(grammar_path, start_rule)
+    parser = get_parser(grammar_path, start_rule)
+
+    recorder = instrumentation.recorder
+    if recorder is not None:
+        return _parse_instrumented(parser, description, recorder)
+
+    return transform(parser.parse(description))
+
 
+def transform(parse_tree):
+    """
+    Apply the protein, ambiguities solving, and final transformers to a
+    raw parse tree, as obtained with `HgvsParser.parse()`.
+
+    :arg lark.Tree parse_tree: Raw parse tree.
+    :returns: Parse tree.
+    :rtype: lark.Tree
+    """
     return FinalTransformer().transform(
-        AmbigTransformer().transform(
-            ProteinTransformer().transform(parser.parse(description))
-        )
+        AmbigTransformer().transform(ProteinTransformer().transform(parse_tree))
     )
+
+
+def _parse_instrumented(parser, description, recorder):
+    """
+    Same as `parse()`, but recording the time spent in each stage.
+    """
+    with recorder.record() as record:
+        parse_tree = recorder.time(record, "parse", parser.parse, description)
+        parse_tree = recorder.time(
+            record, "protein", ProteinTransformer().transform, parse_tree
+        )
+        ambig_transformer = AmbigTransformer()
+        parse_tree = recorder.time(
+            record, "ambig", ambig_transformer.transform, parse_tree
+        )
+        record["ambiguities"] = ambig_transformer.solved
+        return recorder.time(record, "final", FinalTransformer().transform, parse_tree)
+
+
+def is_valid(description, grammar_path=None, start_rule=None):
+    """
+    Check if the provided HGVS `description` (or description part) is
+    syntactically valid. No parse tree is built and no ambiguities are solved.
+
+    :arg str description: Description (or description part) to be checked.
+    :arg str grammar_path: Path towards a different grammar file.
+    :arg str start_rule: Alternative start rule for the grammar.
+    :returns: True if the description can be parsed, False otherwise.
+    :rtype: bool
+    """
+    try:
+        get_parser(grammar_path, start_rule).validate(description)
+    except (UnexpectedCharacter, UnexpectedEnd):
+        return False
+    return True
+
+
+def validate_many(descriptions, grammar_path=None, start_rule=None):
+    """
+    Check the syntax of multiple descriptions, without building parse trees.
+
+    :arg iterable descriptions: Descriptions (or description parts) to be checked.
+    :arg str grammar_path: Path towards a different grammar file.
+    :arg str start_rule: Alternative start rule for the grammar.
+    :returns: For each description, in order, `None` if it is valid, or
+        the `UnexpectedCharacter` / `UnexpectedEnd` error otherwise.
+    :rtype: generator
+    """
+    parser = get_parser(grammar_path, start_rule)
+    for description in descriptions:
+        try:
+            parser.validate(description)
+        except (UnexpectedCharacter, UnexpectedEnd) as e:
+            yield e
+        else:
+            yield None
@@ -0,0 +1,223 @@
+"""
+Module for converting the HGVS descriptions in a column of tab (or other
+delimiter) separated files, or in an INFO field of VCF files (e.g.,
+`HGVSc=...`), in a single pass, with the other columns passed through
+untouched. The output formats are:
+
+- "json": the descriptions are replaced, in place, by their compact JSON
+  models, or errors (see `output.render()`);
+- "tsv": one row per variant (or error), with the input columns followed by
+  the variant columns (see `output.TSV_COLUMNS`).
+
+The columns of delimiter separated files are read and written with the
+`csv` quoting rules, e.g., the JSON values are quoted. The INFO values are
+percent decoded, and the JSON values are percent encoded (";", ",", "=",
+and "%"), as in the VCF specification.
+
+The meta-information lines, i.e., starting with "##", are passed through,
+as is the header line, if any, which is extended with the variant column
+names for "tsv". Lines without a description are passed through as well.
+"""
+
+import csv
+import functools
+import io
+from urllib.parse import unquote
+
+from . import parallel
+from .output import TSV_COLUMNS, render, tsv_description_rows
+
+FORMATS = ["json", "tsv"]
+
+# Index of the INFO column in VCF files.
+VCF_INFO_COLUMN = 7
+
+# Characters with a special meaning in the INFO values.
+_INFO_ENCODING = str.maketrans({"%": "%25", ";": "%3B", ",": "%2C", "=": "%3D"})
+
+
+def _info_encode(value):
+    return value.translate(_INFO_ENCODING)
+
+
+class FieldConverter:
+    """
+    Converts the descriptions of the lines written to it.
+    """
+
+    def __init__(
+        self,
+        output,
+        column=None,
+        info_key=None,
+        delimiter="\t",
+        output_format="json",
+        header=False,
+        start_rule=None,
+    ):
+        """
+        :arg output: Text file like object.
+        :arg int column: Index (0 based) of the descriptions column, by
+            default the VCF INFO column if `info_key` is provided.
+        :arg str info_key: Key of the descriptions in the INFO like column,
+            i.e., `key=value` items separated by ";". Multiple descriptions
+            are separated by ",", and percent encoded.
+        :arg str delimiter: Columns delimiter.
+        :arg str output_format: Output format (see `FORMATS`).
+        :arg bool header: The first line (after the "##" lines) is a header.
+        :arg str start_rule: Alternative start rule.
+        """
+        if column is None and info_key is None:
+            raise ValueError("A column or an INFO key is required.")
+        if output_format not in FORMATS:
+            raise ValueError(
+                "Unknown output format '{}', expected one of: {}.".format(
+                    output_format, ", ".join(FORMATS)
+                )
+            )
+        self.column = VCF_INFO_COLUMN if column is None else column
+        self.info_key = info_key
+        self.delimiter = delimiter
+        self.output_format = output_format
+        self.start_rule = start_rule
+        self.counts = {"converted": 0, "errors": 0, "skipped": 0}
+        self._header = header
+        self._write = output.write
+        if info_key is None:
+            self._writer = csv.writer(
+                output, delimiter=delimiter, lineterminator="\n"
+            )
+
+    def _descriptions(self, fields):
+        """
+        :returns: The descriptions, and the item index in the INFO like
+            column, or None if there are no descriptions.
+        :rtype: tuple
+        """
+        if self.column >= len(fields):
+            return None
+        value = fields[self.column]
+        if self.info_key is None:
+            return ([value.strip()], None) if value.strip() else None
+        for index, item in enumerate(value.split(";")):
+            key, _, descriptions = item.partition("=")
+            if key == self.info_key and descriptions.strip():
+                return [unquote(d).strip() for d in descriptions.split(",")], index
+        return None
+
+    def _replace(self, fields, item_index, values):
+        fields = list(fields)
+        if item_index is None:
+            fields[self.column] = ",".join(values)
+        else:
+            items = fields[self.column].split(";")
+            items[item_index] = "{}={}".format(
+                self.info_key, ",".join(_info_encode(value) for value in values)
+            )
+            fields[self.column] = ";".join(items)
+        return fields
+
+    def _split(self, line):
+        if self.info_key is None:
+            return next(csv.reader([line], delimiter=self.delimiter))
+        return line.split(self.delimiter)
+
+    def _write_fields(self, fields):
+        if self.info_key is None:
+            self._writer.writerow(fields)
+        else:
+            self._write(self.delimiter.join(fields) + "\n")
+
+    def write_line(self, line):
+        """
+        Convert and write a line.
+
+        :arg str line: Input line.
+        """
+        line = line.rstrip("\r\n")
+        if line.startswith("##"):
+            self._write(line + "\n")
+            return
+        fields = self._split(line)
+        if self._header:
+            self._header = False
+            if self.output_format == "tsv":
+                fields += TSV_COLUMNS[1:]
+            self._write_fields(fields)
+            return
+        descriptions = self._descriptions(fields)
+        if descriptions is None:
+            self.counts["skipped"] += 1
+            if self.output_format == "tsv":
+                fields += [""] * (len(TSV_COLUMNS) - 1)
+            self._write_fields(fields)
+            return
+        descriptions, item_index = descriptions
+        if self.output_format == "json":
+            values = []
+            for description in descriptions:
+                rendered, converted = render(description, self.start_rule)
+                self.counts["converted" if converted else "errors"] += 1
+                values.append(rendered.decode())
+            self._write_fields(self._replace(fields, item_index, values))
+        else:
+            for description in descriptions:
+                rows, converted = tsv_description_rows(description, self.start_rule)
+                self.counts["converted" if converted else "errors"] += 1
+                if not rows:
+                    self._write_fields(fields + [""] * (len(TSV_COLUMNS) - 1))
+                for row in rows:
+                    self._write_fields(fields + [str(value) for value in row[1:]])
+
+    def write_lines(self, lines):
+        for line in lines:
+            self.write_line(line)
+
+
+def _convert_lines(lines, output, first, **options):
+    """
+    Convert lines (bytes), e.g., a range for `parallel`, with a header only
+    in the first range.
+    """
+    text_output = io.TextIOWrapper(output, encoding="utf-8", newline="")
+    if not first:
+        options["header"] = False
+    converter = FieldConverter(text_output, **options)
+    converter.write_lines(line.decode() for line in lines)
+    text_output.flush()
+    text_output.detach()
+    return converter.counts
+
+
+def lines_converter(**options):
+    """
+    :arg options: `FieldConverter` options.
+    :returns: A picklable `convert(lines, output, first)` function, for
+        `parallel` and `checkpoint`.
+    :rtype: callable
+    """
+    return functools.partial(_convert_lines, **options)
+
+
+def convert_file(
+    file_path, output, processes=1, chunk_size=parallel.CHUNK_SIZE, **options
+):
+    """
+    Convert the descriptions of a file, with multiple processes if
+    `processes` is larger than one (see `parallel`).
+
+    :arg str file_path: Path to the input file.
+    :arg output: Binary file like object, e.g., `sys.stdout.buffer`.
+    :arg int processes: Number of worker processes.
+    :arg int chunk_size: Approximate range size, in bytes (with processes).
+    :arg options: `FieldConverter` options.
+    """
+    convert = lines_converter(**options)
+    if processes > 1:
+        for rendered in parallel.convert_file(
+            file_path, processes, chunk_size=chunk_size, convert=convert
+        ):
+            output.write(rendered)
+    else:
+        with open(file_path, "rb") as input_file:
+            convert(input_file, output, True)
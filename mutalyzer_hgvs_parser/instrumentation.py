@@ -0,0 +1,211 @@
+"""
+Opt-in per stage timing instrumentation for the parse/convert pipeline.
+
+The recorded stages are:
+
+- `compile`: grammar compilation (lark parser construction);
+- `parse`: the lark (Earley) parsing;
+- `protein`, `ambig`, `final`: the `ProteinTransformer`, `AmbigTransformer`,
+  and `FinalTransformer` passes;
+- `convert`: the `convert.Converter` pass.
+
+Additionally, `ambiguities` holds the number of solved ambiguities per parse.
+
+The stages of one call, e.g., of `to_model()`, including the grammar
+compilation on first use, are recorded in the same record. The calls that
+raise an exception, e.g., a syntax error, are recorded as well, with the
+exception type name as `error`.
+
+When no recorder is enabled the pipeline only checks a module attribute.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+STAGES = ["compile", "parse", "protein", "ambig", "final", "convert"]
+
+TIME_BUCKETS = [
+    0.00001,
+    0.00005,
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1,
+    5,
+]
+
+COUNT_BUCKETS = [0, 1, 2, 4, 8, 16, 32, 64]
+
+recorder = None
+
+clock = time.perf_counter
+
+
+class Histogram:
+    """
+    Fixed buckets histogram. A value falls in the first bucket with its
+    upper bound greater than or equal to it, or in the overflow bucket.
+    """
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def quantile(self, q):
+        """
+        Approximate quantile, as the upper bound of the bucket in which it falls.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": [
+                {"le": bound, "count": count}
+                for bound, count in zip(self.bounds + [None], self.counts)
+            ],
+        }
+
+
+class Recorder:
+    """
+    Aggregates the stage timings (in seconds) and ambiguity counts.
+    """
+
+    def __init__(self, callback=None):
+        """
+        :arg callable callback: Called with the record of each call,
+            e.g., `{"parse": 0.01, "protein": 0.001, ..., "ambiguities": 2}`.
+        """
+        self.callback = callback
+        self.histograms = {stage: Histogram(TIME_BUCKETS) for stage in STAGES}
+        self.histograms["ambiguities"] = Histogram(COUNT_BUCKETS)
+        # The record of the current (outermost) call, per thread.
+        self._local = threading.local()
+
+    @contextmanager
+    def record(self):
+        """
+        Record of a call, added when the call returns or raises (with the
+        exception type name as `error`). The records of the nested calls,
+        e.g., the parsing in `to_model()`, are the record of the outermost
+        one.
+
+        :returns: The record.
+        :rtype: dict
+        """
+        record = getattr(self._local, "record", None)
+        if record is not None:
+            yield record
+            return
+        record = self._local.record = {}
+        try:
+            yield record
+        except Exception as e:
+            record["error"] = type(e).__name__
+            raise
+        finally:
+            self._local.record = None
+            self.add(record)
+
+    def time(self, record, stage, function, *args, **kwargs):
+        """
+        Call `function`, adding the time spent in it to `record`, as `stage`
+        (summed, if `stage` is timed more than once in the call).
+        """
+        start = clock()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            record[stage] = record.get(stage, 0) + clock() - start
+
+    def add(self, record):
+        for stage in record:
+            if stage in self.histograms:
+                self.histograms[stage].add(record[stage])
+        if self.callback is not None:
+            self.callback(record)
+
+    def summary(self):
+        """
+        :returns: The histograms summaries per stage.
+        :rtype: dict
+        """
+        return {
+            stage: self.histograms[stage].summary()
+            for stage in self.histograms
+            if self.histograms[stage].count
+        }
+
+
+def enable(callback=None, new_recorder=None):
+    """
+    Start recording, with a fresh recorder.
+
+    :arg callable callback: Called with the record of each call.
+    :arg Recorder new_recorder: Recorder to use instead of a fresh one.
+    :returns: The new recorder.
+    :rtype: Recorder
+    """
+    global recorder
+    recorder = new_recorder if new_recorder is not None else Recorder(callback)
+    return recorder
+
+
+def disable():
+    """
+    Stop recording.
+
+    :returns: The recorder that was used, if any.
+    :rtype: Recorder
+    """
+    global recorder
+    previous, recorder = recorder, None
+    return previous
+
+
+@contextmanager
+def recording(callback=None, new_recorder=None):
+    """
+    Context manager to record only within a block.
+    """
+    new_recorder = enable(callback, new_recorder)
+    try:
+        yield new_recorder
+    finally:
+        disable()
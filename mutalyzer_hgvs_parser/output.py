@@ -0,0 +1,340 @@
+"""
+Module for writing the models, as compact JSON lines or as tab separated
+values (one row per variant), e.g., in batch mode.
+
+The JSON encoding uses `orjson` when installed, falling back to the standard
+library otherwise, and for the models `orjson` cannot encode (integers
+outside 64 bits), with identical (compact) output. The rendered JSON of the
+converted descriptions is cached, such that repeated descriptions are
+written without being converted and encoded again. The serialized errors of
+the invalid descriptions are cached separately (`ERROR_CACHE`), such that
+repeated invalid descriptions are not parsed again.
+"""
+
+import csv
+import json
+
+from .cache import ErrorCache, LRUCache
+from .columns import row_variants
+from .convert import to_model
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+JSON_CACHE = LRUCache()
+
+ERROR_CACHE = ErrorCache()
+
+
+def dumps(model, pretty=False):
+    """
+    Encode a model as JSON.
+
+    :arg model: Model (dict, list, or str).
+    :arg bool pretty: Indent with two spaces instead of the compact output.
+    :returns: UTF-8 encoded JSON.
+    :rtype: bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(model, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except orjson.JSONEncodeError:
+            pass
+    if pretty:
+        return json.dumps(model, indent=2, ensure_ascii=False).encode()
+    return _ENCODER.encode(model).encode()
+
+
+def to_json(description, start_rule=None):
+    """
+    Convert a description to its compact JSON model, using the cache.
+
+    :arg str description: HGVS description.
+    :arg str start_rule: Alternative start rule.
+    :returns: UTF-8 encoded JSON.
+    :rtype: bytes
+    """
+    key = (description, start_rule)
+    rendered = JSON_CACHE.get(key)
+    if rendered is None:
+        try:
+            model = to_model(description, start_rule)
+        except Exception as e:
+            ERROR_CACHE.put(key, error_to_dict(description, e))
+            raise
+        rendered = dumps(model)
+        JSON_CACHE.put(key, rendered)
+    return rendered
+
+
+def cached_error(description, start_rule=None):
+    """
+    :returns: The serialized error (see `error_to_dict()`) if the
+        description is a cached invalid description, None otherwise.
+    :rtype: dict
+    """
+    return ERROR_CACHE.get((description, start_rule))
+
+
+def error_to_dict(description, error):
+    """
+    :returns: The error, serialized when supported, and the description.
+    :rtype: dict
+    """
+    output = {"input_description": description, "type": type(error).__name__}
+    if hasattr(error, "serialize"):
+        output["details"] = error.serialize()
+    else:
+        output["message"] = str(error)
+    return output
+
+
+def render(description, start_rule=None):
+    """
+    Convert a description to its compact JSON model, or to its compact JSON
+    errors (`{"errors": [...]}`), using the caches.
+
+    :arg str description: HGVS description.
+    :arg str start_rule: Alternative start rule.
+    :returns: UTF-8 encoded JSON, and True if the description was
+        converted, False otherwise.
+    :rtype: tuple
+    """
+    error = cached_error(description, start_rule)
+    if error is None:
+        try:
+            return to_json(description, start_rule), True
+        except Exception as e:
+            error = cached_error(description, start_rule)
+            if error is None:
+                error = error_to_dict(description, e)
+    return dumps({"errors": [error]}), False
+
+
+class JsonLinesWriter:
+    """
+    Writes one compact JSON document per line into a binary output.
+    """
+
+    def __init__(self, output):
+        """
+        :arg output: Binary file like object, e.g., `sys.stdout.buffer`.
+        """
+        self._write = output.write
+
+    def write(self, model):
+        self._write(dumps(model) + b"\n")
+
+    def write_rendered(self, rendered):
+        """
+        Write already encoded JSON, e.g., from `to_json()`.
+        """
+        self._write(rendered + b"\n")
+
+    def write_description(self, description, start_rule=None):
+        """
+        Convert and write a description, or its error.
+
+        :returns: True if the description was converted, False otherwise.
+        :rtype: bool
+        """
+        rendered, converted = render(description, start_rule)
+        self.write_rendered(rendered)
+        return converted
+
+
+TSV_COLUMNS = [
+    "input_description",
+    "reference",
+    "selector",
+    "coordinate_system",
+    "type",
+    "start",
+    "start_offset",
+    "start_uncertain",
+    "end",
+    "end_offset",
+    "end_uncertain",
+    "deleted",
+    "inserted",
+    "predicted",
+    "error",
+]
+
+_OUTSIDE_CDS = {"upstream": "-", "downstream": "*"}
+
+
+def _selector(reference):
+    """
+    The nested selectors, e.g., "R2(R3)" for "R1(R2(R3))".
+    """
+    selector = reference.get("selector")
+    if selector is None:
+        return ""
+    nested = _selector(selector)
+    return "{}({})".format(selector["id"], nested) if nested else selector["id"]
+
+
+def _point(point):
+    """
+    The position (HGVS like, e.g., "*10"), offset, and uncertain flag.
+    """
+    position = point.get("position")
+    if position is None:
+        position = ""
+    else:
+        outside_cds = _OUTSIDE_CDS.get(point.get("outside_cds"), "")
+        position = "{}{}".format(outside_cds, position)
+    offset = point.get("offset")
+    if offset is None:
+        offset = ""
+    elif offset.get("downstream"):
+        offset = "+?"
+    elif offset.get("upstream"):
+        offset = "-?"
+    elif offset.get("uncertain"):
+        offset = "?"
+    else:
+        offset = "{:+d}".format(offset["value"])
+    return position, offset, int(bool(point.get("uncertain")))
+
+
+def _bounds(location):
+    if location is None:
+        return ("", "", 0), ("", "", 0)
+    if location.get("type") != "range":
+        bound = _point(location)
+        return bound, bound
+    bounds = []
+    for bound in location["start"], location["end"]:
+        if bound.get("type") == "point":
+            position, offset, uncertain = _point(bound)
+        else:
+            # Uncertain range bound, e.g., "(10_20)_30".
+            position, offset, uncertain = "", "", 1
+        if location.get("uncertain"):
+            uncertain = 1
+        bounds.append((position, offset, uncertain))
+    return bounds
+
+
+def _sequence(items):
+    """
+    The sequence, if the items are only plain sequences from the description,
+    an empty string otherwise.
+    """
+    if not items:
+        return ""
+    sequence = []
+    for item in items:
+        if item.keys() - {"sequence", "source"} or "sequence" not in item:
+            return ""
+        sequence.append(item["sequence"])
+    return "".join(sequence)
+
+
+def tsv_rows(description, model):
+    """
+    :returns: The rows (see `TSV_COLUMNS`), one per variant, or one with
+        empty variant columns if there are no variants (e.g., "R1:c.=").
+    :rtype: list
+    """
+    reference = model["reference"]
+    prefix = [
+        description,
+        reference["id"],
+        _selector(reference),
+        model.get("coordinate_system", ""),
+    ]
+    rows = []
+    for variant, predicted in row_variants(model):
+        start, end = _bounds(variant.get("location"))
+        rows.append(
+            prefix
+            + [variant.get("type", "")]
+            + list(start)
+            + list(end)
+            + [
+                _sequence(variant.get("deleted")),
+                _sequence(variant.get("inserted")),
+                int(predicted),
+                "",
+            ]
+        )
+    return rows
+
+
+def tsv_error_row(description, error_type):
+    """
+    :returns: The row (see `TSV_COLUMNS`) for an error.
+    :rtype: list
+    """
+    return [description] + [""] * (len(TSV_COLUMNS) - 2) + [error_type]
+
+
+def tsv_description_rows(description, start_rule=None):
+    """
+    Convert a description to its rows (see `TSV_COLUMNS`), or to its error
+    row, using the errors cache.
+
+    :arg str description: HGVS description.
+    :arg str start_rule: Alternative start rule.
+    :returns: The rows, and True if the description was converted, False
+        otherwise.
+    :rtype: tuple
+    """
+    error = cached_error(description, start_rule)
+    if error is not None:
+        return [tsv_error_row(description, error["type"])], False
+    try:
+        model = to_model(description, start_rule)
+    except Exception as e:
+        ERROR_CACHE.put((description, start_rule), error_to_dict(description, e))
+        return [tsv_error_row(description, type(e).__name__)], False
+    try:
+        return tsv_rows(description, model), True
+    except Exception as e:
+        return [tsv_error_row(description, type(e).__name__)], False
+
+
+class TsvWriter:
+    """
+    Writes tab separated values, with one row per variant, and one row per
+    error (with only the input description and the error type).
+    """
+
+    def __init__(self, output, header=True):
+        """
+        :arg output: Text file like object, e.g., `sys.stdout`.
+        :arg bool header: Write the columns header.
+        """
+        self._writer = csv.writer(output, delimiter="\t", lineterminator="\n")
+        if header:
+            self._writer.writerow(TSV_COLUMNS)
+
+    def write(self, description, model):
+        self._writer.writerows(tsv_rows(description, model))
+
+    def write_error(self, description, error):
+        self._writer.writerow(tsv_error_row(description, type(error).__name__))
+
+    def write_rows(self, rows):
+        """
+        Write already converted rows, e.g., from `tsv_description_rows()`.
+        """
+        self._writer.writerows(rows)
+
+    def write_description(self, description, start_rule=None):
+        """
+        Convert and write a description, or its error.
+
+        :returns: True if the description was converted, False otherwise.
+        :rtype: bool
+        """
+        rows, converted = tsv_description_rows(description, start_rule)
+        self._writer.writerows(rows)
+        return converted
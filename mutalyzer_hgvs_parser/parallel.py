@@ -0,0 +1,214 @@
+"""
+Module for converting large description files (one description per line)
+with multiple processes.
+
+The file is memory mapped and split into newline aligned byte ranges. Only
+the ranges are sent to the worker processes, which read, decode, and
+convert their own range into compact JSON lines (see `output`), or with
+another (picklable) `convert(lines, output, first)` function, e.g.,
+`tsv_lines()`, or from `ingest`, which may return its summary counts. The
+results are merged in order, or written by the workers to one shard file
+per range.
+"""
+
+import functools
+import io
+import mmap
+import multiprocessing
+import os
+
+from .batch import Deduplicator
+from .output import JsonLinesWriter, TsvWriter, render, tsv_description_rows
+
+# Default range size, in bytes.
+CHUNK_SIZE = 1 << 22
+
+
+def chunk_ranges(file_path, chunk_size=CHUNK_SIZE, start=0):
+    """
+    Split a file into newline aligned byte ranges.
+
+    :arg str file_path: Path to the file.
+    :arg int chunk_size: Approximate range size, in bytes.
+    :arg int start: Offset of the first range, at a line start.
+    :returns: The (start, end) byte ranges, covering the file from `start`.
+    :rtype: list
+    """
+    size = os.path.getsize(file_path)
+    if start >= size:
+        return []
+    ranges = []
+    with open(file_path, "rb") as input_file:
+        with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            while start < size:
+                end = data.find(b"\n", min(start + chunk_size, size) - 1)
+                end = size if end == -1 else end + 1
+                ranges.append((start, end))
+                start = end
+    return ranges
+
+
+def json_lines(lines, output, first, start_rule=None, dedup_window=None):
+    """
+    Convert lines with one description each to compact JSON lines.
+
+    :arg list lines: Lines (bytes, without the line ends).
+    :arg output: Binary file like object.
+    :arg bool first: The lines are the first ones of the file.
+    :arg str start_rule: Alternative start rule.
+    :arg int dedup_window: Deduplicate the descriptions within a window of
+        this many unique descriptions (see `batch.Deduplicator`).
+    :returns: The number of converted descriptions and errors (and of
+        deduplicated descriptions, with `dedup_window`).
+    :rtype: dict
+    """
+    writer = JsonLinesWriter(output)
+    return _write_descriptions(
+        lines,
+        functools.partial(render, start_rule=start_rule),
+        lambda description, rendered: writer.write_rendered(rendered),
+        dedup_window,
+    )
+
+
+def tsv_lines(lines, output, first, start_rule=None, dedup_window=None):
+    """
+    Convert lines with one description each to tab separated values (see
+    `output.TsvWriter`), with the header only for the first lines.
+
+    :arg list lines: Lines (bytes, without the line ends).
+    :arg output: Binary file like object.
+    :arg bool first: The lines are the first ones of the file.
+    :arg str start_rule: Alternative start rule.
+    :arg int dedup_window: Deduplicate the descriptions within a window of
+        this many unique descriptions (see `batch.Deduplicator`).
+    :returns: The number of converted descriptions and errors (and of
+        deduplicated descriptions, with `dedup_window`).
+    :rtype: dict
+    """
+    text_output = io.TextIOWrapper(output, encoding="utf-8", newline="")
+    writer = TsvWriter(text_output, first)
+    counts = _write_descriptions(
+        lines,
+        functools.partial(tsv_description_rows, start_rule=start_rule),
+        # Fanned out rows get their own input description.
+        lambda description, rows: writer.write_rows(
+            [[description] + row[1:] for row in rows]
+        ),
+        dedup_window,
+    )
+    text_output.flush()
+    text_output.detach()
+    return counts
+
+
+def _write_descriptions(lines, convert, write, dedup_window):
+    """
+    :arg callable convert: Conversion of a description to its output, and
+        True if it was converted, False otherwise.
+    :arg callable write: Writes the output of a description.
+    """
+    descriptions = (line.decode().strip() for line in lines)
+    descriptions = (description for description in descriptions if description)
+    if dedup_window is None:
+        results = ((description, convert(description)) for description in descriptions)
+    else:
+        deduplicator = Deduplicator(dedup_window)
+        # The errors refer to the description positions.
+        results = deduplicator.map(convert, descriptions, lambda result: not result[1])
+    counts = {"converted": 0, "errors": 0}
+    for description, (converted_output, converted) in results:
+        write(description, converted_output)
+        counts["converted" if converted else "errors"] += 1
+    if dedup_window is not None:
+        counts["deduplicated"] = deduplicator.deduplicated
+    return counts
+
+
+def _convert_range(file_path, start, end, convert, output):
+    with open(file_path, "rb") as input_file:
+        with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            lines = data[start:end].split(b"\n")
+    if lines[-1] == b"":
+        lines.pop()
+    return convert(lines, output, start == 0)
+
+
+def _convert_to_bytes(arguments):
+    output = io.BytesIO()
+    _convert_range(*arguments, output)
+    return output.getvalue()
+
+
+def _convert_to_shard(arguments):
+    *arguments, shard_path = arguments
+    with open(shard_path, "wb") as output:
+        _convert_range(*arguments, output)
+    return shard_path
+
+
+def _converter(convert, start_rule):
+    if convert is None:
+        return functools.partial(json_lines, start_rule=start_rule)
+    return convert
+
+
+def convert_file(
+    file_path, processes=None, start_rule=None, chunk_size=CHUNK_SIZE, convert=None
+):
+    """
+    Convert a descriptions file, in parallel, to compact JSON lines.
+
+    :arg str file_path: Path to the descriptions file.
+    :arg int processes: Number of worker processes (default: CPU count).
+    :arg str start_rule: Alternative start rule.
+    :arg int chunk_size: Approximate range size, in bytes.
+    :arg callable convert: Ranges conversion (default: `json_lines()`).
+    :returns: For each range, in order, its JSON lines (one model, or
+        errors, per non empty line).
+    :rtype: generator
+    """
+    convert = _converter(convert, start_rule)
+    tasks = [
+        (file_path, start, end, convert)
+        for start, end in chunk_ranges(file_path, chunk_size)
+    ]
+    with multiprocessing.Pool(processes) as pool:
+        yield from pool.imap(_convert_to_bytes, tasks)
+
+
+def convert_file_to_shards(
+    file_path,
+    directory,
+    processes=None,
+    start_rule=None,
+    chunk_size=CHUNK_SIZE,
+    convert=None,
+):
+    """
+    Convert a descriptions file, in parallel, to compact JSON lines shard
+    files, one per range, named `part-00000.jsonl`, etc.
+
+    :arg str file_path: Path to the descriptions file.
+    :arg str directory: Output directory (created if missing).
+    :arg int processes: Number of worker processes (default: CPU count).
+    :arg str start_rule: Alternative start rule.
+    :arg int chunk_size: Approximate range size, in bytes.
+    :arg callable convert: Ranges conversion (default: `json_lines()`).
+    :returns: The shard file paths, in order.
+    :rtype: list
+    """
+    os.makedirs(directory, exist_ok=True)
+    convert = _converter(convert, start_rule)
+    tasks = [
+        (
+            file_path,
+            start,
+            end,
+            convert,
+            os.path.join(directory, "part-{:05d}.jsonl".format(index)),
+        )
+        for index, (start, end) in enumerate(chunk_ranges(file_path, chunk_size))
+    ]
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(_convert_to_shard, tasks)
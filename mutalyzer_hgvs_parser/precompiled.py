@@ -0,0 +1,184 @@
+"""
+Module for the precompiled (BNF) default grammar.
+
+Compiling the EBNF grammar (`ebnf/*.g`) is most of the time spent to create
+a parser. The build step below compiles it once, for all the rules as start
+rules, and writes the resulting terminals and rules as plain Python data to
+`grammar_tables.py`:
+
+    python scripts/build_grammar_tables.py
+
+At runtime `PrecompiledGrammar` hands these tables directly to lark, such that
+the grammar files are neither read nor compiled. The tables are used only if
+they were built from the current grammar files, with the installed lark
+version, otherwise the parser falls back to compiling the grammar.
+"""
+
+import hashlib
+import os
+from importlib.metadata import version
+
+from lark.grammar import NonTerminal, Rule, RuleOptions, Terminal
+from lark.lexer import PatternRE, PatternStr, TerminalDef
+from lark.load_grammar import Grammar, load_grammar
+
+TABLES_PATH = os.path.join(os.path.dirname(__file__), "grammar_tables.py")
+
+PATTERNS = {"str": PatternStr, "re": PatternRE}
+
+WHITE_SPACES = "\n%import common.WS\n%ignore WS"
+
+_tables = None
+
+
+def grammar_hash(grammar):
+    """
+    :arg str grammar: The (combined) EBNF grammar.
+    :returns: Hash of the grammar and the lark version.
+    :rtype: str
+    """
+    return hashlib.sha256((grammar + version("lark")).encode()).hexdigest()
+
+
+def _current_tables():
+    """
+    :returns: The `grammar_tables` module, if it is up to date, None otherwise.
+    """
+    global _tables
+    if _tables is None:
+        from .hgvs_parser import _default_grammar
+
+        try:
+            from . import grammar_tables
+        except ImportError:
+            _tables = False
+        else:
+            _tables = (
+                grammar_tables.GRAMMAR_HASH == grammar_hash(_default_grammar())
+                and grammar_tables
+            )
+    return _tables or None
+
+
+class PrecompiledGrammar(Grammar):
+    """
+    Lark grammar with the compilation output already available.
+    """
+
+    def __init__(self, tables, ignore_white_spaces=True):
+        self._tables = tables
+        self._ignore_white_spaces = ignore_white_spaces
+
+    def compile(self, start, terminals_to_keep):
+        # Lark may edit the output, so new objects are created for every call.
+        ignore = self._tables.IGNORE if self._ignore_white_spaces else []
+        terminals = [
+            TerminalDef(name, PATTERNS[kind](value, flags, raw), priority)
+            for name, kind, value, flags, raw, priority in self._tables.TERMINALS
+            if name not in self._tables.IGNORE or self._ignore_white_spaces
+        ]
+        rules = [
+            Rule(
+                NonTerminal(origin),
+                [
+                    Terminal(name, i in filtered) if name.isupper() else NonTerminal(name)
+                    for i, name in enumerate(expansion)
+                ],
+                order,
+                alias,
+                RuleOptions(keep_all_tokens, expand1, priority, None, empty_indices),
+            )
+            for (
+                origin,
+                expansion,
+                filtered,
+                order,
+                alias,
+                (keep_all_tokens, expand1, priority, empty_indices),
+            ) in self._tables.RULES
+        ]
+        return terminals, rules, list(ignore)
+
+
+def load(ignore_white_spaces=True):
+    """
+    Get the precompiled default grammar, to be passed to `lark.Lark`.
+
+    :arg bool ignore_white_spaces: Ignore or not white spaces in the description.
+    :returns: The precompiled grammar, or None if the tables are missing or
+        outdated.
+    :rtype: PrecompiledGrammar
+    """
+    tables = _current_tables()
+    if tables is not None:
+        return PrecompiledGrammar(tables, ignore_white_spaces)
+
+
+def _serialize_terminal(terminal):
+    pattern = terminal.pattern
+    return (
+        terminal.name,
+        pattern.type,
+        pattern.value,
+        tuple(sorted(pattern.flags)),
+        pattern.raw,
+        terminal.priority,
+    )
+
+
+def _serialize_rule(rule):
+    options = rule.options
+    if options.template_source is not None:
+        raise ValueError("Templates are not supported: {}".format(rule))
+    return (
+        str(rule.origin.name),
+        tuple(str(symbol.name) for symbol in rule.expansion),
+        tuple(
+            i
+            for i, symbol in enumerate(rule.expansion)
+            if symbol.is_term and symbol.filter_out
+        ),
+        rule.order,
+        rule.alias,
+        (
+            options.keep_all_tokens,
+            options.expand1,
+            options.priority,
+            tuple(options.empty_indices),
+        ),
+    )
+
+
+def build(output_path=TABLES_PATH):
+    """
+    Compile the default grammar and write the tables module.
+
+    :arg str output_path: Tables module output path.
+    """
+    from .hgvs_parser import _default_grammar
+
+    grammar = _default_grammar()
+    compiled, _ = load_grammar(grammar + WHITE_SPACES, "<string>", None, False)
+    start = [str(name) for name, *_ in compiled.rule_defs if not name.startswith("_")]
+    terminals, rules, ignore = compiled.compile(start, set())
+    for name in ignore:
+        if any(name in [s.name for s in rule.expansion] for rule in rules):
+            raise ValueError("Ignored terminal used in the grammar: {}".format(name))
+
+    with open(output_path, "w") as output_file:
+        output_file.write(
+            '"""\nPrecompiled grammar tables, generated by:\n\n'
+            "    python scripts/build_grammar_tables.py\n\n"
+            'Do not edit.\n"""\n\n'
+        )
+        output_file.write("GRAMMAR_HASH = {!r}\n\n".format(grammar_hash(grammar)))
+        output_file.write("IGNORE = {!r}\n\n".format([str(name) for name in ignore]))
+        output_file.write(
+            _format_list("TERMINALS", [_serialize_terminal(t) for t in terminals])
+        )
+        output_file.write("\n")
+        output_file.write(_format_list("RULES", [_serialize_rule(r) for r in rules]))
+
+
+def _format_list(name, items):
+    return "{} = [\n{}]\n".format(name, "".join(f"    {item!r},\n" for item in items))
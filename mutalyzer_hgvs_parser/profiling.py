@@ -0,0 +1,145 @@
+"""
+Module for profiling (cProfile) the parse/convert pipeline.
+
+Each pipeline stage (see `instrumentation`) is profiled separately, such
+that the collapsed stacks output, e.g., for `flamegraph.pl` or speedscope,
+attributes the time to the grammar compilation, lark, each transformer,
+and the converter.
+"""
+
+import cProfile
+import os
+import pstats
+from contextlib import contextmanager
+
+from . import instrumentation
+
+STAGE_LABELS = {
+    "compile": "grammar compile",
+    "parse": "lark parse",
+    "protein": "ProteinTransformer",
+    "ambig": "AmbigTransformer",
+    "final": "FinalTransformer",
+    "convert": "Converter",
+    None: "other",
+}
+
+MAX_DEPTH = 64
+
+# Stacks with less time (in microseconds) are dropped.
+MIN_TIME = 1
+
+
+class ProfilingRecorder(instrumentation.Recorder):
+    """
+    Recorder that also profiles each stage, with its own profiler.
+    """
+
+    def __init__(self, callback=None):
+        super().__init__(callback)
+        self.profiles = {stage: cProfile.Profile() for stage in STAGE_LABELS}
+        self._active = None
+
+    def time(self, record, stage, function, *args, **kwargs):
+        if self._active is not None:
+            # Nested stage: keep it in the enclosing profile.
+            return super().time(record, stage, function, *args, **kwargs)
+        self.profiles[None].disable()
+        self._active = stage
+        self.profiles[stage].enable()
+        try:
+            return super().time(record, stage, function, *args, **kwargs)
+        finally:
+            self.profiles[stage].disable()
+            self._active = None
+            self.profiles[None].enable()
+
+    def stats(self):
+        """
+        :returns: The merged statistics of all the stages.
+        :rtype: pstats.Stats
+        """
+        profiles = [p for p in self.profiles.values() if p.getstats()]
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return stats
+
+    def collapsed(self):
+        """
+        :returns: Collapsed stacks ("frame;frame;... microseconds"), with the
+            stage label as root frame.
+        :rtype: list
+        """
+        lines = []
+        for stage, profile in self.profiles.items():
+            if not profile.getstats():
+                continue
+            stacks = _collapsed_stacks(pstats.Stats(profile).stats)
+            for stack in sorted(stacks):
+                lines.append(
+                    "{};{} {}".format(STAGE_LABELS[stage], stack, stacks[stack])
+                )
+        return lines
+
+
+def _label(function):
+    file_name, line, name = function
+    if file_name == "~":
+        return name
+    return "{}:{}".format(os.path.basename(file_name), name)
+
+
+def _collapsed_stacks(stats):
+    """
+    Reconstruct the stacks from the (caller, callee) pairs in the cProfile
+    statistics. The own time of a function is split among its callers
+    proportionally to the cumulative time spent in each call site.
+    """
+    paths_cache = {}
+
+    def paths(function, visiting):
+        # (stack, fraction) pairs from a root to `function`.
+        if function in paths_cache:
+            return paths_cache[function]
+        callers = stats[function][4]
+        if not callers or function in visiting or len(visiting) > MAX_DEPTH:
+            return [([_label(function)], 1.0)]
+        total = sum(c[3] for c in callers.values())
+        output = []
+        for caller, (_, calls, _, cumulative) in callers.items():
+            share = cumulative / total if total else 1 / len(callers)
+            for stack, fraction in paths(caller, visiting | {function}):
+                output.append((stack + [_label(function)], fraction * share))
+        paths_cache[function] = output
+        return output
+
+    stacks = {}
+    for function, (_, _, own_time, _, _) in stats.items():
+        for stack, fraction in paths(function, frozenset()):
+            value = own_time * fraction * 1000000
+            if value >= MIN_TIME:
+                key = ";".join(stack)
+                stacks[key] = stacks.get(key, 0) + int(value)
+    return stacks
+
+
+@contextmanager
+def profile(output_path):
+    """
+    Profile the pipeline within a block, writing the cProfile statistics
+    to `output_path` and the collapsed stacks to `output_path.collapsed`.
+
+    :arg str output_path: cProfile (pstats) output file path.
+    """
+    recorder = ProfilingRecorder()
+    with instrumentation.recording(new_recorder=recorder):
+        recorder.profiles[None].enable()
+        try:
+            yield recorder
+        finally:
+            recorder.profiles[None].disable()
+    recorder.stats().dump_stats(output_path)
+    with open(output_path + ".collapsed", "w") as collapsed_file:
+        for line in recorder.collapsed():
+            collapsed_file.write(line + "\n")
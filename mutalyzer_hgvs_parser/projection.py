@@ -0,0 +1,95 @@
+"""
+Module for extracting only some fields of the description models, e.g., the
+reference, to route descriptions, without the full parse and conversion.
+
+The reference (with at most one selector) and the coordinate system are
+recognized with a compiled matcher over the description prefix. Other
+fields, and the descriptions not matched, e.g., with white spaces or nested
+selectors, are extracted from a (lazy) full model.
+"""
+
+import re
+
+from .convert import LazyVariants, to_model
+
+FIELDS = ["type", "reference", "coordinate_system", "variants", "predicted"]
+
+# Fields that can be extracted from the description prefix.
+PREFIX_FIELDS = {"type", "reference", "coordinate_system"}
+
+_ID = r"[A-Za-z0-9][A-Za-z0-9._-]*"
+
+_PREFIX = re.compile(
+    r"(?P<id>{0})(?:\((?P<selector>{0})\))?:(?:(?P<coordinate_system>[a-z])\.)?".format(
+        _ID
+    )
+)
+
+
+def prefix_fields(description, fields):
+    """
+    :returns: The fields from the description prefix, or None if they
+        cannot be extracted from it.
+    :rtype: dict
+    """
+    match = _PREFIX.match(description)
+    if match is None:
+        return None
+    coordinate_system = match.group("coordinate_system")
+    # White spaces may separate the prefix tokens, e.g., "R1: c.10del", and a
+    # letter may start a coordinate system, e.g., "R1:c .10del".
+    following = description[match.end() : match.end() + 1]
+    if following.isspace() or (coordinate_system is None and following.isalpha()):
+        return None
+    output = {}
+    for field in fields:
+        if field == "reference":
+            output["reference"] = {"id": match.group("id")}
+            if match.group("selector") is not None:
+                output["reference"]["selector"] = {"id": match.group("selector")}
+        elif field == "coordinate_system":
+            if coordinate_system is not None:
+                output["coordinate_system"] = coordinate_system
+        elif coordinate_system is None:
+            # Without coordinate system, the type depends on the variants.
+            return None
+        elif coordinate_system == "p":
+            output["type"] = "description_protein"
+        else:
+            output["type"] = "description_dna"
+    return output
+
+
+def extract(description, fields=("reference", "coordinate_system")):
+    """
+    Extract some (top level) fields of a description model.
+
+    Note that when only prefix fields (see `PREFIX_FIELDS`) are requested,
+    the rest of the description is not checked, i.e., errors are only
+    raised for the descriptions that are converted.
+
+    :arg str description: HGVS description.
+    :arg iterable fields: Model fields (see `FIELDS`).
+    :returns: The fields present in the description model, with the same
+        values.
+    :rtype: dict
+    """
+    fields = list(fields)
+    for field in fields:
+        if field not in FIELDS:
+            raise ValueError(
+                "Unknown field '{}', expected one of: {}.".format(
+                    field, ", ".join(FIELDS)
+                )
+            )
+    if PREFIX_FIELDS.issuperset(fields):
+        output = prefix_fields(description, fields)
+        if output is not None:
+            return output
+    model = to_model(description, lazy=True)
+    output = {}
+    for field in fields:
+        if field in model:
+            value = model[field]
+            output[field] = list(value) if isinstance(value, LazyVariants) else value
+    return output
@@ -0,0 +1,173 @@
+"""
+Module for warming up the parsers and the output caches (see `output`),
+e.g., after a restart, from a corpus file with frequent descriptions, and
+for saving the caches contents to a snapshot file, to restore them later:
+
+    python -m mutalyzer_hgvs_parser.warmup -f frequent.txt -o snapshot.json
+
+A snapshot is only restored with the package version and the grammar it
+was created with, i.e., if the models it contains are still valid.
+"""
+
+import argparse
+import json
+import os
+from importlib.metadata import version
+
+from . import output
+from .hgvs_parser import _default_grammar, get_parser, parse
+from .precompiled import grammar_hash
+from .projection import prefix_fields
+
+SNAPSHOT_VERSION = 1
+
+
+def _snapshot_header():
+    return {
+        "snapshot_version": SNAPSHOT_VERSION,
+        "package": version("mutalyzer_hgvs_parser"),
+        "grammar": grammar_hash(_default_grammar()),
+    }
+
+
+def warm_parsers(descriptions, start_rule=None):
+    """
+    Create the parser, and parse one description per coordinate system,
+    such that its (dispatch) sub-parser is created.
+
+    :arg iterable descriptions: HGVS descriptions.
+    :arg str start_rule: Alternative start rule.
+    """
+    get_parser(start_rule=start_rule)
+    coordinate_systems = set()
+    for description in descriptions:
+        fields = prefix_fields(description, ["coordinate_system"])
+        coordinate_system = None if fields is None else fields.get("coordinate_system")
+        if coordinate_system in coordinate_systems:
+            continue
+        try:
+            parse(description, start_rule=start_rule)
+        except Exception:
+            continue
+        coordinate_systems.add(coordinate_system)
+
+
+def warm(descriptions, start_rule=None):
+    """
+    Convert the descriptions into the output caches, and create the
+    parsers on the way.
+
+    :arg iterable descriptions: HGVS descriptions.
+    :arg str start_rule: Alternative start rule.
+    :returns: The number of cached models and errors.
+    :rtype: dict
+    """
+    counts = {"models": 0, "errors": 0}
+    for description in descriptions:
+        try:
+            output.to_json(description, start_rule)
+        except Exception:
+            counts["errors"] += 1
+        else:
+            counts["models"] += 1
+    return counts
+
+
+def read_descriptions(file_path):
+    """
+    :returns: The (non empty) descriptions, one per line.
+    :rtype: list
+    """
+    with open(file_path) as descriptions:
+        return [line.strip() for line in descriptions if line.strip()]
+
+
+def warm_file(file_path, start_rule=None):
+    """
+    Warm up from a corpus file, with one description per line.
+
+    :returns: The number of cached models and errors.
+    :rtype: dict
+    """
+    return warm(read_descriptions(file_path), start_rule)
+
+
+def snapshot(file_path):
+    """
+    Save the output caches contents, from the least to the most recently
+    used entries. The file is replaced atomically.
+
+    :arg str file_path: Snapshot file path.
+    :returns: The number of saved models and errors.
+    :rtype: dict
+    """
+    data = _snapshot_header()
+    data["models"] = [
+        [description, start_rule, rendered.decode()]
+        for (description, start_rule), rendered in output.JSON_CACHE.items()
+    ]
+    data["errors"] = [
+        [description, start_rule, error]
+        for (description, start_rule), error in output.ERROR_CACHE.items()
+    ]
+    temporary_path = "{}.tmp".format(file_path)
+    with open(temporary_path, "w") as snapshot_file:
+        json.dump(data, snapshot_file, ensure_ascii=False)
+    os.replace(temporary_path, file_path)
+    return {"models": len(data["models"]), "errors": len(data["errors"])}
+
+
+def restore(file_path, warm_up_parsers=True):
+    """
+    Restore the output caches contents from a snapshot, if it was created
+    with the current package version and grammar.
+
+    :arg str file_path: Snapshot file path.
+    :arg bool warm_up_parsers: Also create the parsers (see `warm_parsers`).
+    :returns: The number of restored models and errors, or None if the
+        snapshot is outdated.
+    :rtype: dict
+    """
+    with open(file_path) as snapshot_file:
+        data = json.load(snapshot_file)
+    header = _snapshot_header()
+    if any(data.get(key) != value for key, value in header.items()):
+        return None
+    for description, start_rule, rendered in data["models"]:
+        output.JSON_CACHE.put((description, start_rule), rendered.encode())
+    for description, start_rule, error in data["errors"]:
+        output.ERROR_CACHE.put((description, start_rule), error)
+    if warm_up_parsers:
+        for start_rule in {start_rule for _, start_rule, _ in data["models"]}:
+            warm_parsers(
+                [d for d, r, _ in data["models"] if r == start_rule], start_rule
+            )
+    return {"models": len(data["models"]), "errors": len(data["errors"])}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Warm up the output caches and save them to a snapshot."
+    )
+    parser.add_argument(
+        "-f", nargs="+", default=[], help="corpus files, one description per line"
+    )
+    parser.add_argument("-r", help="alternative start rule")
+    parser.add_argument("--restore", help="snapshot to restore first")
+    parser.add_argument("-o", required=True, help="output snapshot file path")
+    args = parser.parse_args()
+
+    if args.restore and restore(args.restore, warm_up_parsers=False) is None:
+        print("Outdated snapshot ignored:\n {}".format(args.restore))
+    for file_path in args.f:
+        warm_file(file_path, args.r)
+    counts = snapshot(args.o)
+    print(
+        "Snapshot saved to:\n {}\n ({} models, {} errors)".format(
+            args.o, counts["models"], counts["errors"]
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+"""
+Build the precompiled default grammar tables (`grammar_tables.py`).
+"""
+
+import argparse
+
+from mutalyzer_hgvs_parser.precompiled import TABLES_PATH, build
+
+parser = argparse.ArgumentParser(description="Build the precompiled grammar tables.")
+parser.add_argument("-o", default=TABLES_PATH, help="output path (default: %(default)s)")
+args = parser.parse_args()
+
+build(args.o)
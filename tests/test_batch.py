@@ -0,0 +1,177 @@
+"""
+Batch conversion tests.
+"""
+
+import pytest
+
+from mutalyzer_hgvs_parser import to_model
+from mutalyzer_hgvs_parser.batch import (
+    Deduplicator,
+    Filter,
+    convert_many,
+    to_columns,
+)
+from mutalyzer_hgvs_parser.exceptions import UnexpectedEnd
+
+DESCRIPTIONS = [
+    "NM_004006.1:c.100_200del",
+    "NM_004006.1:c.10del",
+    "NG_012337.1:g.100_300del",
+    "NM_004006.2:c.(100_150del)",
+    "NM_004006.2:c.[100_120dup;130del]",
+    "NP_003997.1:p.Trp24Cys",
+    "NM_004006.2(DMD_v1):c.*10del",
+    "R1 : c.1del",
+    "R1:c.1del!",
+]
+
+
+def test_convert_many():
+    output = list(convert_many(DESCRIPTIONS))
+    assert [description for description, _, _ in output] == DESCRIPTIONS
+    for description, model, error in output[:-1]:
+        assert error is None
+        assert model == to_model(description)
+    assert output[-1][1] is None
+    assert isinstance(output[-1][2], Exception)
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected, rejected",
+    [
+        (
+            {"coordinate_systems": ["g", "p"]},
+            ["NG_012337.1:g.100_300del", "NP_003997.1:p.Trp24Cys"],
+            {"prefix": 6, "description": 1, "variants": 0},
+        ),
+        (
+            {"reference_prefix": "NM_004006.2"},
+            DESCRIPTIONS[3:5] + ["NM_004006.2(DMD_v1):c.*10del"],
+            {"prefix": 5, "description": 1, "variants": 0},
+        ),
+        (
+            {"types": ["deletion"], "positions": (50, 250)},
+            DESCRIPTIONS[0:1] + DESCRIPTIONS[3:5] + ["R1:c.1del!"],
+            {"prefix": 0, "description": 0, "variants": 5},
+        ),
+        (
+            {"types": ["duplication", "substitution"]},
+            [DESCRIPTIONS[4], DESCRIPTIONS[5], "R1:c.1del!"],
+            {"prefix": 0, "description": 0, "variants": 6},
+        ),
+        (
+            {"predicted": True},
+            [DESCRIPTIONS[3], "R1:c.1del!"],
+            {"prefix": 0, "description": 0, "variants": 7},
+        ),
+        (
+            {"positions": (1, 10)},
+            DESCRIPTIONS[1:2] + DESCRIPTIONS[6:],
+            {"prefix": 0, "description": 0, "variants": 5},
+        ),
+    ],
+)
+def test_filter(kwargs, expected, rejected):
+    selection = Filter(**kwargs)
+    output = list(convert_many(DESCRIPTIONS, filters=selection))
+    assert [description for description, _, _ in output] == expected
+    for description, model, error in output:
+        if description == "R1:c.1del!":
+            assert isinstance(error, Exception)
+        else:
+            assert model == to_model(description)
+    assert selection.rejected == rejected
+
+
+def test_filter_prefix_no_parse():
+    selection = Filter(reference_prefix="NM_")
+    assert list(convert_many(["NG_1:c.10dex", "NG_1:g."], filters=selection)) == []
+    assert selection.rejected["prefix"] == 2
+
+
+
+def test_filter_prefix_white_spaces():
+    descriptions = ["R1: c.10del", "R1:c .10del", "R1: g.10del"]
+    selection = Filter(coordinate_systems=["c"])
+    output = list(convert_many(descriptions, filters=selection))
+    assert [description for description, _, _ in output] == descriptions[:2]
+    assert selection.rejected == {"prefix": 0, "description": 1, "variants": 0}
+
+
+def test_filter_error():
+    output = list(convert_many(["NM_1:c.10del("], filters=Filter(types=["deletion"])))
+    assert isinstance(output[0][2], UnexpectedEnd)
+
+
+def test_to_columns_filter():
+    table = to_columns(DESCRIPTIONS, filters=Filter(types=["deletion"]))
+    assert list(table.columns()["index"]) == [0, 1, 2, 3, 4, 4, 6, 7]
+    assert [index for index, _, _ in table.errors] == [8]
+
+
+DUPLICATES = [
+    "NM_004006.1:c.100del",
+    "R1:c.1del!",
+    " NM_004006.1:c.100del",
+    "NM_004006.1:c.100del",
+    "R1:c.1del! ",
+    "R1:c.1del!",
+    # White spaces inside a description may separate tokens.
+    "NM_004006.1:c.10 0del",
+    "NM_004006.1:c.100d el",
+    "NM_0040 06.1:c.100del",
+]
+
+
+def test_deduplicator():
+    calls = []
+    deduplicator = Deduplicator(ignore_white_spaces=False)
+    output = list(deduplicator.map(calls.append, ["a", "b", "a ", "a", "b"]))
+    assert [description for description, _ in output] == ["a", "b", "a ", "a", "b"]
+    assert calls == ["a", "b", "a "]
+    assert deduplicator.deduplicated == 2
+
+
+def test_deduplicator_white_spaces():
+    calls = []
+    deduplicator = Deduplicator()
+    list(deduplicator.map(calls.append, ["a b", " a b", "ab", "a  b", "a b\t"]))
+    assert calls == ["a b", "ab", "a  b"]
+    assert deduplicator.deduplicated == 2
+
+
+def test_deduplicator_window():
+    calls = []
+    deduplicator = Deduplicator(window=2)
+    list(deduplicator.map(calls.append, ["a", "b", "a", "c", "b", "a"]))
+    assert calls == ["a", "b", "c", "b", "a"]
+    assert deduplicator.deduplicated == 1
+
+
+def test_convert_many_deduplicator():
+    deduplicator = Deduplicator()
+    output = list(convert_many(DUPLICATES, deduplicator=deduplicator))
+    assert [description for description, _, _ in output] == DUPLICATES
+    expected = list(convert_many(DUPLICATES))
+    for (_, model, error), (_, expected_model, expected_error) in zip(
+        output, expected
+    ):
+        assert model == expected_model
+        assert str(error) == str(expected_error)
+    assert output[0][1] is output[2][1] is output[3][1]
+    # Errors are only fanned out to identical descriptions.
+    assert output[1][2] is output[5][2] is not output[4][2]
+    assert output[6][1]["variants"][0]["location"] != (
+        output[0][1]["variants"][0]["location"]
+    )
+    assert isinstance(output[7][2], UnexpectedEnd)
+    assert output[8][1]["reference"] != output[0][1]["reference"]
+    assert deduplicator.deduplicated == 3
+
+
+def test_to_columns_deduplicator():
+    deduplicator = Deduplicator()
+    table = to_columns(DUPLICATES, deduplicator=deduplicator)
+    assert list(table.columns()["index"]) == [0, 2, 3, 6, 8]
+    assert [index for index, _, _ in table.errors] == [1, 4, 5, 7]
+    assert deduplicator.deduplicated == 3
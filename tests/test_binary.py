@@ -0,0 +1,79 @@
+"""
+Binary models encoding tests.
+"""
+
+import pickle
+
+import pytest
+
+from mutalyzer_hgvs_parser import binary
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.exceptions import DecodeError
+
+from .test_convert import (
+    DESCRIPTIONS,
+    INSERTED,
+    LENGTHS,
+    LOCATIONS,
+    REFERENCES,
+    VARIANTS,
+    _get_mix,
+)
+
+MODELS = [
+    model
+    for tests in [REFERENCES, LOCATIONS, LENGTHS, INSERTED, VARIANTS, DESCRIPTIONS]
+    for model in tests.values()
+] + list(_get_mix().values())
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_round_trip(model):
+    data = binary.dumps(model)
+    assert binary.loads(data) == model
+    assert binary.dumps(binary.loads(data)) == data
+
+
+@pytest.mark.parametrize(
+    "value",
+    [None, True, False, 0, -1, 63, -64, 2**70, -(2**70), 1.5, "", "é", [], {}, {1: 2}],
+)
+def test_round_trip_values(value):
+    if isinstance(value, dict) and value:
+        with pytest.raises(TypeError):
+            binary.dumps(value)
+    else:
+        assert binary.loads(binary.dumps(value)) == value
+
+
+def test_unknown_keys():
+    model = {"new_key": "new_value", "nested": {"new_key": "new_value"}}
+    assert binary.loads(binary.dumps(model)) == model
+
+
+def test_compact():
+    model = to_model(
+        "NG_012232.1(NM_004006.1):c.[145C>T;147C>G;150_151insNG_012232.1:g.10_20]"
+    )
+    data = binary.dumps(model)
+    assert len(data) < len(pickle.dumps(model)) / 2
+    # The repeated reference ID is written once.
+    assert data.count(b"NG_012232.1") == 1
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"XX\x01\x00",
+        b"HM\x02\x00",
+        b"HM\x01",
+        b"HM\x01\x05\x05abc",
+        b"HM\x01\x00\x00",
+        b"HM\x01\x63",
+        b"HM\x01\x04\x00",
+    ],
+)
+def test_decode_errors(data):
+    with pytest.raises(DecodeError):
+        binary.loads(data)
@@ -0,0 +1,60 @@
+"""
+Caches tests.
+"""
+
+from mutalyzer_hgvs_parser.cache import ErrorCache, Interner, LRUCache
+from mutalyzer_hgvs_parser.convert import to_model
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.items() == [("a", 1), ("c", 3)]
+    assert cache.get("b") is None
+    assert cache.stats() == {"size": 2, "maxsize": 2, "hits": 1, "misses": 1}
+
+
+def test_lru_cache_disabled():
+    cache = LRUCache(maxsize=0)
+    cache.put("a", 1)
+    assert len(cache) == 0
+
+
+def test_interner():
+    interner = Interner(maxsize=2, max_length=4)
+    first = "".join(["R", "1"])
+    assert interner(first) is first
+    assert interner("".join(["R", "1"])) is first
+    long_value = "ACGTA"
+    assert interner(long_value) is long_value
+    assert len(interner) == 1
+    interner("R2")
+    interner("R3")
+    assert len(interner) == 2
+
+
+def test_interned_models():
+    interner = Interner()
+    models = [
+        to_model(description, interner=interner)
+        for description in ["NM_004006.1:c.12delinsAT", "NM_004006.1:c.15delinsAT"]
+    ]
+    assert models[0]["reference"]["id"] is models[1]["reference"]["id"]
+    assert (
+        models[0]["variants"][0]["inserted"][0]["sequence"]
+        is models[1]["variants"][0]["inserted"][0]["sequence"]
+    )
+    assert models[0] == to_model("NM_004006.1:c.12delinsAT")
+
+
+def test_error_cache():
+    cache = ErrorCache(maxsize=1)
+    cache.put(("R1:1del!", None), {"type": "UnexpectedCharacter"})
+    cache.put(("R2:1del!", None), {"type": "UnexpectedCharacter"})
+    assert cache.get(("R1:1del!", None)) is None
+    assert cache.get(("R2:1del!", None)) == {"type": "UnexpectedCharacter"}
+    assert ErrorCache().maxsize == 16384
@@ -0,0 +1,136 @@
+"""
+Checkpointed file conversion tests.
+"""
+
+import functools
+
+import pytest
+
+from mutalyzer_hgvs_parser import checkpoint as checkpoint_module
+from mutalyzer_hgvs_parser.checkpoint import (
+    checkpoint_path,
+    convert_file,
+    read_checkpoint,
+)
+from mutalyzer_hgvs_parser.parallel import json_lines, tsv_lines
+
+DESCRIPTIONS = [
+    "NM_004006.1:c.[145C>T;147C>G]",
+    "NP_003997.1:p.(Val582_Asn583ins(5))",
+    "R1:1del!",
+    "",
+    "R1:10del",
+]
+
+
+class Interrupted(Exception):
+    pass
+
+
+def _interrupted(monkeypatch, after):
+    """
+    Interrupt the conversions after some ranges.
+    """
+    convert_range = checkpoint_module._convert_range
+    calls = []
+
+    def _convert_range(arguments):
+        calls.append(arguments)
+        if len(calls) > after:
+            raise Interrupted()
+        return convert_range(arguments)
+
+    monkeypatch.setattr(checkpoint_module, "_convert_range", _convert_range)
+
+
+@pytest.fixture
+def descriptions_file(tmp_path):
+    file_path = tmp_path / "descriptions.txt"
+    file_path.write_text("\n".join(DESCRIPTIONS * 10) + "\n")
+    return str(file_path)
+
+
+def _read(file_path):
+    with open(file_path, "rb") as output:
+        return output.read()
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_convert_file(descriptions_file, tmp_path, processes):
+    output_path = str(tmp_path / "output.jsonl")
+    counts = convert_file(descriptions_file, output_path, processes, chunk_size=100)
+    assert counts == {"converted": 30, "errors": 10}
+    assert len(_read(output_path).splitlines()) == 40
+    checkpoint = read_checkpoint(checkpoint_path(output_path))
+    assert checkpoint["input_offset"] == checkpoint["input_size"]
+    assert checkpoint["output_offset"] == len(_read(output_path))
+
+
+@pytest.mark.parametrize("convert", [None, tsv_lines])
+def test_resume(descriptions_file, tmp_path, monkeypatch, convert):
+    expected_path = str(tmp_path / "expected")
+    expected_counts = convert_file(
+        descriptions_file, expected_path, chunk_size=100, convert=convert
+    )
+
+    output_path = str(tmp_path / "output")
+    with monkeypatch.context() as patch:
+        _interrupted(patch, 3)
+        with pytest.raises(Interrupted):
+            convert_file(
+                descriptions_file, output_path, chunk_size=100, convert=convert
+            )
+    checkpoint = read_checkpoint(checkpoint_path(output_path))
+    assert 0 < checkpoint["input_offset"] < checkpoint["input_size"]
+    # Output written after the last checkpoint, e.g., when preempted.
+    with open(output_path, "ab") as output:
+        output.write(b'{"partial"')
+
+    counts = convert_file(
+        descriptions_file, output_path, chunk_size=100, convert=convert, resume=True
+    )
+    assert counts == expected_counts
+    assert _read(output_path) == _read(expected_path)
+
+
+def test_resume_completed(descriptions_file, tmp_path):
+    output_path = str(tmp_path / "output.jsonl")
+    counts = convert_file(descriptions_file, output_path, chunk_size=100)
+    output = _read(output_path)
+    assert convert_file(descriptions_file, output_path, resume=True) == counts
+    assert _read(output_path) == output
+
+
+def test_resume_without_checkpoint(descriptions_file, tmp_path):
+    output_path = tmp_path / "output.jsonl"
+    output_path.write_bytes(b"stale\n")
+    convert_file(descriptions_file, str(output_path), resume=True)
+    assert not output_path.read_bytes().startswith(b"stale")
+
+
+def test_resume_other_input(descriptions_file, tmp_path):
+    output_path = str(tmp_path / "output.jsonl")
+    convert_file(descriptions_file, output_path)
+    with open(descriptions_file, "a") as descriptions:
+        descriptions.write("R1:20del\n")
+    with pytest.raises(ValueError):
+        convert_file(descriptions_file, output_path, resume=True)
+
+
+@pytest.mark.parametrize(
+    "convert",
+    [
+        tsv_lines,
+        functools.partial(json_lines, start_rule="variant"),
+        functools.partial(json_lines, dedup_window=10),
+    ],
+)
+def test_resume_other_converter(descriptions_file, tmp_path, monkeypatch, convert):
+    output_path = str(tmp_path / "output.jsonl")
+    with monkeypatch.context() as patch:
+        _interrupted(patch, 1)
+        with pytest.raises(Interrupted):
+            convert_file(descriptions_file, output_path, chunk_size=100)
+    with pytest.raises(ValueError):
+        convert_file(descriptions_file, output_path, convert=convert, resume=True)
+    convert_file(descriptions_file, output_path, resume=True)
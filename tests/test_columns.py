@@ -0,0 +1,133 @@
+"""
+Columnar batch output tests.
+"""
+
+import csv
+import io
+
+import pytest
+
+from mutalyzer_hgvs_parser import columns
+from mutalyzer_hgvs_parser.batch import to_columns
+from mutalyzer_hgvs_parser.columns import (
+    DOWNSTREAM,
+    END,
+    MISSING,
+    OFFSET_UNCERTAIN,
+    PREDICTED,
+    PTER,
+    QTER,
+    START,
+    UNCERTAIN,
+    UPSTREAM,
+)
+
+DESCRIPTIONS = [
+    "NM_004006.1:c.[145C>T;147C>G]",
+    "NM_004006.1:c.-10+?_*1-5del",
+    "NC_000002.12:g.pter_qterdel",
+    "NM_004006.1:c.(12del)",
+    "R1:10del!",
+    "NP_003997.1:p.?",
+    "NC_000023.11:g.(31060227_31100351)_(33274278_33417151)del",
+    "R1:c.=",
+    "R1:p.(=)",
+]
+
+ROWS = [
+    (0, "NM_004006.1", "c", "substitution", 145, 0, 145, 0, 0),
+    (0, "NM_004006.1", "c", "substitution", 147, 0, 147, 0, 0),
+    (
+        1,
+        "NM_004006.1",
+        "c",
+        "deletion",
+        10,
+        0,
+        1,
+        -5,
+        (UPSTREAM | OFFSET_UNCERTAIN) << START | DOWNSTREAM << END,
+    ),
+    (2, "NC_000002.12", "g", "deletion", MISSING, 0, MISSING, 0, PTER | QTER << END),
+    (3, "NM_004006.1", "c", "deletion", 12, 0, 12, 0, PREDICTED),
+    (5, "NP_003997.1", "p", "", MISSING, 0, MISSING, 0, UNCERTAIN | UNCERTAIN << END),
+    (
+        6,
+        "NC_000023.11",
+        "g",
+        "deletion",
+        MISSING,
+        0,
+        MISSING,
+        0,
+        UNCERTAIN | UNCERTAIN << END,
+    ),
+    (7, "R1", "c", "", MISSING, 0, MISSING, 0, 0),
+    (8, "R1", "p", "", MISSING, 0, MISSING, 0, PREDICTED),
+]
+
+
+@pytest.fixture
+def table():
+    return to_columns(DESCRIPTIONS)
+
+
+def test_rows(table):
+    assert len(table) == len(ROWS)
+    assert list(table.rows()) == ROWS
+    assert [error[:2] for error in table.errors] == [(4, "R1:10del!")]
+
+
+def test_columns(table, monkeypatch):
+    monkeypatch.setattr(columns, "numpy", None)
+    output = table.columns()
+    assert output["start"].typecode == "q"
+    assert list(output["start"]) == [row[4] for row in ROWS]
+    assert table.dictionaries()["type"] == ["substitution", "deletion", ""]
+    assert [table.dictionaries()["type"][code] for code in output["type"]] == [
+        row[3] for row in ROWS
+    ]
+
+
+def test_columns_numpy(table):
+    numpy = pytest.importorskip("numpy")
+    output = table.columns()
+    assert output["flags"].dtype == numpy.uint16
+    assert output["end_offset"].tolist() == [row[7] for row in ROWS]
+
+
+def test_to_csv(table):
+    output = io.StringIO()
+    table.to_csv(output)
+    rows = list(csv.reader(io.StringIO(output.getvalue())))
+    assert rows[0] == list(columns.TYPECODES)
+    assert rows[1:] == [[str(value) for value in row] for row in ROWS]
+
+
+def test_to_npz(table, tmp_path):
+    if columns.numpy is None:
+        with pytest.raises(ImportError):
+            table.to_npz(str(tmp_path / "table.npz"))
+    else:
+        table.to_npz(str(tmp_path / "table.npz"))
+        data = columns.numpy.load(str(tmp_path / "table.npz"))
+        assert data["reference_values"].tolist()[data["reference"][0]] == "NM_004006.1"
+
+
+def test_overflow():
+    table = to_columns(
+        ["R1:c.10del", "R1:c.[20del;123456789012345678901234del]", "R1:c.30del"]
+    )
+    assert [row[4] for row in table.rows()] == [10, 30]
+    assert [row[0] for row in table.rows()] == [0, 2]
+    assert len({len(values) for values in table.columns().values()}) == 1
+    assert [(index, type(error)) for index, _, error in table.errors] == [
+        (1, OverflowError)
+    ]
+
+
+def test_columns_then_add(table):
+    output = table.columns()
+    table.add(9, {"reference": {"id": "R1"}, "variants": [{"type": "deletion"}]})
+    assert len(output["index"]) == len(ROWS)
+    assert len(table.columns()["index"]) == len(ROWS) + 1
@@ -2,9 +2,13 @@
 Tests for the lark tree to dictionary converter.
 """
 
+import copy
+import json
+import pickle
+
 import pytest
 
-from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.convert import Converter, to_model
 from mutalyzer_hgvs_parser.exceptions import NestedDescriptions
 
 
@@ -1104,3 +1108,93 @@ def test_mix(description, model):
 def test_nested_descriptions(description):
     with pytest.raises(NestedDescriptions):
         to_model(description)
+
+
+@pytest.mark.parametrize(
+    "description, start_rule, model",
+    [
+        (description, start_rule, model)
+        for tests, start_rule in [
+            (LOCATIONS, "location"),
+            (LENGTHS, "length"),
+            (INSERTED, "inserted"),
+            (VARIANTS, "variant"),
+            (DESCRIPTIONS, None),
+        ]
+        for description, model in tests.items()
+    ],
+)
+def test_shared_leaves(description, start_rule, model):
+    assert to_model(description, start_rule, shared_leaves=True) == model
+
+
+def test_shared_leaves_identity():
+    first = to_model("R1:c.[10A>T;20+5C>T;30_31insT]", shared_leaves=True)
+    second = to_model("R2:c.40+5_41insT", shared_leaves=True)
+    assert first["variants"][0]["inserted"][0] is second["variants"][0]["inserted"][0]
+    assert first["variants"][0]["inserted"][0] is first["variants"][2]["inserted"][0]
+    assert (
+        first["variants"][1]["location"]["offset"]
+        is second["variants"][0]["location"]["start"]["offset"]
+    )
+
+
+def test_shared_leaves_not_shared():
+    first = to_model("R1:c.10A>T")
+    second = to_model("R1:c.10A>T")
+    assert first["variants"][0]["inserted"][0] is not second["variants"][0]["inserted"][0]
+    first["variants"][0]["inserted"][0]["sequence"] = "G"
+    assert second["variants"][0]["inserted"][0]["sequence"] == "T"
+
+
+def test_shared_leaves_read_only():
+    leaf = to_model("R1:c.10A>T", shared_leaves=True)["variants"][0]["inserted"][0]
+    with pytest.raises(TypeError):
+        leaf["sequence"] = "G"
+    with pytest.raises(TypeError):
+        leaf.pop("source")
+    with pytest.raises(TypeError):
+        leaf.update({"sequence": "G"})
+    assert leaf == {"sequence": "T", "source": "description"}
+
+
+def test_shared_leaves_copy():
+    model = to_model("R1:c.10+5_20-?delinsA", shared_leaves=True)
+    assert copy.deepcopy(model) == model
+    assert pickle.loads(pickle.dumps(model)) == model
+    assert json.loads(json.dumps(model)) == model
+
+
+@pytest.mark.parametrize("description, model", _get_tests(DESCRIPTIONS))
+def test_lazy(description, model):
+    lazy = to_model(description, lazy=True)
+    assert lazy == model
+    assert list(lazy) == list(to_model(description))
+    assert lazy.to_dict() == model
+    assert type(lazy.to_dict()["variants"]) is list
+
+
+def test_lazy_partial(monkeypatch):
+    def fail(self, children):
+        raise AssertionError("Variant converted.")
+
+    monkeypatch.setattr(Converter, "variant", fail)
+    model = to_model("NG_012337.1(SDHD_v001):c.[274G>T;300del]", lazy=True)
+    assert model["reference"]["id"] == "NG_012337.1"
+    assert model["coordinate_system"] == "c"
+    assert len(model["variants"]) == 2
+    with pytest.raises(AssertionError):
+        model["variants"][1]
+
+
+def test_lazy_errors():
+    model = to_model("R1:1delinsR2:2del", lazy=True)
+    assert model["reference"] == {"id": "R1"}
+    with pytest.raises(NestedDescriptions):
+        model["variants"][0]
+
+
+def test_lazy_start_rule():
+    model = to_model("10_20del", "variant", lazy=True)
+    assert type(model) is dict
+    assert model == to_model("10_20del", "variant")
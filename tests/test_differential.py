@@ -0,0 +1,64 @@
+"""
+Differential testing harness tests.
+"""
+
+import pytest
+
+from mutalyzer_hgvs_parser import differential
+from mutalyzer_hgvs_parser.convert import to_model
+
+
+@pytest.mark.parametrize(
+    "engines",
+    [["reference", "parser"], ["reference", "to_model"], ["reference", "lazy"]],
+)
+def test_compare_equivalent(engines):
+    report = differential.compare(
+        engines, differential.corpus(count=100, seed=3, errors=0.2), time_budget=60
+    )
+    assert report["checked"] == 100
+    assert report["mismatches"] == []
+
+
+def test_compare_mismatch(monkeypatch):
+    def broken(description):
+        model = to_model(description)
+        if "dup" in description:
+            model["broken"] = True
+        return model
+
+    monkeypatch.setitem(differential.ENGINES, "broken", lambda: broken)
+    report = differential.compare(
+        ["reference", "broken"],
+        ["NM_004006.2:c.20del", "NG_012232.1(NM_004006.1):c.[20dup;30_31insA]"],
+    )
+    assert report["checked"] == 2
+    [mismatch] = report["mismatches"]
+    assert mismatch["description"] == "NG_012232.1(NM_004006.1):c.[20dup;30_31insA]"
+    assert len(mismatch["minimized"]) < len(mismatch["description"]) / 2
+    assert "dup" in mismatch["minimized"]
+    assert "broken" in mismatch["outcomes"]["broken"][1]
+
+
+def test_compare_time_budget():
+    report = differential.compare(
+        ["reference", "parser"], differential.corpus(count=100), time_budget=0
+    )
+    assert report["timed_out"]
+    assert report["checked"] == 0
+
+
+def test_minimize():
+    assert differential.minimize("xxaxxbxx", lambda d: "a" in d and "b" in d) == "ab"
+
+
+def test_outcome_error():
+    assert differential.outcome(to_model, "R1:10del!")[:2] == [
+        "error",
+        "UnexpectedCharacter",
+    ]
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        differential.get_engine("unknown")
@@ -0,0 +1,45 @@
+"""
+Tests for the grammar driven descriptions generator.
+"""
+
+import pytest
+
+from mutalyzer_hgvs_parser.generate import Generator
+from mutalyzer_hgvs_parser.hgvs_parser import is_valid
+
+
+@pytest.mark.parametrize(
+    "start_rule", ["description", "description_protein", "variant", "location"]
+)
+def test_generate_valid(start_rule):
+    generator = Generator(seed=42, start_rule=start_rule, check=True)
+    for description in generator.generate_many(50):
+        assert is_valid(description, start_rule=start_rule)
+
+
+def test_generate_seeded():
+    assert list(Generator(seed=1).generate_many(20)) == list(
+        Generator(seed=1).generate_many(20)
+    )
+
+
+@pytest.mark.parametrize("max_length", [30, 60])
+def test_generate_max_length(max_length):
+    for description in Generator(seed=4, max_length=max_length).generate_many(50):
+        assert len(description) <= max_length
+
+
+
+def test_generate_max_length_too_small():
+    with pytest.raises(ValueError):
+        Generator(seed=1, max_length=8).generate()
+
+
+def test_generate_no_nesting():
+    for description in Generator(seed=5, max_nesting=0).generate_many(100):
+        assert description.count(":") == 1
+
+
+def test_generate_errors():
+    descriptions = list(Generator(seed=6, errors=1.0, check=True).generate_many(50))
+    assert sum(not is_valid(description) for description in descriptions) > 45
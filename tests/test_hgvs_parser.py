@@ -3,9 +3,22 @@ Syntax tests for the lark based HGVS parser - taken from the previous
 Mutalyzer tests.
 """
 
+import multiprocessing
+import os
+import pickle
+import subprocess
+import sys
+
 import pytest
 
-from mutalyzer_hgvs_parser.hgvs_parser import HgvsParser
+from mutalyzer_hgvs_parser.exceptions import UnexpectedCharacter, UnexpectedEnd
+from mutalyzer_hgvs_parser.hgvs_parser import (
+    HgvsParser,
+    _unpickle_parser,
+    get_parser,
+    is_valid,
+    validate_many,
+)
 
 
 @pytest.fixture
@@ -158,3 +171,180 @@ def test_parse_compound_delins(parser, description):
     Parse compound deletion-insertions.
     """
     parser(description)
+
+
+@pytest.mark.parametrize(
+    "description, valid",
+    [
+        ("NM_002001.2:c.12_17delins[28_39inv;A;ATC]", True),
+        ("NG_012337.1(SDHD_v001):c.274G>T", True),
+        ("NP_003997.1:p.(Trp24Cys)", True),
+        ("NM_002001.2:c.12_17delinz", False),
+        ("NM_002001.2:c.12_", False),
+        ("NM_002001.2", False),
+    ],
+)
+def test_is_valid(description, valid):
+    assert is_valid(description) == valid
+
+
+def test_validate_many():
+    errors = list(
+        validate_many(["NM_002001.2:c.12del", "NM_002001.2:c.12del!", "R1:"])
+    )
+    assert errors[0] is None
+    assert isinstance(errors[1], UnexpectedCharacter)
+    assert errors[1].pos_in_stream == 19
+    assert isinstance(errors[2], UnexpectedEnd)
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        "NG_012337.1(SDHD_v001):c.274G>T",
+        "NM_002001.2:c.15_16ins[28_39inv;A;ATC]",
+        "NC_000012.11:g.6128892_6128954conNC_000022.10:17179029_17179091",
+        "NP_003997.1:p.(Trp24Cys)",
+        "PREF:p.Ala2[10]",
+        "R1:100insA",
+        "NM_002001.2 : c. 12del",
+    ],
+)
+def test_dispatch(description):
+    assert HgvsParser().parse(description) == HgvsParser(dispatch=False).parse(
+        description
+    )
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        "NM_002001.2:c.12delz",
+        "NP_003997.1:p.Trp24Cys!",
+        "NM_002001.2:p.12_",
+        "NM_002001.2:c.",
+        "NM_002001.2:c.[12del;",
+        "NM_00200)1.2:c.12del",
+        "NM_002001.2:c.12_13ins[NM_1:p.Trp24Cys]",
+        "NP_003997.1:p.Trp24Cys)",
+    ],
+)
+@pytest.mark.parametrize("method", ["parse", "validate"])
+def test_dispatch_errors(description, method):
+    _check_dispatch_errors(description, method)
+
+
+@pytest.mark.parametrize(
+    "description",
+    ["R1: c.10del", "R1:c .10del", "R1:c. 10del", "R1 :c.10del", "R1:c.10 del"],
+)
+@pytest.mark.parametrize("method", ["parse", "validate"])
+def test_dispatch_errors_white_spaces(description, method):
+    _check_dispatch_errors(description, method, ignore_white_spaces=False)
+
+
+def _check_dispatch_errors(description, method, **options):
+    with pytest.raises((UnexpectedCharacter, UnexpectedEnd)) as dispatched:
+        getattr(HgvsParser(**options), method)(description)
+    with pytest.raises((UnexpectedCharacter, UnexpectedEnd)) as combined:
+        getattr(HgvsParser(dispatch=False, **options), method)(description)
+    assert type(dispatched.value) is type(combined.value)
+    dispatched_error = dispatched.value.serialize()
+    combined_error = combined.value.serialize()
+    assert sorted(dispatched_error.pop("expecting")) == sorted(
+        combined_error.pop("expecting")
+    )
+    assert dispatched_error == combined_error
+
+
+def test_prewarm():
+    parser = HgvsParser()
+    parser.prewarm()
+    assert set(parser._sub_parsers) == {
+        ("description_dna", "explicit"),
+        ("description_dna", "forest"),
+        ("description_protein", "explicit"),
+        ("description_protein", "forest"),
+    }
+    assert parser._recognizer is not None
+
+
+FORK_PRIVATE_MEMORY = """
+import os, sys
+from mutalyzer_hgvs_parser import is_valid, to_model
+from mutalyzer_hgvs_parser.hgvs_parser import prewarm
+
+def private():
+    with open("/proc/self/smaps_rollup") as smaps:
+        return sum(
+            int(line.split()[1]) for line in smaps if line.startswith("Private_")
+        )
+
+if sys.argv[1] == "prewarm":
+    prewarm()
+read, write = os.pipe()
+pid = os.fork()
+if pid == 0:
+    before = private()
+    to_model("NM_004006.1:c.[145C>T;147C>G]")
+    to_model("NP_003997.1:p.Trp24Cys")
+    is_valid("NG_012337.1:g.100_300del")
+    os.write(write, str(private() - before).encode())
+    os._exit(0)
+os.waitpid(pid, 0)
+print(os.read(read, 64).decode())
+"""
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "fork") or not os.path.exists("/proc/self/smaps_rollup"),
+    reason="requires fork and /proc/self/smaps_rollup",
+)
+def test_prewarm_fork_private_memory():
+    def child_private(mode):
+        return int(
+            subprocess.run(
+                [sys.executable, "-c", FORK_PRIVATE_MEMORY, mode],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+
+    assert child_private("prewarm") * 2 < child_private("cold")
+
+
+def test_pickle():
+    parser = get_parser()
+    data = pickle.dumps(parser)
+    assert len(data) < 512
+    assert pickle.loads(data) is parser
+    assert pickle.loads(pickle.dumps(get_parser(start_rule="variant"))) is get_parser(
+        start_rule="variant"
+    )
+
+
+def test_pickle_options():
+    parser = HgvsParser(dispatch=False)
+    unpickled = pickle.loads(pickle.dumps(parser))
+    assert unpickled is not parser
+    assert not unpickled._dispatch
+    assert unpickled.parse("R1:c.10del") == parser.parse("R1:c.10del")
+
+
+def test_pickle_grammar_mismatch():
+    with pytest.raises(ValueError):
+        _unpickle_parser(None, None, True, True, True, "0" * 64)
+
+
+def _parse_with(arguments):
+    parser, description = arguments
+    return str(parser.parse(description))
+
+
+def test_pickle_spawn():
+    descriptions = ["NM_004006.1:c.[145C>T;147C>G]", "NP_003997.1:p.Trp24Cys"]
+    parser = get_parser()
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        trees = pool.map(_parse_with, [(parser, d) for d in descriptions])
+    assert trees == [str(parser.parse(d)) for d in descriptions]
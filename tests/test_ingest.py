@@ -0,0 +1,128 @@
+"""
+Column-aware ingestion tests.
+"""
+
+import csv
+import io
+import json
+from urllib.parse import unquote
+
+import pytest
+
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.ingest import FieldConverter, convert_file
+from mutalyzer_hgvs_parser.output import TSV_COLUMNS
+
+VCF = """##fileformat=VCFv4.2
+#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO
+1\t100\t.\tC\tT\t.\tPASS\tDP=10;HGVSc=NM_004006.1:c.145C>T;AF=0.5
+1\t200\t.\tC\tG\t.\tPASS\tDP=3
+1\t300\t.\tC\tG\t.\tPASS\tHGVSc=NM_004006.1:c.147del,R1:1del!
+"""
+
+TSV = """sample\thgvs\tgene
+S1\tNM_004006.1:c.[145C>T;147del]\tDMD
+S2\t\tDMD
+S3\tR1:1del!\tDMD
+"""
+
+
+def _convert(text, **options):
+    output = io.StringIO()
+    converter = FieldConverter(output, **options)
+    converter.write_lines(io.StringIO(text))
+    return output.getvalue().splitlines(), converter.counts
+
+
+def test_vcf_info_json():
+    lines, counts = _convert(VCF, info_key="HGVSc", header=True)
+    assert lines[:2] == VCF.splitlines()[:2]
+    assert lines[3] == VCF.splitlines()[3]
+    fields = lines[2].split("\t")
+    assert fields[:7] == VCF.splitlines()[2].split("\t")[:7]
+    prefix, suffix = "DP=10;HGVSc=", ";AF=0.5"
+    assert fields[7].startswith(prefix) and fields[7].endswith(suffix)
+    model = json.loads(unquote(fields[7][len(prefix) : -len(suffix)]))
+    assert model == to_model("NM_004006.1:c.145C>T")
+    assert counts == {"converted": 2, "errors": 1, "skipped": 1}
+
+
+def test_vcf_info_tsv():
+    lines, _ = _convert(VCF, info_key="HGVSc", header=True, output_format="tsv")
+    assert lines[1].split("\t") == VCF.splitlines()[1].split("\t") + TSV_COLUMNS[1:]
+    rows = [line.split("\t") for line in lines[2:]]
+    assert [len(row) for row in rows] == [8 + len(TSV_COLUMNS) - 1] * 4
+    assert rows[0][8:13] == ["NM_004006.1", "", "c", "substitution", "145"]
+    assert rows[1][8:] == [""] * (len(TSV_COLUMNS) - 1)
+    assert rows[2][11] == "deletion"
+    assert rows[3][-1] == "UnexpectedCharacter"
+
+
+
+def test_vcf_info_tsv_without_variants():
+    text = "1\t100\t.\tC\tC\t.\tPASS\tHGVSc=NM_004006.1:c.%3D;DP=1\n"
+    lines, counts = _convert(text, info_key="HGVSc", output_format="tsv")
+    assert counts["converted"] == 1
+    [row] = [line.split("\t") for line in lines]
+    assert row[:8] == text.rstrip("\n").split("\t")
+    assert row[8:12] == ["NM_004006.1", "", "c", ""]
+    assert row[-1] == ""
+
+
+def test_column_json():
+    lines, counts = _convert(TSV, column=1, header=True)
+    assert lines[0] == TSV.splitlines()[0]
+    rows = list(csv.reader(lines, delimiter="\t"))
+    sample, model, gene = rows[1]
+    assert (sample, gene) == ("S1", "DMD")
+    assert json.loads(model) == to_model("NM_004006.1:c.[145C>T;147del]")
+    assert lines[2] == TSV.splitlines()[2]
+    assert json.loads(rows[3][1])["errors"][0]["type"] == "UnexpectedCharacter"
+    assert counts == {"converted": 1, "errors": 1, "skipped": 1}
+
+
+def test_column_tsv():
+    lines, _ = _convert(TSV, column=1, output_format="tsv")
+    # Without a header, the first line is converted (and it fails).
+    assert lines[0].split("\t")[-1] == "UnexpectedEnd"
+    assert [line.split("\t")[6] for line in lines[1:3]] == ["substitution", "deletion"]
+
+
+def test_column_csv():
+    text = 'id,hgvs,note\n1,NM_004006.1:c.[145C>T;147del],"a, b"\n'
+    lines, _ = _convert(text, column=1, delimiter=",", header=True)
+    rows = list(csv.reader(lines))
+    assert [len(row) for row in rows] == [3, 3]
+    assert json.loads(rows[1][1]) == to_model("NM_004006.1:c.[145C>T;147del]")
+    assert rows[1][2] == "a, b"
+
+
+def test_vcf_info_percent_encoding():
+    text = "1\t100\t.\tC\tT\t.\tPASS\tHGVSc=NM_004006.1:c.[10del%3B12dup];DP=1\n"
+    lines, counts = _convert(text, info_key="HGVSc")
+    assert counts["converted"] == 1
+    info = lines[0].split("\t")[7]
+    items = info.split(";")
+    assert items[1] == "DP=1"
+    key, value = items[0].split("=")
+    assert key == "HGVSc"
+    assert "," not in value
+    assert json.loads(unquote(value)) == to_model("NM_004006.1:c.[10del;12dup]")
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_convert_file(tmp_path, processes):
+    file_path = tmp_path / "variants.vcf"
+    file_path.write_text(VCF * 20)
+    output = io.BytesIO()
+    options = {"info_key": "HGVSc", "header": True, "output_format": "tsv"}
+    convert_file(str(file_path), output, processes, chunk_size=200, **options)
+    expected, _ = _convert(VCF * 20, **options)
+    assert output.getvalue().decode().splitlines() == expected
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        FieldConverter(io.StringIO())
+    with pytest.raises(ValueError):
+        FieldConverter(io.StringIO(), column=1, output_format="vcf")
@@ -0,0 +1,84 @@
+"""
+Tests for the per stage timing instrumentation.
+"""
+
+import pytest
+
+from mutalyzer_hgvs_parser import hgvs_parser, instrumentation
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.exceptions import NestedDescriptions, UnexpectedCharacter
+from mutalyzer_hgvs_parser.hgvs_parser import HgvsParser
+
+
+def test_recording():
+    records = []
+    with instrumentation.recording(records.append) as recorder:
+        to_model("R1:g.10_11insA")
+        to_model("NP_003997.1:p.(Trp24Cys)")
+        HgvsParser(start_rule="variant")
+    assert instrumentation.recorder is None
+
+    summary = recorder.summary()
+    for stage in ["compile", "parse", "protein", "ambig", "final", "convert"]:
+        assert summary[stage]["count"] >= 1
+        assert summary[stage]["total"] >= 0
+    assert summary["parse"]["count"] == 2
+    assert summary["ambiguities"]["total"] > 0
+    # One record per call, with the conversion of the parsed description.
+    assert len(records) == 3
+    stages = {"parse", "protein", "ambig", "final", "ambiguities", "convert"}
+    for record in records[:2]:
+        assert stages <= set(record)
+    assert set(records[2]) == {"compile"}
+
+
+def test_recording_compile_in_call(monkeypatch):
+    # The parser is created (compiled) in the call.
+    monkeypatch.setattr(hgvs_parser, "_PARSERS", {})
+    records = []
+    with instrumentation.recording(records.append):
+        to_model("R1:g.10del")
+    assert len(records) == 1
+    assert records[0]["compile"] > 0
+    assert records[0]["convert"] > 0
+
+
+
+@pytest.mark.parametrize(
+    "description, error",
+    [
+        ("R1:g.10del!", UnexpectedCharacter),
+        ("R1:1delinsR2:2del", NestedDescriptions),
+    ],
+)
+def test_recording_error(description, error):
+    records = []
+    with instrumentation.recording(records.append) as recorder:
+        with pytest.raises(error):
+            to_model(description)
+    assert len(records) == 1
+    assert records[0]["error"] == error.__name__
+    assert records[0]["parse"] > 0
+    assert recorder.summary()["parse"]["count"] == 1
+    assert "error" not in recorder.summary()
+
+
+def test_disabled():
+    instrumentation.disable()
+    to_model("R1:g.10del")
+    assert instrumentation.recorder is None
+
+
+@pytest.mark.parametrize(
+    "values, quantile, output",
+    [
+        ([0.00002] * 9 + [0.2], 0.5, 0.00005),
+        ([0.00002] * 9 + [0.2], 0.99, 0.2),
+        ([7], 0.5, 7),
+    ],
+)
+def test_histogram_quantile(values, quantile, output):
+    histogram = instrumentation.Histogram(instrumentation.TIME_BUCKETS)
+    for value in values:
+        histogram.add(value)
+    assert histogram.quantile(quantile) == output
@@ -0,0 +1,137 @@
+"""
+Output (JSON) writing tests.
+"""
+
+import io
+import json
+
+import pytest
+
+from mutalyzer_hgvs_parser import output
+from mutalyzer_hgvs_parser.convert import to_model
+
+DESCRIPTIONS = [
+    "NM_004006.1:c.[145C>T;147C>G]",
+    "NG_012232.1(NM_004006.1):c.(4071+1_4072-1)_(5154+1_5155-1)del",
+    "NP_003997.1:p.(Val582_Asn583ins(5))",
+]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(output, "orjson", None)
+    elif output.orjson is None:
+        pytest.skip("orjson not installed")
+
+
+@pytest.mark.parametrize(
+    "description",
+    # Positions outside 64 bits are not supported by orjson.
+    DESCRIPTIONS + ["R1:c.123456789012345678901234del"],
+)
+def test_dumps(backend, description):
+    model = to_model(description)
+    assert output.dumps(model) == json.dumps(model, separators=(",", ":")).encode()
+    assert json.loads(output.dumps(model, pretty=True)) == model
+
+
+def test_render_large_position(backend):
+    rendered, converted = output.render("R1:c.123456789012345678901234del")
+    assert converted
+    assert json.loads(rendered)["variants"][0]["location"]["position"] == (
+        123456789012345678901234
+    )
+
+
+def test_to_json_cache():
+    output.JSON_CACHE.clear()
+    rendered = output.to_json(DESCRIPTIONS[0])
+    assert output.to_json(DESCRIPTIONS[0]) is rendered
+    assert output.JSON_CACHE.hits == 1
+    assert json.loads(rendered) == to_model(DESCRIPTIONS[0])
+
+
+def test_json_lines_writer(backend):
+    buffer = io.BytesIO()
+    writer = output.JsonLinesWriter(buffer)
+    assert writer.write_description(DESCRIPTIONS[1])
+    assert not writer.write_description("R1:10del!")
+    lines = buffer.getvalue().splitlines()
+    assert json.loads(lines[0]) == to_model(DESCRIPTIONS[1])
+    [error] = json.loads(lines[1])["errors"]
+    assert error["type"] == "UnexpectedCharacter"
+    assert error["details"]["unexpected_character"] == "!"
+
+
+def test_error_cache(monkeypatch):
+    output.ERROR_CACHE.clear()
+    buffer = io.BytesIO()
+    writer = output.JsonLinesWriter(buffer)
+    assert not writer.write_description("R1:10del!")
+    assert output.cached_error("R1:10del!")["type"] == "UnexpectedCharacter"
+
+    def fail(*args):
+        raise AssertionError("Parsed again.")
+
+    monkeypatch.setattr(output, "to_model", fail)
+    assert not writer.write_description("R1:10del!")
+    first, second = buffer.getvalue().splitlines()
+    assert first == second
+
+    tsv = io.StringIO()
+    assert not output.TsvWriter(tsv, header=False).write_description("R1:10del!")
+    assert tsv.getvalue().split("\t")[-1] == "UnexpectedCharacter\n"
+
+
+def test_error_cache_disabled(monkeypatch):
+    monkeypatch.setattr(output, "ERROR_CACHE", output.ErrorCache(maxsize=0))
+    buffer = io.BytesIO()
+    assert not output.JsonLinesWriter(buffer).write_description("R1:10del!")
+    [error] = json.loads(buffer.getvalue())["errors"]
+    assert error["type"] == "UnexpectedCharacter"
+
+
+@pytest.mark.parametrize(
+    "description, rows",
+    [
+        (
+            "NM_004006.1:c.[145C>T;147del]",
+            [
+                "NM_004006.1 _ c substitution 145 _ 0 145 _ 0 C T 0 _",
+                "NM_004006.1 _ c deletion 147 _ 0 147 _ 0 _ _ 0 _",
+            ],
+        ),
+        (
+            "NG_1(NM_2(X)):c.-10+?_*1-5delinsAT",
+            ["NG_1 NM_2(X) c deletion_insertion -10 +? 0 *1 -5 0 _ AT 0 _"],
+        ),
+        (
+            "NC_000002.12:g.pter_qterdel",
+            ["NC_000002.12 _ g deletion pter _ 0 qter _ 0 _ _ 0 _"],
+        ),
+        (
+            "NM_004006.1:c.(12_13insN[10])",
+            ["NM_004006.1 _ c insertion 12 _ 0 13 _ 0 _ _ 1 _"],
+        ),
+        ("NC_1:g.(10_20)_(30_?)del", ["NC_1 _ g deletion _ _ 1 _ _ 1 _ _ 0 _"]),
+        ("R1:c.=", ["R1 _ c _ _ _ 0 _ _ 0 _ _ 0 _"]),
+        ("R1:c.(=)", ["R1 _ c _ _ _ 0 _ _ 0 _ _ 1 _"]),
+        ("R1:p.(=)", ["R1 _ p _ _ _ 0 _ _ 0 _ _ 1 _"]),
+        ("R1:c.[=]", ["R1 _ c _ _ _ 0 _ _ 0 _ _ 0 _"]),
+        ("R1:10del!", ["_ _ _ _ _ _ _ _ _ _ _ _ _ UnexpectedCharacter"]),
+    ],
+)
+def test_tsv_writer(description, rows):
+    buffer = io.StringIO()
+    writer = output.TsvWriter(buffer, header=False)
+    writer.write_description(description)
+    lines = [line.split("\t") for line in buffer.getvalue().splitlines()]
+    assert [line[0] for line in lines] == [description] * len(rows)
+    assert [" ".join(field or "_" for field in line[1:]) for line in lines] == rows
+
+
+def test_tsv_writer_header():
+    buffer = io.StringIO()
+    output.TsvWriter(buffer)
+    assert buffer.getvalue() == "\t".join(output.TSV_COLUMNS) + "\n"
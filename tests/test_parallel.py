@@ -0,0 +1,103 @@
+"""
+Parallel file conversion tests.
+"""
+
+import io
+import json
+
+import pytest
+
+from mutalyzer_hgvs_parser.output import JsonLinesWriter
+from mutalyzer_hgvs_parser.parallel import (
+    chunk_ranges,
+    convert_file,
+    convert_file_to_shards,
+    json_lines,
+    tsv_lines,
+)
+
+DESCRIPTIONS = [
+    "NM_004006.1:c.[145C>T;147C>G]",
+    "NG_012232.1(NM_004006.1):c.(4071+1_4072-1)_(5154+1_5155-1)del",
+    "NP_003997.1:p.(Val582_Asn583ins(5))",
+    "NM_004006.2:c.10_11insÅ",
+    "R1:10del",
+]
+
+
+@pytest.fixture
+def descriptions_file(tmp_path):
+    file_path = tmp_path / "descriptions.txt"
+    lines = DESCRIPTIONS * 7 + ["", "  R1:20del\r"]
+    file_path.write_bytes("\n".join(lines).encode())
+    return str(file_path)
+
+
+def _expected(file_path):
+    buffer = io.BytesIO()
+    writer = JsonLinesWriter(buffer)
+    with open(file_path, newline="") as descriptions:
+        for line in descriptions:
+            if line.strip():
+                writer.write_description(line.strip())
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 10, 100, 1 << 20])
+def test_chunk_ranges(descriptions_file, chunk_size):
+    with open(descriptions_file, "rb") as input_file:
+        data = input_file.read()
+    ranges = chunk_ranges(descriptions_file, chunk_size)
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[end - 1 : end] == b"\n"
+
+
+def test_chunk_ranges_empty(tmp_path):
+    file_path = tmp_path / "empty.txt"
+    file_path.write_text("")
+    assert chunk_ranges(str(file_path)) == []
+
+
+def test_convert_file(descriptions_file):
+    output = b"".join(convert_file(descriptions_file, processes=2, chunk_size=100))
+    assert output == _expected(descriptions_file)
+    assert len(output.splitlines()) == len(DESCRIPTIONS) * 7 + 1
+    assert "errors" in json.loads(output.splitlines()[3])
+
+
+def test_convert_file_to_shards(descriptions_file, tmp_path):
+    shards = convert_file_to_shards(
+        descriptions_file, str(tmp_path / "shards"), processes=2, chunk_size=300
+    )
+    assert len(shards) > 1
+    assert shards == sorted(shards)
+    output = b""
+    for shard in shards:
+        with open(shard, "rb") as shard_file:
+            output += shard_file.read()
+    assert output == _expected(descriptions_file)
+
+
+@pytest.mark.parametrize("convert", [json_lines, tsv_lines])
+def test_dedup_window(convert):
+    lines = [
+        b"R1:c.100del",
+        b"R1:c.1del!",
+        b" R1:c.100del",
+        b"",
+        b"R1:c.100del",
+        b"R1:c.1del!",
+        b"R1:c.10 0del",
+        b"R1:c.100d el",
+        b"NM_0040 06.1:c.100del",
+    ]
+    expected = io.BytesIO()
+    counts = convert(lines, expected, True)
+    output = io.BytesIO()
+    assert convert(lines, output, True, dedup_window=10) == dict(
+        counts, deduplicated=3
+    )
+    assert output.getvalue() == expected.getvalue()
@@ -0,0 +1,74 @@
+"""
+Precompiled grammar tables tests.
+"""
+
+import pytest
+
+from mutalyzer_hgvs_parser import precompiled
+from mutalyzer_hgvs_parser.exceptions import UnexpectedCharacter, UnexpectedEnd
+from mutalyzer_hgvs_parser.generate import Generator
+from mutalyzer_hgvs_parser.hgvs_parser import HgvsParser
+
+DESCRIPTIONS = [
+    "NG_012232.1(NM_004006.1):c.93+1G>T",
+    "NM_002001.2:c.[(12del);(12del)]",
+    "NC_000002.12:g.pter_8247756delins[NC_000011.10:g.pter_15825272]",
+    "NC_000023.10:g.(32381076_32382698)_(32430031_32456357)[3]",
+    "NM_000492.3:c.1210-33_1210-6GT[11]T[6]",
+    "NP_003997.1:p.(Val582_Asn583ins(5))",
+    "PREF:p.Ile327Argfs*?",
+    "PREF:p.*110Glnext*17",
+    "R1:c.10-5_10-2delinsTCTR2.2:c.10",
+    "REF:1del[AAA;A[3]inv]insGGG[4]inv",
+    "R1 : g.[10 del ; 20 dup]",
+]
+
+
+def test_tables_up_to_date(tmp_path):
+    output_path = str(tmp_path / "grammar_tables.py")
+    precompiled.build(output_path)
+    with open(output_path) as built, open(precompiled.TABLES_PATH) as shipped:
+        assert built.read() == shipped.read()
+
+
+def test_precompiled_used():
+    assert isinstance(HgvsParser()._grammar, precompiled.PrecompiledGrammar)
+    assert isinstance(HgvsParser(use_precompiled=False)._grammar, str)
+
+
+@pytest.mark.parametrize(
+    "description", DESCRIPTIONS + list(Generator(seed=7, check=True).generate_many(50))
+)
+def test_equivalence(description):
+    assert HgvsParser().parse(description) == HgvsParser(
+        use_precompiled=False
+    ).parse(description)
+
+
+@pytest.mark.parametrize(
+    "description, ignore_white_spaces",
+    [
+        ("NM_002001.2:c.12delz", True),
+        ("NP_003997.1:p.Trp24Cys!", True),
+        ("R1:10_", True),
+        ("R1 : g.[10 del ; 20 dup]", False),
+    ],
+)
+def test_equivalence_errors(description, ignore_white_spaces):
+    with pytest.raises((UnexpectedCharacter, UnexpectedEnd)) as tables:
+        HgvsParser(ignore_white_spaces=ignore_white_spaces).parse(description)
+    with pytest.raises((UnexpectedCharacter, UnexpectedEnd)) as compiled:
+        HgvsParser(
+            ignore_white_spaces=ignore_white_spaces, use_precompiled=False
+        ).parse(description)
+    assert str(tables.value) == str(compiled.value)
+
+
+@pytest.mark.parametrize(
+    "description, start_rule",
+    [("10_11insA", "variant"), ("(?_10)_(20_?)", "location"), ("Ala2[10]", "p_variant")],
+)
+def test_equivalence_start_rule(description, start_rule):
+    assert HgvsParser(start_rule=start_rule).parse(description) == HgvsParser(
+        start_rule=start_rule, use_precompiled=False
+    ).parse(description)
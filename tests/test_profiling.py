@@ -0,0 +1,35 @@
+"""
+Tests for the pipeline profiling.
+"""
+
+import pstats
+
+from mutalyzer_hgvs_parser import instrumentation
+from mutalyzer_hgvs_parser.convert import to_model
+from mutalyzer_hgvs_parser.hgvs_parser import HgvsParser
+from mutalyzer_hgvs_parser.profiling import profile
+
+
+def test_profile(tmp_path):
+    output_path = str(tmp_path / "out.prof")
+    with profile(output_path):
+        HgvsParser(start_rule="variant")
+        to_model("NP_003997.1:p.(Trp24Cys)")
+    assert instrumentation.recorder is None
+
+    assert pstats.Stats(output_path).total_tt > 0
+
+    with open(output_path + ".collapsed") as collapsed_file:
+        lines = collapsed_file.read().splitlines()
+    roots = {line.split(";")[0] for line in lines}
+    for label in [
+        "grammar compile",
+        "lark parse",
+        "ProteinTransformer",
+        "AmbigTransformer",
+        "FinalTransformer",
+        "Converter",
+    ]:
+        assert label in roots
+    for line in lines:
+        assert int(line.rsplit(" ", 1)[1]) >= 1
@@ -0,0 +1,70 @@
+"""
+Fields extraction tests.
+"""
+
+import pytest
+
+from mutalyzer_hgvs_parser import extract, to_model
+from mutalyzer_hgvs_parser.exceptions import UnexpectedCharacter
+from mutalyzer_hgvs_parser.projection import FIELDS, PREFIX_FIELDS
+
+from .test_convert import DESCRIPTIONS
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        ["reference"],
+        ["coordinate_system"],
+        ["type", "reference", "coordinate_system"],
+        ["reference", "variants"],
+        FIELDS,
+    ],
+)
+@pytest.mark.parametrize("description", DESCRIPTIONS)
+def test_extract(description, fields):
+    model = to_model(description)
+    assert extract(description, fields) == {
+        field: model[field] for field in fields if field in model
+    }
+
+
+@pytest.mark.parametrize(
+    "description, fields, expected",
+    [
+        (
+            "NG_012337.1(SDHD_v001):c.274G>T",
+            PREFIX_FIELDS,
+            {
+                "type": "description_dna",
+                "reference": {"id": "NG_012337.1", "selector": {"id": "SDHD_v001"}},
+                "coordinate_system": "c",
+            },
+        ),
+        ("NP_003997.1:p.Trp24Cys", ["type"], {"type": "description_protein"}),
+        ("R1:10del", ["reference", "coordinate_system"], {"reference": {"id": "R1"}}),
+        ("R1:10del", ["type"], {"type": "description_dna"}),
+        ("R1(R2(R3)):g.10del", ["reference"], to_model("R1(R2(R3)):g.10del")),
+        ("R1 : g.10del", ["coordinate_system"], {"coordinate_system": "g"}),
+        ("R1: c.10del", PREFIX_FIELDS, to_model("R1: c.10del")),
+        ("R1:c .10del", PREFIX_FIELDS, to_model("R1:c .10del")),
+        ("R1:c. 10del", PREFIX_FIELDS, to_model("R1:c. 10del")),
+    ],
+)
+def test_extract_values(description, fields, expected):
+    output = extract(description, fields)
+    assert output == {field: expected[field] for field in fields if field in expected}
+
+
+def test_extract_prefix_only():
+    # The variants are not checked when only prefix fields are extracted.
+    assert extract("R1:c.10del!") == {"reference": {"id": "R1"}, "coordinate_system": "c"}
+    with pytest.raises(UnexpectedCharacter):
+        extract("R1:c.10del!", ["variants"])
+
+
+def test_extract_errors():
+    with pytest.raises(UnexpectedCharacter):
+        extract("R1;c.10del")
+    with pytest.raises(ValueError):
+        extract("R1:c.10del", ["variant_types"])
@@ -0,0 +1,109 @@
+"""
+Caches warm-up and snapshot tests.
+"""
+
+import json
+import sys
+
+import pytest
+
+from mutalyzer_hgvs_parser import output, warmup
+from mutalyzer_hgvs_parser.convert import to_model
+
+DESCRIPTIONS = [
+    "NM_004006.1:c.[145C>T;147C>G]",
+    "NG_012337.1:g.100_300del",
+    "NP_003997.1:p.Trp24Cys",
+    "R1:10del!",
+]
+
+
+@pytest.fixture
+def caches(monkeypatch):
+    monkeypatch.setattr(output, "JSON_CACHE", output.LRUCache())
+    monkeypatch.setattr(output, "ERROR_CACHE", output.ErrorCache())
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    file_path = tmp_path / "corpus.txt"
+    file_path.write_text("\n".join(DESCRIPTIONS + ["", DESCRIPTIONS[0]]) + "\n")
+    return str(file_path)
+
+
+def test_warm(caches, corpus):
+    assert warmup.warm_file(corpus) == {"models": 4, "errors": 1}
+    assert len(output.JSON_CACHE) == 3
+    assert output.cached_error("R1:10del!")["type"] == "UnexpectedCharacter"
+    assert json.loads(output.to_json(DESCRIPTIONS[0])) == to_model(DESCRIPTIONS[0])
+
+
+def test_snapshot_restore(caches, corpus, tmp_path, monkeypatch):
+    warmup.warm_file(corpus)
+    snapshot_path = str(tmp_path / "snapshot.json")
+    assert warmup.snapshot(snapshot_path) == {"models": 3, "errors": 1}
+    models = output.JSON_CACHE.items()
+    errors = output.ERROR_CACHE.items()
+
+    monkeypatch.setattr(output, "JSON_CACHE", output.LRUCache())
+    monkeypatch.setattr(output, "ERROR_CACHE", output.ErrorCache())
+    assert warmup.restore(snapshot_path) == {"models": 3, "errors": 1}
+    assert output.JSON_CACHE.items() == models
+    assert output.ERROR_CACHE.items() == errors
+
+    def fail(*args):
+        raise AssertionError("Converted again.")
+
+    monkeypatch.setattr(output, "to_model", fail)
+    assert json.loads(output.to_json(DESCRIPTIONS[1])) == to_model(DESCRIPTIONS[1])
+
+
+def test_restore_outdated(caches, corpus, tmp_path):
+    warmup.warm_file(corpus)
+    snapshot_path = tmp_path / "snapshot.json"
+    warmup.snapshot(str(snapshot_path))
+    data = json.loads(snapshot_path.read_text())
+    data["grammar"] = "0" * 64
+    snapshot_path.write_text(json.dumps(data))
+    output.JSON_CACHE.clear()
+    assert warmup.restore(str(snapshot_path)) is None
+    assert len(output.JSON_CACHE) == 0
+
+
+def test_main(caches, corpus, tmp_path, monkeypatch, capsys):
+    snapshot_path = str(tmp_path / "snapshot.json")
+    monkeypatch.setattr(
+        sys, "argv", ["warmup", "-f", corpus, "-o", snapshot_path]
+    )
+    warmup.main()
+    assert "3 models, 1 errors" in capsys.readouterr().out
+    monkeypatch.setattr(output, "JSON_CACHE", output.LRUCache())
+    assert warmup.restore(snapshot_path)["models"] == 3
+
+
+def test_main_restore_start_rule(caches, corpus, tmp_path, monkeypatch, capsys):
+    snapshot_path = str(tmp_path / "snapshot.json")
+    monkeypatch.setattr(sys, "argv", ["warmup", "-f", corpus, "-o", snapshot_path])
+    warmup.main()
+    variants_path = tmp_path / "variants.txt"
+    variants_path.write_text("10del\n")
+    extended_path = str(tmp_path / "extended.json")
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "warmup",
+            "-f",
+            str(variants_path),
+            "-r",
+            "variant",
+            "--restore",
+            snapshot_path,
+            "-o",
+            extended_path,
+        ],
+    )
+    output.JSON_CACHE.clear()
+    output.ERROR_CACHE.clear()
+    warmup.main()
+    assert "4 models, 1 errors" in capsys.readouterr().out